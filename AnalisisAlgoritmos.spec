@@ -36,6 +36,21 @@ a = Analysis(
         'dataset_manager',
         'sorting_analyzer',
         'bar_comparison',
+        'results_journal',
+        'precise_timing',
+        'trial_scheduler',
+        'sweep_planner',
+        'input_distributions',
+        'cancellation',
+        'complexity_fitter',
+        'progress_channel',
+        'string_generator',
+        'input_families',
+        'dataset_generator',
+        'size_sweep',
+        'sandbox_pool',
+        'streaming_stats',
+        'cost_counter',
     ],
     hookspath=[],
     hooksconfig={},
@@ -1,6 +1,66 @@
 # dataset_manager.py
+import gzip
+import lzma
+import os
 import random
-from typing import List, Tuple
+import re
+import numpy as np
+from collections.abc import Sequence
+from typing import List, Tuple, Dict, Any, TextIO
+
+from input_distributions import InputDistributions
+
+
+class SubsetSequence(Sequence):
+    """
+    Secuencia perezosa de subconjuntos
+    
+    Cada subconjunto se genera recién cuando se pide, a partir de la semilla
+    y su índice, por lo que siempre se obtienen los mismos datos sin importar
+    el orden de acceso. Solo se conserva el último generado: recorrerla en
+    orden mantiene en memoria un único conjunto a la vez.
+    """
+    
+    def __init__(self, sizes: List[int], distribution: str, seed: int, params: Dict[str, Any] = None): # type: ignore
+        self.sizes = list(sizes)
+        self.distribution = distribution
+        self.params = params
+        self.seed = seed
+        self._cached_index = None
+        self._cached = None
+    
+    def __len__(self) -> int:
+        return len(self.sizes)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Índice de subconjunto fuera de rango")
+        
+        if index != self._cached_index:
+            # Liberar el anterior antes de generar el siguiente
+            self._cached = None
+            self._cached = self._generate(index)
+            self._cached_index = index
+        return self._cached
+    
+    def _generate(self, index: int) -> List[int]:
+        return InputDistributions.generate(
+            self.distribution, self.sizes[index], self.seed, index, self.params
+        )
+    
+    def manifest(self, index: int) -> Dict[str, Any]:
+        """Semilla, distribución y parámetros del subconjunto indicado"""
+        return InputDistributions.manifest(
+            self.distribution, self.sizes[index], self.seed, index, self.params
+        )
+    
+    def manifests(self) -> List[Dict[str, Any]]:
+        """Manifiesto de todos los subconjuntos (no los genera)"""
+        return [self.manifest(i) for i in range(len(self))]
 
 
 class DatasetManager:
@@ -9,6 +69,24 @@ class DatasetManager:
     MAX_SIZE = 1000000  # Límite máximo de elementos
     PREDEFINED_SIZES = [1000, 5000, 10000, 50000, 100000]
     NUM_SUBSETS = 15
+    MAX_SUBSETS = 60
+    CHUNK_SIZE = 1 << 20  # Caracteres por bloque al leer archivos de texto
+    _TOKEN = re.compile(r'[^\s,]+')
+    _SEPARATORS = ", \t\n\r\f\v"
+    
+    # Formatos de archivo admitidos
+    FILE_EXTENSIONS = ('.txt', '.txt.gz', '.txt.xz', '.npy', '.bin')
+    BINARY_EXTENSIONS = ('.npy', '.bin')
+    BIN_DTYPE = np.dtype('<i8')  # .bin: int64 little-endian sin encabezado
+    
+    MIN_SCHEDULE_SIZE = 10  # Menor tamaño de las escaleras log-uniformes
+    
+    # Esquemas de tamaños de los subconjuntos
+    LINEAR = "lineal"
+    GEOMETRIC = "geométrica (x2)"
+    LOG_UNIFORM = "log-uniforme"
+    CUSTOM = "personalizada"
+    SCHEDULES = [LINEAR, GEOMETRIC, LOG_UNIFORM, CUSTOM]
     
     @staticmethod
     def validate_size(size: int) -> Tuple[bool, str]:
@@ -20,41 +98,87 @@ class DatasetManager:
         return True, ""
     
     @staticmethod
-    def generate_subsets(max_size: int, ordered: bool = False) -> List[List[int]]:
+    def new_seed() -> int:
+        """Genera una semilla aleatoria para reproducir la generación de conjuntos"""
+        return random.randrange(2 ** 32)
+    
+    @staticmethod
+    def generate_subsets(
+        max_size: int,
+        ordered: bool = False,
+        seed: int = None, # type: ignore
+        schedule: str = LINEAR,
+        count: int = NUM_SUBSETS,
+        custom_sizes: List[int] = None, # type: ignore
+        distribution: str = None, # type: ignore
+        params: Dict[str, Any] = None # type: ignore
+    ) -> SubsetSequence:
         """
-        Genera 15 subconjuntos balanceados desde tamaño proporcional hasta max_size
+        Genera subconjuntos con tamaños según el esquema elegido hasta max_size
         
         Args:
             max_size: Tamaño máximo del conjunto
             ordered: Si True, genera conjuntos ordenados, sino desordenados
+                     (solo si no se indica distribution)
+            seed: Semilla del generador; con la misma semilla se obtienen
+                  exactamente los mismos conjuntos
+            schedule: Esquema de tamaños (ver SCHEDULES)
+            count: Número de subconjuntos
+            custom_sizes: Tamaños explícitos para el esquema personalizado
+            distribution: Distribución de los valores (ver InputDistributions)
+            params: Parámetros de la distribución
         
         Returns:
-            Lista de 15 subconjuntos
+            Secuencia perezosa de subconjuntos, de menor a mayor tamaño
         """
-        subsets = []
-        step = max_size // DatasetManager.NUM_SUBSETS
+        return DatasetManager.generate_for_sizes(
+            DatasetManager.get_subset_sizes(max_size, schedule, count, custom_sizes),
+            ordered, seed, distribution, params
+        )
+    
+    @staticmethod
+    def generate_for_sizes(
+        sizes: List[int],
+        ordered: bool = False,
+        seed: int = None, # type: ignore
+        distribution: str = None, # type: ignore
+        params: Dict[str, Any] = None # type: ignore
+    ) -> SubsetSequence:
+        """
+        Prepara un conjunto por cada tamaño indicado, generado bajo demanda
         
-        for i in range(1, DatasetManager.NUM_SUBSETS + 1):
-            size = step * i
-            if i == DatasetManager.NUM_SUBSETS:
-                size = max_size  # Asegurar que el último sea exactamente max_size
-            
-            if ordered:
-                # Generar conjunto ordenado
-                subset = list(range(size))
-            else:
-                # Generar conjunto desordenado
-                subset = list(range(size))
-                random.shuffle(subset)
-            
-            subsets.append(subset)
+        Args:
+            sizes: Tamaños de los conjuntos, en el orden deseado
+            ordered: Si True, genera conjuntos ordenados, sino desordenados
+                     (solo si no se indica distribution)
+            seed: Semilla del generador (si es None se elige una al azar)
+            distribution: Distribución de los valores (ver InputDistributions)
+            params: Parámetros de la distribución
         
-        return subsets
+        Returns:
+            Secuencia perezosa de conjuntos
+        """
+        if seed is None:
+            seed = DatasetManager.new_seed()
+        if distribution is None:
+            distribution = InputDistributions.ORDERED if ordered else InputDistributions.RANDOM
+        return SubsetSequence(sizes, distribution, seed, params)
     
     @staticmethod
     def load_from_file(filepath: str) -> Tuple[List[int], str]:
         """
-        Carga un conjunto de datos desde un archivo .txt
+        Carga un conjunto de datos desde un archivo
+        
+        Formatos admitidos (según la extensión):
+        - .txt: números separados por comas, espacios o saltos de línea
+        - .txt.gz / .txt.xz: el mismo texto comprimido con gzip o xz
+        - .npy: arreglo de enteros de NumPy de una dimensión
+        - .bin: enteros int64 little-endian sin encabezado
+        
+        El texto se lee por bloques, de modo que nunca se tiene en memoria
+        completo, y la lectura se detiene en cuanto se supera MAX_SIZE. Los
+        formatos binarios se mapean en memoria: el tamaño se valida antes de
+        leer un solo dato.
         
         Args:
             filepath: Ruta al archivo
@@ -63,53 +187,236 @@ class DatasetManager:
             Tupla (datos, mensaje_error). Si hay error, datos es None
         """
         try:
-            with open(filepath, 'r') as f:
-                content = f.read().strip()
-            
-            # Parsear números separados por comas
-            numbers = []
-            for item in content.split(','):
-                item = item.strip()
-                if item:
-                    try:
-                        numbers.append(int(item))
-                    except ValueError:
-                        return None, f"Valor inválido encontrado: '{item}'" # type: ignore
-            
-            if not numbers:
-                return None, "El archivo está vacío o no contiene números válidos" # type: ignore
-            
-            # Validar tamaño
-            valid, msg = DatasetManager.validate_size(len(numbers))
-            if not valid:
-                return None, msg # type: ignore
-            
-            return numbers, ""
+            if DatasetManager.is_binary_file(filepath):
+                array, error = DatasetManager.open_array(filepath)
+                if error:
+                    return None, error # type: ignore
+                is_valid, error = DatasetManager.validate_size(len(array))
+                if not is_valid:
+                    return None, error # type: ignore
+                return array.tolist(), ""
             
+            with DatasetManager._open_text(filepath) as f:
+                return DatasetManager.parse_stream(f)
         except FileNotFoundError:
             return None, "Archivo no encontrado" # type: ignore
+        except (OSError, EOFError, lzma.LZMAError) as e:
+            return None, f"Archivo dañado o con formato inválido: {str(e)}" # type: ignore
         except Exception as e:
             return None, f"Error al leer archivo: {str(e)}" # type: ignore
     
     @staticmethod
-    def get_subset_sizes(max_size: int) -> List[int]:
-        """Retorna los tamaños de los subconjuntos que se generarán"""
-        sizes = []
-        step = max_size // DatasetManager.NUM_SUBSETS
+    def _open_text(filepath: str) -> TextIO:
+        """Abre un archivo de texto, descomprimiéndolo al vuelo si es .gz o .xz"""
+        lower = filepath.lower()
+        if lower.endswith('.gz'):
+            return gzip.open(filepath, 'rt') # type: ignore
+        if lower.endswith('.xz'):
+            return lzma.open(filepath, 'rt') # type: ignore
+        return open(filepath, 'r')
+    
+    @staticmethod
+    def is_binary_file(filepath: str) -> bool:
+        """Indica si la extensión corresponde a un formato binario (.npy o .bin)"""
+        return filepath.lower().endswith(DatasetManager.BINARY_EXTENSIONS)
+    
+    @staticmethod
+    def open_array(filepath: str) -> Tuple[np.ndarray, str]:
+        """
+        Abre un archivo .npy o .bin mapeado en memoria, sin leer los datos
+        
+        El sistema operativo trae las páginas a medida que se accede a ellas,
+        por lo que abrir un conjunto de 100M de elementos es inmediato.
         
-        for i in range(1, DatasetManager.NUM_SUBSETS + 1):
-            size = step * i
-            if i == DatasetManager.NUM_SUBSETS:
-                size = max_size
+        Args:
+            filepath: Ruta al archivo .npy o .bin
+        
+        Returns:
+            Tupla (arreglo de solo lectura, mensaje_error). Si hay error,
+            el arreglo es None
+        """
+        try:
+            if filepath.lower().endswith('.npy'):
+                array = np.load(filepath, mmap_mode='r', allow_pickle=False)
+            else:
+                file_size = os.path.getsize(filepath)
+                if file_size % DatasetManager.BIN_DTYPE.itemsize != 0:
+                    return None, "El archivo .bin debe contener enteros de 8 bytes (int64 little-endian)" # type: ignore
+                if file_size == 0:
+                    return np.empty(0, dtype=DatasetManager.BIN_DTYPE), ""
+                array = np.memmap(filepath, dtype=DatasetManager.BIN_DTYPE, mode='r')
+        except FileNotFoundError:
+            return None, "Archivo no encontrado" # type: ignore
+        except Exception as e:
+            return None, f"Error al leer archivo: {str(e)}" # type: ignore
+        
+        if array.ndim != 1:
+            return None, f"Se esperaba un arreglo de una dimensión, no de forma {array.shape}" # type: ignore
+        if not np.issubdtype(array.dtype, np.integer):
+            return None, f"Se esperaban enteros, no datos de tipo {array.dtype}" # type: ignore
+        return array, ""
+    
+    @staticmethod
+    def parse_stream(stream: TextIO, chunk_size: int = CHUNK_SIZE) -> Tuple[List[int], str]:
+        """
+        Interpreta un flujo de texto con enteros separados por comas o espacios
+        
+        Cada bloque se convierte de una vez con NumPy; solo si eso falla se
+        recorre token por token para ubicar el primero inválido (o aceptar
+        enteros que no caben en int64).
+        
+        Args:
+            stream: Archivo de texto abierto
+            chunk_size: Caracteres leídos por bloque
+        
+        Returns:
+            Tupla (datos, mensaje_error). Si hay error, datos es None
+        """
+        parts = []
+        count = 0
+        carry = ""
+        line = 1      # Línea y columna (desde 1) del inicio del bloque actual
+        column = 1
+        
+        while True:
+            chunk = stream.read(chunk_size)
+            at_end = not chunk
+            text = carry + chunk
+            
+            # Un token puede quedar cortado al final del bloque: se completa con el siguiente
+            if at_end:
+                carry = ""
+            else:
+                cut = max(text.rfind(sep) for sep in DatasetManager._SEPARATORS) + 1
+                carry = text[cut:]
+                text = text[:cut]
+            
+            tokens = text.replace(',', ' ').split()
+            if tokens:
+                try:
+                    values = np.array(tokens, dtype=np.int64).tolist()
+                except (ValueError, OverflowError):
+                    values, error = DatasetManager._parse_tokens_slow(text, line, column)
+                    if values is None:
+                        return None, error # type: ignore
+                
+                count += len(values)
+                valid, msg = DatasetManager.validate_size(count)
+                if not valid:
+                    return None, msg # type: ignore
+                parts.append(values)
+            
+            newlines = text.count('\n')
+            if newlines:
+                line += newlines
+                column = len(text) - text.rfind('\n')
+            else:
+                column += len(text)
+            
+            if at_end:
+                break
+        
+        if count == 0:
+            return None, "El archivo está vacío o no contiene números válidos" # type: ignore
+        
+        numbers = parts[0] if len(parts) == 1 else [n for part in parts for n in part]
+        return numbers, ""
+    
+    @staticmethod
+    def _parse_tokens_slow(text: str, line: int, column: int) -> Tuple[List[int], str]:
+        """Convierte token por token; informa línea y columna del primero inválido"""
+        values = []
+        for match in DatasetManager._TOKEN.finditer(text):
+            try:
+                values.append(int(match.group()))
+            except ValueError:
+                offset = match.start()
+                previous_newline = text.rfind('\n', 0, offset)
+                if previous_newline == -1:
+                    bad_line, bad_column = line, column + offset
+                else:
+                    bad_line = line + text.count('\n', 0, offset)
+                    bad_column = offset - previous_newline
+                return None, ( # type: ignore
+                    f"Valor inválido encontrado: '{match.group()}' "
+                    f"(línea {bad_line}, columna {bad_column})"
+                )
+        return values, ""
+    
+    @staticmethod
+    def get_subset_sizes(
+        max_size: int,
+        schedule: str = LINEAR,
+        count: int = NUM_SUBSETS,
+        custom_sizes: List[int] = None, # type: ignore
+        min_size: int = MIN_SCHEDULE_SIZE
+    ) -> List[int]:
+        """
+        Retorna los tamaños de los subconjuntos que se generarán
+        
+        - lineal: count pasos iguales (concentra el tiempo en los tamaños grandes)
+        - geométrica: duplica el tamaño en cada paso terminando en max_size
+        - log-uniforme: count tamaños equiespaciados en escala logarítmica
+          entre min_size y max_size (buena resolución en n pequeño)
+        - personalizada: los tamaños indicados en custom_sizes
+        
+        Los tamaños repetidos (escaleras más largas que el rango) se eliminan,
+        por lo que pueden resultar menos de count subconjuntos (ninguno si
+        count < 1).
+        """
+        if schedule == DatasetManager.CUSTOM:
+            return sorted(set(custom_sizes or []))
+        if count < 1:
+            return []
+        
+        if schedule == DatasetManager.GEOMETRIC:
+            sizes = [max_size >> (count - 1 - i) for i in range(count)]
+        elif schedule == DatasetManager.LOG_UNIFORM:
+            low = min(min_size, max_size)
+            if count < 2 or low == max_size:
+                sizes = [max_size]
+            else:
+                ratio = (max_size / low) ** (1 / (count - 1))
+                sizes = [int(round(low * ratio ** i)) for i in range(count - 1)] + [max_size]
+        elif schedule == DatasetManager.LINEAR:
+            step = max_size // count
+            sizes = [step * i for i in range(1, count)] + [max_size]  # El último es exactamente max_size
+        else:
+            raise ValueError(f"Esquema de tamaños no soportado: {schedule}")
+        
+        return sorted(set(size for size in sizes if size > 0))
+    
+    @staticmethod
+    def parse_custom_sizes(text: str) -> Tuple[List[int], str]:
+        """
+        Interpreta una lista de tamaños separados por comas o espacios
+        
+        Returns:
+            Tupla (tamaños_ordenados, mensaje_error). Si hay error, tamaños es None
+        """
+        sizes = []
+        for item in text.replace(',', ' ').split():
+            try:
+                size = int(item)
+            except ValueError:
+                return None, f"Tamaño inválido: '{item}'" # type: ignore
+            valid, msg = DatasetManager.validate_size(size)
+            if not valid:
+                return None, msg # type: ignore
             sizes.append(size)
         
-        return sizes
+        sizes = sorted(set(sizes))
+        if not sizes:
+            return None, "Debe indicar al menos un tamaño" # type: ignore
+        if len(sizes) > DatasetManager.MAX_SUBSETS:
+            return None, f"Se permiten como máximo {DatasetManager.MAX_SUBSETS} tamaños" # type: ignore
+        return sizes, ""
     
     @staticmethod
     def validate_file_path(filepath: str) -> Tuple[bool, str]:
-        """Valida que el archivo tenga la extensión correcta"""
+        """Valida que el archivo tenga una de las extensiones admitidas"""
         if not filepath:
             return False, "Debe seleccionar un archivo"
-        if not filepath.endswith('.txt'):
-            return False, "Solo se permiten archivos .txt"
+        if not filepath.lower().endswith(DatasetManager.FILE_EXTENSIONS):
+            return False, "Solo se permiten archivos " + ", ".join(DatasetManager.FILE_EXTENSIONS)
         return True, ""
\ No newline at end of file
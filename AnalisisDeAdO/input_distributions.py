@@ -0,0 +1,145 @@
+# input_distributions.py
+import numpy as np
+from typing import List, Dict, Any
+
+
+class InputDistributions:
+    """
+    Distribuciones de entrada generadas con numpy.random.Generator
+
+    Cada distribución ejercita un caso distinto: las casi ordenadas favorecen
+    a Insertion Sort, las de pocos valores únicos a Counting Sort, las de
+    rango amplio agotan el rango admitido por Counting Sort y alargan Radix
+    Sort, y las ordenadas o invertidas llevan a Quick Sort a su peor caso.
+    """
+
+    RANDOM = "aleatorio"
+    ORDERED = "ordenado"
+    REVERSED = "invertido"
+    NEARLY_SORTED = "casi ordenado"
+    FEW_UNIQUE = "pocos únicos"
+    SAWTOOTH = "diente de sierra"
+    ORGAN_PIPE = "tubo de órgano"
+    GAUSSIAN = "gaussiano"
+    ZIPF = "zipf"
+    WIDE_RANGE = "rango amplio"
+
+    DISTRIBUTIONS = [
+        RANDOM, ORDERED, REVERSED, NEARLY_SORTED, FEW_UNIQUE,
+        SAWTOOTH, ORGAN_PIPE, GAUSSIAN, ZIPF, WIDE_RANGE
+    ]
+
+    # Parámetros por defecto de cada distribución (se guardan en el manifiesto)
+    DEFAULT_PARAMS = {
+        NEARLY_SORTED: {'swap_fraction': 0.01},
+        FEW_UNIQUE: {'unique': 10},
+        SAWTOOTH: {'teeth': 10},
+        GAUSSIAN: {'sigma_fraction': 1 / 6},
+        ZIPF: {'a': 1.5},
+        WIDE_RANGE: {'low': -2 ** 31, 'high': 2 ** 31},
+    }
+
+    GENERATOR = "numpy.PCG64"
+
+    @staticmethod
+    def params_for(distribution: str, params: Dict[str, Any] = None) -> Dict[str, Any]: # type: ignore
+        """Parámetros efectivos: los indicados completados con los valores por defecto"""
+        return {**InputDistributions.DEFAULT_PARAMS.get(distribution, {}), **(params or {})}
+
+    @staticmethod
+    def rng_for(seed: int, index: int) -> np.random.Generator:
+        """Generador independiente y reproducible para el conjunto (semilla, índice)"""
+        return np.random.default_rng([seed, index])
+
+    @staticmethod
+    def generate_array(
+        distribution: str,
+        size: int,
+        rng: np.random.Generator,
+        params: Dict[str, Any] = None # type: ignore
+    ) -> np.ndarray:
+        """
+        Genera un arreglo int64 con la distribución pedida
+
+        Args:
+            distribution: Una de DISTRIBUTIONS
+            size: Cantidad de elementos
+            rng: Generador de NumPy
+            params: Parámetros propios de la distribución
+
+        Returns:
+            Arreglo de NumPy con dtype int64
+        """
+        p = InputDistributions.params_for(distribution, params)
+
+        if distribution == InputDistributions.RANDOM:
+            return rng.permutation(size).astype(np.int64)
+
+        if distribution == InputDistributions.ORDERED:
+            return np.arange(size, dtype=np.int64)
+
+        if distribution == InputDistributions.REVERSED:
+            return np.arange(size - 1, -1, -1, dtype=np.int64)
+
+        if distribution == InputDistributions.NEARLY_SORTED:
+            data = np.arange(size, dtype=np.int64)
+            swaps = p.get('swaps', int(size * p['swap_fraction']))
+            if size > 1 and swaps > 0:
+                left = rng.integers(0, size, swaps)
+                right = rng.integers(0, size, swaps)
+                # Intercambios secuenciales: un índice puede repetirse
+                for i, j in zip(left.tolist(), right.tolist()):
+                    data[i], data[j] = data[j], data[i]
+            return data
+
+        if distribution == InputDistributions.FEW_UNIQUE:
+            return rng.integers(0, p['unique'], size, dtype=np.int64)
+
+        if distribution == InputDistributions.SAWTOOTH:
+            period = max(1, -(-size // p['teeth']))
+            return np.arange(size, dtype=np.int64) % period
+
+        if distribution == InputDistributions.ORGAN_PIPE:
+            half = (size + 1) // 2
+            return np.concatenate([
+                np.arange(half, dtype=np.int64),
+                np.arange(size - half - 1, -1, -1, dtype=np.int64)
+            ])
+
+        if distribution == InputDistributions.GAUSSIAN:
+            sigma = max(size * p['sigma_fraction'], 1.0)
+            return np.rint(rng.normal(0.0, sigma, size)).astype(np.int64)
+
+        if distribution == InputDistributions.ZIPF:
+            # Cola recortada en size para que los valores quepan en int64
+            return np.minimum(rng.zipf(p['a'], size), max(size, 1)).astype(np.int64)
+
+        if distribution == InputDistributions.WIDE_RANGE:
+            return rng.integers(p['low'], p['high'], size, dtype=np.int64)
+
+        raise ValueError(f"Distribución no soportada: {distribution}")
+
+    @staticmethod
+    def generate(
+        distribution: str,
+        size: int,
+        seed: int,
+        index: int = 0,
+        params: Dict[str, Any] = None # type: ignore
+    ) -> List[int]:
+        """Genera el conjunto (semilla, índice) como lista de enteros de Python"""
+        rng = InputDistributions.rng_for(seed, index)
+        return InputDistributions.generate_array(distribution, size, rng, params).tolist()
+
+    @staticmethod
+    def manifest(distribution: str, size: int, seed: int, index: int,
+                 params: Dict[str, Any] = None) -> Dict[str, Any]: # type: ignore
+        """Descripción suficiente para regenerar exactamente el conjunto"""
+        return {
+            'index': index,
+            'size': size,
+            'distribution': distribution,
+            'params': InputDistributions.params_for(distribution, params),
+            'seed': seed,
+            'generator': InputDistributions.GENERATOR
+        }
@@ -0,0 +1,236 @@
+# precise_timing.py
+import gc
+import os
+import time
+import multiprocessing
+from typing import List, Dict, Any
+
+from sorting_algorithms import SortingAlgorithms
+
+
+# Calibración del proceso trabajador (se calcula una vez al iniciarlo)
+_worker_calibration: Dict[str, Any] = {}
+
+
+def _empty_call(arg):
+    """Llamada vacía usada para medir el costo fijo de una medición"""
+    return arg
+
+
+class TimerCalibration:
+    """Mide la resolución de los relojes y el costo fijo de una medición vacía"""
+
+    SAMPLES = 5000
+    RESOLUTION_SAMPLES = 20  # Cada muestra espera un tic completo del reloj
+
+    @staticmethod
+    def _resolution(clock) -> float:
+        """Menor incremento positivo observable entre dos lecturas consecutivas"""
+        best = float('inf')
+        for _ in range(TimerCalibration.RESOLUTION_SAMPLES):
+            t0 = clock()
+            t1 = clock()
+            while t1 == t0:
+                t1 = clock()
+            best = min(best, t1 - t0)
+        return best
+
+    @staticmethod
+    def _overhead(clock) -> float:
+        """Mediana del tiempo de medir una llamada vacía con el reloj dado"""
+        samples = []
+        for _ in range(TimerCalibration.SAMPLES):
+            t0 = clock()
+            _empty_call(None)
+            t1 = clock()
+            samples.append(t1 - t0)
+        samples.sort()
+        return samples[len(samples) // 2]
+
+    @staticmethod
+    def calibrate() -> Dict[str, float]:
+        """
+        Calibra los relojes de pared y de CPU
+
+        Returns:
+            Diccionario con resolución y sobrecosto de cada reloj (segundos)
+        """
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return {
+                'wall_resolution': TimerCalibration._resolution(time.perf_counter),
+                'wall_overhead': TimerCalibration._overhead(time.perf_counter),
+                'cpu_resolution': TimerCalibration._resolution(time.thread_time),
+                'cpu_overhead': TimerCalibration._overhead(time.thread_time)
+            }
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+
+def _init_worker(cpu: int):
+    """Inicializa el proceso trabajador: fija la CPU y calibra los relojes"""
+    pinned = None
+    if cpu is not None and hasattr(os, 'sched_setaffinity'):
+        try:
+            os.sched_setaffinity(0, {cpu})
+            pinned = cpu
+        except OSError:
+            pinned = None
+
+    _worker_calibration.clear()
+    _worker_calibration.update(TimerCalibration.calibrate())
+    _worker_calibration['pinned_cpu'] = pinned
+
+
+def _measure_in_worker(algorithm_name: str, dataset: List[int], trials: int) -> Dict[str, Any]:
+    """
+    Mide un algoritmo dentro del proceso trabajador
+
+    El recolector de basura queda deshabilitado durante cada repetición y se
+    ejecuta entre repeticiones. A cada tiempo se le resta el costo fijo de
+    la medición calibrado al iniciar el trabajador.
+    """
+    algo_func = SortingAlgorithms.get_sorting_function(algorithm_name)
+    wall_overhead = _worker_calibration.get('wall_overhead', 0.0)
+    cpu_overhead = _worker_calibration.get('cpu_overhead', 0.0)
+
+    wall_times = []
+    cpu_times = []
+    gc_was_enabled = gc.isenabled()
+    try:
+        for trial in range(trials):
+            gc.collect()
+            gc.disable()
+            wall_start = time.perf_counter()
+            cpu_start = time.thread_time()
+            result = algo_func(dataset)
+            cpu_end = time.thread_time()
+            wall_end = time.perf_counter()
+            gc.enable()
+
+            wall_times.append(max(0.0, wall_end - wall_start - wall_overhead))
+            cpu_times.append(max(0.0, cpu_end - cpu_start - cpu_overhead))
+
+            # Verificar el resultado solo una vez
+            if trial == 0:
+                for i in range(len(result) - 1):
+                    if result[i] > result[i + 1]:
+                        return {'success': False, 'error': "El algoritmo no ordenó correctamente"}
+            del result
+    except RecursionError:
+        return {'success': False, 'error': "Error: Límite de recursión excedido"}
+    except MemoryError:
+        return {'success': False, 'error': "Error: Memoria insuficiente"}
+    except ValueError as e:
+        return {'success': False, 'error': f"Error: {str(e)}"}
+    except Exception as e:
+        return {'success': False, 'error': f"Error inesperado: {str(e)}"}
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return {
+        'success': True,
+        'error': "",
+        'time': min(wall_times),
+        'cpu_time': min(cpu_times),
+        'wall_times': wall_times,
+        'cpu_times': cpu_times,
+        'calibration': dict(_worker_calibration)
+    }
+
+
+class PreciseRunner:
+    """
+    Ejecuta cada medición en un proceso aislado fijado a una CPU
+
+    Así la medición no compite con el hilo de la interfaz ni con el GIL del
+    proceso de Tk. Se usa como administrador de contexto:
+
+        with PreciseRunner() as runner:
+            runner.measure('Merge Sort', datos)
+    """
+
+    DEFAULT_TRIALS = 3
+    # Cuando las repeticiones las maneja el planificador de celdas (trials de
+    # SortingAnalyzer.iter_analysis), cada medición ejecuta una sola vez
+    SCHEDULED_TRIALS = 1
+    POLL_INTERVAL = 0.1  # Segundos entre revisiones de cancelación
+
+    def __init__(self, trials: int = DEFAULT_TRIALS, timeout: float = 300.0):
+        self.trials = trials
+        self.timeout = timeout
+        self.cpu = PreciseRunner._choose_cpu()
+        self.calibration = None
+        self._context = multiprocessing.get_context('spawn')
+        self._pool = None
+
+    @staticmethod
+    def _choose_cpu():
+        """Elige la última CPU disponible (la primera suele atender la interfaz)"""
+        if not hasattr(os, 'sched_getaffinity'):
+            return None
+        cpus = sorted(os.sched_getaffinity(0))
+        return cpus[-1] if cpus else None
+
+    def _start_pool(self):
+        self._pool = self._context.Pool(
+            processes=1,
+            initializer=_init_worker,
+            initargs=(self.cpu,)
+        )
+
+    def _restart_pool(self):
+        self._pool.terminate() # type: ignore
+        self._pool.join() # type: ignore
+        self._start_pool()
+
+    def __enter__(self) -> 'PreciseRunner':
+        self._start_pool()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+    def close(self):
+        """Termina el proceso trabajador"""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def measure(self, algorithm_name: str, dataset: List[int], cancel_token=None) -> Dict[str, Any]:
+        """
+        Mide un algoritmo en el proceso trabajador
+
+        Args:
+            algorithm_name: Nombre del algoritmo
+            dataset: Datos a ordenar
+            cancel_token: Token de cancelación; si se cancela, el trabajador
+                          se termina de inmediato
+
+        Returns:
+            Diccionario con 'time' y 'cpu_time' (mínimos de las repeticiones),
+            o None si se canceló
+        """
+        async_result = self._pool.apply_async( # type: ignore
+            _measure_in_worker,
+            (algorithm_name, dataset, self.trials)
+        )
+
+        deadline = time.monotonic() + self.timeout * self.trials
+        while not async_result.ready():
+            if cancel_token is not None and cancel_token.is_cancelled:
+                self.close()
+                return None # type: ignore
+            if time.monotonic() > deadline:
+                self._restart_pool()
+                return {'success': False, 'error': "Tiempo de ejecución excedido"}
+            async_result.wait(PreciseRunner.POLL_INTERVAL)
+
+        result = async_result.get()
+        if result.get('calibration'):
+            self.calibration = result.pop('calibration')
+        return result
@@ -0,0 +1,107 @@
+# results_journal.py
+import os
+import json
+import time
+from typing import List, Dict, Any, Tuple
+
+
+class ResultsJournal:
+    """Guarda en disco, registro a registro, los resultados parciales de un análisis"""
+
+    JOURNAL_DIR = "checkpoints"
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+
+    def write_header(self, config: Dict[str, Any], seed: int):
+        """Registra la configuración de la corrida y la semilla de generación de datos"""
+        self.append({
+            'type': 'run',
+            'config': config,
+            'seed': seed,
+            'created': time.strftime('%Y-%m-%d %H:%M:%S')
+        })
+
+    @staticmethod
+    def create(prefix: str = "sorting") -> 'ResultsJournal':
+        """Crea un diario nuevo con nombre único dentro de JOURNAL_DIR"""
+        if not os.path.exists(ResultsJournal.JOURNAL_DIR):
+            os.makedirs(ResultsJournal.JOURNAL_DIR)
+        filename = f"{prefix}_{time.strftime('%Y%m%d_%H%M%S')}_{os.getpid()}.jsonl"
+        return ResultsJournal(os.path.join(ResultsJournal.JOURNAL_DIR, filename))
+
+    @staticmethod
+    def reopen(filepath: str) -> 'ResultsJournal':
+        """
+        Abre un diario existente para seguir agregando registros
+
+        Si la última escritura quedó a medias, se cierra esa línea para que
+        el siguiente registro comience en una línea propia.
+        """
+        with open(filepath, 'rb+') as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+        return ResultsJournal(filepath)
+
+    def append(self, record: Dict[str, Any]):
+        """
+        Agrega un registro al final del diario (una línea JSON por registro)
+
+        El archivo se abre en modo append y se fuerza a disco en cada escritura,
+        de modo que un cierre inesperado solo puede perder el registro en curso.
+        """
+        with open(self.filepath, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def contains(self, record_type: str) -> bool:
+        """Indica si el diario ya tiene algún registro del tipo dado"""
+        return any(r.get('type') == record_type for r in ResultsJournal.read(self.filepath))
+
+    @staticmethod
+    def read(filepath: str) -> List[Dict[str, Any]]:
+        """
+        Lee todos los registros válidos de un diario
+
+        Las líneas truncadas por una escritura interrumpida se ignoran.
+        """
+        records = []
+        with open(filepath, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        return records
+
+    @staticmethod
+    def load_run(filepath: str) -> Tuple[Dict[str, Any], List[Dict[str, Any]], str]:
+        """
+        Carga una corrida previa para reanudarla
+
+        Args:
+            filepath: Ruta al diario
+
+        Returns:
+            Tupla (registro_de_corrida, eventos_de_celda, mensaje_error).
+            Si hay error, registro_de_corrida es None
+        """
+        try:
+            records = ResultsJournal.read(filepath)
+        except FileNotFoundError:
+            return None, [], "Archivo de diario no encontrado" # type: ignore
+        except Exception as e:
+            return None, [], f"Error al leer el diario: {str(e)}" # type: ignore
+
+        if not records or records[0].get('type') != 'run':
+            return None, [], "El archivo no contiene una corrida reanudable" # type: ignore
+
+        cells = [r for r in records if r.get('type') == 'cell']
+        return records[0], cells, ""
@@ -1,7 +1,18 @@
 # sorting_analyzer.py
+import bisect
+import contextlib
+import os
+import sys
 import time
-from typing import List, Dict, Tuple, Callable
+from typing import List, Dict, Tuple, Callable, Iterator, Any, Set, Sequence
 from sorting_algorithms import SortingAlgorithms
+from precise_timing import PreciseRunner
+from trial_scheduler import TrialScheduler, DriftMonitor
+
+# Importar utilidades compartidas desde la raíz
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+from cancellation import CancellationToken, AnalysisCancelled
+from complexity_fitter import ComplexityFitter
 
 
 class SortingAnalyzer:
@@ -24,31 +35,54 @@ class SortingAnalyzer:
         Returns:
             Tupla (tiempo, éxito, mensaje_error)
         """
+        execution_time, _, success, error_msg = SortingAnalyzer.measure_sorting_cost(
+            algorithm_func, dataset, timeout
+        )
+        return execution_time, success, error_msg
+    
+    @staticmethod
+    def measure_sorting_cost(
+        algorithm_func: Callable,
+        dataset: List[int],
+        timeout: float = 300.0
+    ) -> Tuple[float, float, bool, str]:
+        """
+        Mide el tiempo de pared y el tiempo de CPU de un algoritmo
+        
+        La diferencia entre ambos muestra cuánto tiempo el hilo esperó por la
+        CPU o por el GIL (por ejemplo, mientras la interfaz se redibuja).
+        
+        Returns:
+            Tupla (tiempo, tiempo_cpu, éxito, mensaje_error)
+        """
         try:
             start_time = time.perf_counter()
+            cpu_start = time.thread_time()
             result = algorithm_func(dataset)
+            cpu_end = time.thread_time()
             end_time = time.perf_counter()
             
             execution_time = end_time - start_time
+            cpu_time = cpu_end - cpu_start
             
             # Verificar timeout
             if execution_time > timeout:
-                return execution_time, False, "Tiempo de ejecución excedido"
+                return execution_time, cpu_time, False, "Tiempo de ejecución excedido"
             
             # Verificar que el resultado esté ordenado
             if not SortingAnalyzer.is_sorted(result):
-                return execution_time, False, "El algoritmo no ordenó correctamente"
+                return execution_time, cpu_time, False, "El algoritmo no ordenó correctamente"
             
-            return execution_time, True, ""
+            return execution_time, cpu_time, True, ""
             
         except RecursionError:
-            return 0.0, False, "Error: Límite de recursión excedido"
+            return 0.0, 0.0, False, "Error: Límite de recursión excedido"
         except MemoryError:
-            return 0.0, False, "Error: Memoria insuficiente"
+            return 0.0, 0.0, False, "Error: Memoria insuficiente"
         except ValueError as e:
-            return 0.0, False, f"Error: {str(e)}"
+            return 0.0, 0.0, False, f"Error: {str(e)}"
         except Exception as e:
-            return 0.0, False, f"Error inesperado: {str(e)}"
+            return 0.0, 0.0, False, f"Error inesperado: {str(e)}"
     
     @staticmethod
     def is_sorted(arr: List[int]) -> bool:
@@ -59,72 +93,240 @@ class SortingAnalyzer:
         return True
     
     @staticmethod
-    def analyze_multiple_algorithms(
+    def iter_analysis(
         algorithm_names: List[str],
-        datasets: List[List[int]],
-        progress_callback: Callable = None # type: ignore
-    ) -> Dict[str, Dict]:
+        datasets: Sequence[List[int]],
+        progress_callback: Callable = None, # type: ignore
+        skip_cells: Set[Tuple[str, int]] = None, # type: ignore
+        cancel_token: CancellationToken = None, # type: ignore
+        precise_runner: PreciseRunner = None, # type: ignore
+        trials: int = 1,
+        strategy: str = TrialScheduler.SEQUENTIAL,
+        seed: int = None, # type: ignore
+        drift_monitor: DriftMonitor = None # type: ignore
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Analiza múltiples algoritmos sobre múltiples datasets
+        Analiza múltiples algoritmos produciendo un evento por cada celda
+        (algoritmo, conjunto) en cuanto termina su medición
         
         Args:
             algorithm_names: Lista de nombres de algoritmos
-            datasets: Lista de datasets a probar
+            datasets: Secuencia de datasets a probar (puede generarse bajo demanda)
             progress_callback: Función callback para reportar progreso
+            skip_cells: Celdas (algoritmo, índice) ya completadas que no se miden
+            cancel_token: Token para pausar o cancelar entre celdas
+            precise_runner: Si se indica, cada celda se mide en su proceso aislado
+                            (conviene con SCHEDULED_TRIALS: las repeticiones son trials)
+            trials: Repeticiones por celda; se reporta el tiempo mínimo
+            strategy: Orden de medición (ver TrialScheduler.STRATEGIES)
+            seed: Semilla del orden de medición
+            drift_monitor: Monitor que vuelve a medir una celda de referencia
         
-        Returns:
-            Diccionario con resultados por algoritmo
+        Yields:
+            Diccionario con el resultado de la celda
         """
-        results = {}
-        total_tests = len(algorithm_names) * len(datasets)
-        current_test = 0
+        skip_cells = skip_cells or set()
+        schedule = [
+            cell for cell in TrialScheduler.build_schedule(
+                algorithm_names, len(datasets), trials, strategy, seed
+            )
+            if (cell[0], cell[1]) not in skip_cells
+        ]
+        total_tests = len(schedule)
         
-        for algo_name in algorithm_names:
-            algo_func = SortingAlgorithms.get_sorting_function(algo_name) # type: ignore
-            algo_info = SortingAlgorithms.get_algorithm_info()[algo_name] # type: ignore
+        failed = {}  # Algoritmo -> menor tamaño en que falló
+        cell_trials = {}
+        
+        for current_test, (algo_name, i, trial) in enumerate(schedule, start=1):
+            # Si hay error, se omiten los tamaños del algoritmo iguales o mayores
+            if algo_name in failed and SortingAnalyzer._size_at(datasets, i) >= failed[algo_name]:
+                continue
             
-            times = []
-            sizes = []
-            errors = []
+            if cancel_token and not cancel_token.checkpoint():
+                return
             
-            for i, dataset in enumerate(datasets):
-                current_test += 1
-                
-                if progress_callback:
-                    progress = (current_test / total_tests) * 100
-                    progress_callback(progress, algo_name, len(dataset))
-                
-                exec_time, success, error_msg = SortingAnalyzer.measure_sorting_time(
-                    algo_func, dataset
-                )
-                
-                if success:
-                    times.append(exec_time)
-                    sizes.append(len(dataset))
-                else:
-                    errors.append({
-                        'dataset_index': i,
-                        'size': len(dataset),
-                        'error': error_msg
-                    })
-                    # Si hay error, continuar con el siguiente algoritmo
-                    break
+            if drift_monitor is not None:
+                drift_monitor.maybe_sample(current_test - 1, precise_runner)
             
+            dataset = datasets[i]
+            
+            if progress_callback:
+                progress = (current_test / total_tests) * 100
+                progress_callback(progress, algo_name, len(dataset))
+            
+            if precise_runner is not None:
+                measured = precise_runner.measure(algo_name, dataset, cancel_token)
+            else:
+                algo_func = SortingAlgorithms.get_sorting_function(algo_name) # type: ignore
+                measured = SortingAnalyzer._measure_cancellable(algo_func, dataset, cancel_token)
+            if measured is None:
+                return
+            
+            if not measured['success']:
+                failed[algo_name] = min(failed.get(algo_name, len(dataset)), len(dataset))
+                yield {
+                    'algorithm': algo_name,
+                    'dataset_index': i,
+                    'size': len(dataset),
+                    'time': 0.0,
+                    'cpu_time': 0.0,
+                    'success': False,
+                    'error': measured['error']
+                }
+                continue
+            
+            # La celda se reporta cuando todas sus repeticiones terminaron
+            measurements = cell_trials.setdefault((algo_name, i), [])
+            measurements.append(measured)
+            if len(measurements) < trials:
+                continue
+            del cell_trials[(algo_name, i)]
+            
+            yield {
+                'algorithm': algo_name,
+                'dataset_index': i,
+                'size': len(dataset),
+                'time': min(m['time'] for m in measurements),
+                'cpu_time': min(m['cpu_time'] for m in measurements),
+                'success': True,
+                'error': ""
+            }
+    
+    @staticmethod
+    def _size_at(datasets: Sequence[List[int]], index: int) -> int:
+        """Tamaño de un conjunto sin generarlo, si la secuencia conoce sus tamaños"""
+        sizes = getattr(datasets, 'sizes', None)
+        return sizes[index] if sizes is not None else len(datasets[index])
+    
+    @staticmethod
+    def _measure_cancellable(
+        algorithm_func: Callable,
+        dataset: List[int],
+        cancel_token: CancellationToken = None # type: ignore
+    ) -> Dict[str, Any]:
+        """Mide una celda permitiendo que una cancelación la interrumpa. Retorna None si se canceló"""
+        try:
+            if cancel_token is None:
+                measured = SortingAnalyzer.measure_sorting_cost(algorithm_func, dataset)
+            else:
+                with cancel_token.interruptible():
+                    measured = SortingAnalyzer.measure_sorting_cost(algorithm_func, dataset)
+        except AnalysisCancelled:
+            return None # type: ignore
+        
+        exec_time, cpu_time, success, error_msg = measured
+        return {'time': exec_time, 'cpu_time': cpu_time, 'success': success, 'error': error_msg}
+    
+    @staticmethod
+    def completed_cells(events: List[Dict[str, Any]], sizes: Dict[str, List[int]]) -> Set[Tuple[str, int]]:
+        """
+        Determina las celdas que ya no deben medirse a partir de eventos previos
+        
+        Cuando un algoritmo falló en un conjunto, sus conjuntos de ese tamaño o
+        mayores se dan por terminados, igual que en un análisis sin
+        interrupciones; los más chicos que falten se siguen midiendo.
+        
+        Args:
+            events: Eventos de celda ya registrados
+            sizes: Tamaños de los conjuntos de cada algoritmo, por índice
+        """
+        done = set()
+        for event in events:
+            algo_name = event['algorithm']
+            done.add((algo_name, event['dataset_index']))
+            if not event['success']:
+                done.update(
+                    (algo_name, i) for i, size in enumerate(sizes.get(algo_name, []))
+                    if size >= event['size']
+                )
+        return done
+    
+    @staticmethod
+    def apply_event(results: Dict[str, Dict], event: Dict[str, Any]):
+        """
+        Incorpora un evento de celda al diccionario de resultados por algoritmo
+        
+        Args:
+            results: Diccionario de resultados (se modifica en sitio)
+            event: Evento producido por iter_analysis
+        """
+        algo_name = event['algorithm']
+        if algo_name not in results:
             results[algo_name] = {
-                'times': times,
-                'sizes': sizes,
-                'errors': errors,
-                'complexity': algo_info,
-                'success': len(errors) == 0
+                'times': [],
+                'cpu_times': [],
+                'sizes': [],
+                'dataset_indices': [],
+                'errors': [],
+                'complexity': SortingAlgorithms.get_algorithm_info()[algo_name], # type: ignore
+                'success': True
             }
         
+        data = results[algo_name]
+        if event['success']:
+            # Con órdenes intercalados las celdas llegan desordenadas;
+            # se insertan en orden de tamaño para conservar la forma habitual
+            position = bisect.bisect_right(data['sizes'], event['size'])
+            data['times'].insert(position, event['time'])
+            data['cpu_times'].insert(position, event.get('cpu_time', 0.0))
+            data['sizes'].insert(position, event['size'])
+            data['dataset_indices'].insert(position, event['dataset_index'])
+        else:
+            data['errors'].append({
+                'dataset_index': event['dataset_index'],
+                'size': event['size'],
+                'error': event['error']
+            })
+        data['success'] = len(data['errors']) == 0
+    
+    @staticmethod
+    def analyze_multiple_algorithms(
+        algorithm_names: List[str],
+        datasets: Sequence[List[int]],
+        progress_callback: Callable = None, # type: ignore
+        cancel_token: CancellationToken = None, # type: ignore
+        precise: bool = False,
+        trials: int = 1,
+        strategy: str = TrialScheduler.SEQUENTIAL,
+        seed: int = None, # type: ignore
+        drift_monitor: DriftMonitor = None # type: ignore
+    ) -> Dict[str, Dict]:
+        """
+        Analiza múltiples algoritmos sobre múltiples datasets
+        
+        Args:
+            algorithm_names: Lista de nombres de algoritmos
+            datasets: Secuencia de datasets a probar (puede generarse bajo demanda)
+            progress_callback: Función callback para reportar progreso
+            cancel_token: Token para pausar o cancelar entre celdas
+            precise: Si True, mide cada celda en un proceso aislado (PreciseRunner)
+            trials: Repeticiones por celda; se reporta el tiempo mínimo
+            strategy: Orden de medición (ver TrialScheduler.STRATEGIES)
+            seed: Semilla del orden de medición
+            drift_monitor: Monitor de deriva; su reporte queda en drift_monitor.report()
+        
+        Returns:
+            Diccionario con resultados por algoritmo (parciales si se canceló)
+        """
+        results = {}
+        
+        with PreciseRunner(PreciseRunner.SCHEDULED_TRIALS) if precise else contextlib.nullcontext() as runner:
+            for event in SortingAnalyzer.iter_analysis(
+                algorithm_names, datasets, progress_callback,
+                cancel_token=cancel_token, precise_runner=runner, # type: ignore
+                trials=trials, strategy=strategy, seed=seed, drift_monitor=drift_monitor
+            ):
+                SortingAnalyzer.apply_event(results, event)
+        
         return results
     
     @staticmethod
     def analyze_single_dataset(
         algorithm_names: List[str],
         dataset: List[int],
-        progress_callback: Callable = None # type: ignore
+        progress_callback: Callable = None, # type: ignore
+        cancel_token: CancellationToken = None, # type: ignore
+        precise: bool = False
     ) -> Dict[str, Dict]:
         """
         Analiza múltiples algoritmos sobre un único dataset
@@ -133,35 +335,70 @@ class SortingAnalyzer:
             algorithm_names: Lista de nombres de algoritmos
             dataset: Dataset único a probar
             progress_callback: Función callback para reportar progreso
+            cancel_token: Token para pausar o cancelar entre algoritmos
+            precise: Si True, mide cada algoritmo en un proceso aislado (PreciseRunner)
         
         Returns:
-            Diccionario con resultados por algoritmo
+            Diccionario con resultados por algoritmo (parciales si se canceló)
         """
         results = {}
         total_tests = len(algorithm_names)
         
-        for i, algo_name in enumerate(algorithm_names):
-            if progress_callback:
-                progress = ((i + 1) / total_tests) * 100
-                progress_callback(progress, algo_name, len(dataset))
-            
-            algo_func = SortingAlgorithms.get_sorting_function(algo_name) # type: ignore
-            algo_info = SortingAlgorithms.get_algorithm_info()[algo_name] # type: ignore
-            
-            exec_time, success, error_msg = SortingAnalyzer.measure_sorting_time(
-                algo_func, dataset
-            )
-            
-            results[algo_name] = {
-                'time': exec_time,
-                'size': len(dataset),
-                'error': error_msg if not success else None,
-                'complexity': algo_info,
-                'success': success
-            }
+        with PreciseRunner() if precise else contextlib.nullcontext() as runner:
+            for i, algo_name in enumerate(algorithm_names):
+                if cancel_token and not cancel_token.checkpoint():
+                    break
+                
+                if progress_callback:
+                    progress = ((i + 1) / total_tests) * 100
+                    progress_callback(progress, algo_name, len(dataset))
+                
+                algo_func = SortingAlgorithms.get_sorting_function(algo_name) # type: ignore
+                algo_info = SortingAlgorithms.get_algorithm_info()[algo_name] # type: ignore
+                
+                if runner is not None:
+                    measured = runner.measure(algo_name, dataset, cancel_token)
+                else:
+                    measured = SortingAnalyzer._measure_cancellable(algo_func, dataset, cancel_token)
+                if measured is None:
+                    break
+                
+                results[algo_name] = {
+                    'time': measured.get('time', 0.0),
+                    'cpu_time': measured.get('cpu_time', 0.0),
+                    'size': len(dataset),
+                    'error': measured['error'] if not measured['success'] else None,
+                    'complexity': algo_info,
+                    'success': measured['success']
+                }
         
         return results
     
+    @staticmethod
+    def shared_sizes(results: Dict[str, Dict]) -> List[int]:
+        """
+        Tamaños comunes a todos los algoritmos, o None si difieren
+        
+        Un algoritmo que falló a mitad del barrido comparte un prefijo de la
+        escalera de los demás.
+        """
+        longest = max((data['sizes'] for data in results.values()), key=len, default=[])
+        for data in results.values():
+            if data['sizes'] != longest[:len(data['sizes'])]:
+                return None # type: ignore
+        return longest
+    
+    @staticmethod
+    def fit_complexity(results: Dict[str, Dict]):
+        """
+        Ajusta la complejidad empírica de cada algoritmo con sus tiempos medidos
+        
+        Args:
+            results: Resultados de múltiples conjuntos (se agrega 'empirical' en sitio)
+        """
+        for data in results.values():
+            data['empirical'] = ComplexityFitter.fit(data['sizes'], data['times'])
+    
     @staticmethod
     def format_time(seconds: float) -> str:
         """Formatea el tiempo de ejecución de manera legible"""
@@ -5,6 +5,7 @@ from turtle import width
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import threading
+import contextlib
 from typing import List, Dict
 
 from sympy import root
@@ -12,14 +13,25 @@ from sympy import root
 from sorting_algorithms import SortingAlgorithms
 from dataset_manager import DatasetManager
 from sorting_analyzer import SortingAnalyzer
+from precise_timing import PreciseRunner
+from results_journal import ResultsJournal
+from trial_scheduler import TrialScheduler, DriftMonitor
+from sweep_planner import SweepPlanner
+from input_distributions import InputDistributions
 from tutorial_helperAdO import TutorialWindow, HelpDialog
 from bar_comparison import BarComparisonWindow
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+from cancellation import CancellationToken
+from progress_channel import ProgressChannel
+from complexity_fitter import ComplexityFitter
 
 
 class SortingAnalyzerGUI:
     """Interfaz gráfica para análisis de algoritmos de ordenamiento"""
     
-    def __init__(self, root, return_callback=None):
+    def __init__(self, root, return_callback=None, resume_path=None):
         self.root = root
         self.return_callback = return_callback
         self.root.title("Analizador de Algoritmos de Ordenamiento")
@@ -30,16 +42,26 @@ class SortingAnalyzerGUI:
         self.results = None
         self.current_mode = "generate"  # "generate" o "load"
         self.is_analyzing = False
+        self.cancel_token = None
+        self.progress_channel = None
+        self.live_rows = {}
+        self.live_lines = {}
+        self.dataset_manifest = None
 
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
         self.setup_ui()
+        
+        # Reanudar una corrida indicada desde la línea de comandos
+        if resume_path:
+            self.root.after(0, lambda: self.resume_analysis(resume_path))
 
     def on_closing(self):
         """Maneja el cierre de la ventana"""
         if self.is_analyzing:
             if not messagebox.askokcancel("Salir", "Un análisis está en curso. ¿Seguro que desea salir?"):
                 return
+            self.cancel_token.cancel() # type: ignore
         # Ejecutar callback para volver al menú
         if self.return_callback:
             self.return_callback()
@@ -157,7 +179,7 @@ class SortingAnalyzerGUI:
         
         ttk.Radiobutton(
             mode_frame,
-            text="📁 Cargar desde archivo .txt",
+            text="📁 Cargar desde archivo (.txt, .npy, .bin)",
             variable=self.mode_var,
             value="load",
             command=self.on_mode_change # type: ignore
@@ -204,11 +226,11 @@ class SortingAnalyzerGUI:
             style='Secondary.TLabel'
         ).pack(side=tk.LEFT, padx=5)
         
-        # Estado inicial
+        # Distribución de los valores
         order_frame = ttk.Frame(self.generate_frame)
         order_frame.pack(fill=tk.X, pady=8)
         
-        ttk.Label(order_frame, text="Estado inicial:", style='Heading.TLabel').pack(side=tk.LEFT, padx=5)
+        ttk.Label(order_frame, text="Distribución:", style='Heading.TLabel').pack(side=tk.LEFT, padx=5)
         ttk.Button(
             order_frame,
             text="?",
@@ -216,20 +238,51 @@ class SortingAnalyzerGUI:
             command=lambda: HelpDialog.show(self.root, "estado")
         ).pack(side=tk.LEFT, padx=2)
 
-        self.order_var = tk.StringVar(value="desordenado")
-        ttk.Radiobutton(
-            order_frame,
-            text="⬆️ Ordenado",
-            variable=self.order_var,
-            value="ordenado"
-        ).pack(side=tk.LEFT, padx=10)
-        ttk.Radiobutton(
+        self.distribution_var = tk.StringVar(value=InputDistributions.RANDOM)
+        ttk.Combobox(
             order_frame,
-            text="🔀 Desordenado",
-            variable=self.order_var,
-            value="desordenado"
+            textvariable=self.distribution_var,
+            values=InputDistributions.DISTRIBUTIONS,
+            state="readonly",
+            width=16
         ).pack(side=tk.LEFT, padx=10)
         
+        # Esquema de tamaños y número de subconjuntos
+        schedule_size_frame = ttk.Frame(self.generate_frame)
+        schedule_size_frame.pack(fill=tk.X, pady=5)
+        
+        ttk.Label(schedule_size_frame, text="Tamaños:").pack(side=tk.LEFT, padx=5)
+        self.size_schedule_var = tk.StringVar(value=DatasetManager.LINEAR)
+        schedule_combo = ttk.Combobox(
+            schedule_size_frame,
+            textvariable=self.size_schedule_var,
+            values=DatasetManager.SCHEDULES,
+            state="readonly",
+            width=15
+        )
+        schedule_combo.pack(side=tk.LEFT, padx=5)
+        schedule_combo.bind('<<ComboboxSelected>>', self.on_schedule_change) # type: ignore
+        
+        ttk.Label(schedule_size_frame, text="Cantidad:").pack(side=tk.LEFT, padx=5)
+        self.subset_count_var = tk.StringVar(value=str(DatasetManager.NUM_SUBSETS))
+        self.subset_count_spin = ttk.Spinbox(
+            schedule_size_frame,
+            from_=2,
+            to=DatasetManager.MAX_SUBSETS,
+            textvariable=self.subset_count_var,
+            width=5,
+            command=self.update_subset_info
+        )
+        self.subset_count_spin.pack(side=tk.LEFT, padx=5)
+        self.subset_count_spin.bind('<KeyRelease>', lambda e: self.update_subset_info())
+        self.custom_size_entry.bind('<KeyRelease>', lambda e: self.update_subset_info())
+        
+        self.custom_sizes_frame = ttk.Frame(self.generate_frame)
+        ttk.Label(self.custom_sizes_frame, text="Lista de tamaños:").pack(side=tk.LEFT, padx=5)
+        self.custom_sizes_entry = ttk.Entry(self.custom_sizes_frame, width=30)
+        self.custom_sizes_entry.insert(0, "100, 1000, 10000")
+        self.custom_sizes_entry.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
+        
         # Info de subconjuntos
         self.subset_info_label = ttk.Label(
             self.generate_frame,
@@ -238,6 +291,20 @@ class SortingAnalyzerGUI:
         )
         self.subset_info_label.pack(pady=5)
         
+        # Planificación por presupuesto de tiempo
+        budget_frame = ttk.Frame(self.generate_frame)
+        budget_frame.pack(fill=tk.X, pady=5)
+        
+        self.budget_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            budget_frame,
+            text="⏱ Planificar por presupuesto (min):",
+            variable=self.budget_var
+        ).pack(side=tk.LEFT, padx=5)
+        self.budget_entry = ttk.Entry(budget_frame, width=6)
+        self.budget_entry.insert(0, "10")
+        self.budget_entry.pack(side=tk.LEFT, padx=5)
+        
         # Frame para carga de archivo
         self.load_frame = ttk.Frame(control_frame)
         
@@ -333,6 +400,39 @@ class SortingAnalyzerGUI:
         separator3 = ttk.Frame(control_frame, height=1)
         separator3.pack(fill=tk.X, pady=15)
         
+        # Modo de medición de bajo ruido
+        self.precise_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            control_frame,
+            text="🎯 Medición precisa (proceso aislado, sin GC, calibrada)",
+            variable=self.precise_var
+        ).pack(anchor=tk.W, pady=(0, 10))
+        
+        # Orden de medición y repeticiones por celda
+        schedule_frame = ttk.Frame(control_frame)
+        schedule_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        ttk.Label(schedule_frame, text="Orden de ejecución:").grid(row=0, column=0, sticky=tk.W, padx=5)
+        self.strategy_var = tk.StringVar(value=TrialScheduler.SEQUENTIAL)
+        ttk.Combobox(
+            schedule_frame,
+            textvariable=self.strategy_var,
+            values=TrialScheduler.STRATEGIES,
+            state="readonly",
+            width=15
+        ).grid(row=0, column=1, sticky=tk.W, padx=5)
+        
+        ttk.Label(schedule_frame, text="Repeticiones:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=(5, 0))
+        self.trials_var = tk.StringVar(value="1")
+        ttk.Spinbox(
+            schedule_frame,
+            from_=1,
+            to=20,
+            textvariable=self.trials_var,
+            state="readonly",
+            width=5
+        ).grid(row=1, column=1, sticky=tk.W, padx=5, pady=(5, 0))
+        
         # Botón de análisis con estilo de acento
         analyze_button = ttk.Button(
             control_frame,
@@ -342,6 +442,13 @@ class SortingAnalyzerGUI:
         )
         analyze_button.pack(fill=tk.X, pady=5)
         
+        resume_button = ttk.Button(
+            control_frame,
+            text="⏯  Reanudar análisis guardado",
+            command=self.resume_analysis
+        )
+        resume_button.pack(fill=tk.X, pady=5)
+        
         # Barra de progreso
         self.progress_frame = ttk.Frame(control_frame)
         self.progress_label = ttk.Label(
@@ -358,8 +465,28 @@ class SortingAnalyzerGUI:
         )
         self.progress_bar.pack(fill=tk.X, pady=5)
         
+        # Controles de pausa y cancelación
+        run_controls = ttk.Frame(self.progress_frame)
+        run_controls.pack(fill=tk.X, pady=5)
+        run_controls.grid_columnconfigure(0, weight=1)
+        run_controls.grid_columnconfigure(1, weight=1)
+        
+        self.pause_button = ttk.Button(
+            run_controls,
+            text="⏸ Pausar",
+            command=self.toggle_pause
+        )
+        self.pause_button.grid(row=0, column=0, sticky=tk.EW, padx=(0, 3))
+        
+        ttk.Button(
+            run_controls,
+            text="⏹ Cancelar",
+            command=self.cancel_analysis
+        ).grid(row=0, column=1, sticky=tk.EW, padx=(3, 0))
+        
         # Mostrar frame apropiado según el modo
         self.on_mode_change() # type: ignore
+        self.update_subset_info()
     
     def setup_results_panel(self, parent):
         """Configura el panel de resultados"""
@@ -463,12 +590,58 @@ class SortingAnalyzerGUI:
             self.custom_size_frame.pack(fill=tk.X, pady=5)
         else:
             self.custom_size_frame.pack_forget()
+        self.update_subset_info()
+    
+    def on_schedule_change(self, event=None):
+        """Maneja el cambio de esquema de tamaños"""
+        if self.size_schedule_var.get() == DatasetManager.CUSTOM:
+            self.custom_sizes_frame.pack(fill=tk.X, pady=5, before=self.subset_info_label)
+            self.subset_count_spin.config(state=tk.DISABLED)
+        else:
+            self.custom_sizes_frame.pack_forget()
+            self.subset_count_spin.config(state=tk.NORMAL)
+        self.update_subset_info()
+    
+    def update_subset_info(self):
+        """Describe los subconjuntos que generará la configuración actual"""
+        schedule = self.size_schedule_var.get()
+        if schedule == DatasetManager.CUSTOM:
+            self.subset_info_label.config(text="ℹ️  Se usarán los tamaños indicados en la lista")
+            return
+        try:
+            max_size = int(self.custom_size_entry.get() if self.size_var.get() == "Personalizado" else self.size_var.get())
+            count = int(self.subset_count_var.get())
+        except ValueError:
+            max_size = count = 0
+        sizes = DatasetManager.get_subset_sizes(max_size, schedule, count) if max_size >= 1 and count >= 1 else []
+        if not sizes:
+            # Valor a medio escribir o fuera de rango
+            self.subset_info_label.config(text="")
+            return
+        self.subset_info_label.config(
+            text=f"ℹ️  Se generarán {len(sizes)} subconjuntos: {sizes[0]:,} … {sizes[-1]:,}"
+        )
+    
+    def get_size_schedule(self) -> Dict:
+        """Configuración de tamaños elegida en la interfaz (se guarda en el diario)"""
+        schedule = self.size_schedule_var.get()
+        config = {'schedule': schedule, 'count': int(self.subset_count_var.get())}
+        if schedule == DatasetManager.CUSTOM:
+            config['custom_sizes'] = DatasetManager.parse_custom_sizes(self.custom_sizes_entry.get())[0]
+        return config
     
     def browse_file(self):
         """Abre diálogo para seleccionar archivo"""
         filepath = filedialog.askopenfilename(
             title="Seleccionar archivo de datos",
-            filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
+            filetypes=[
+                ("Data files", "*.txt *.gz *.xz *.npy *.bin"),
+                ("Text files", "*.txt"),
+                ("Compressed text", "*.txt.gz *.txt.xz"),
+                ("NumPy arrays", "*.npy"),
+                ("Raw int64 (little-endian)", "*.bin"),
+                ("All files", "*.*")
+            ]
         )
         if filepath:
             self.file_path_var.set(filepath)
@@ -493,7 +666,6 @@ class SortingAnalyzerGUI:
         self.progress_label.config(
             text=f"Analizando {algorithm} con {size:,} elementos... {percent:.1f}%"
         )
-        self.root.update_idletasks()
     
     def start_analysis(self):
         """Inicia el análisis en un thread separado"""
@@ -519,14 +691,49 @@ class SortingAnalyzerGUI:
                 return
         
         # Iniciar análisis en thread
-        self.is_analyzing = True
-        self.progress_frame.pack(fill=tk.X, pady=10)
+        self.begin_analysis()
         
         thread = threading.Thread(target=self.run_analysis, daemon=True)
         thread.start()
     
+    def begin_analysis(self):
+        """Marca el inicio de un análisis y prepara sus controles"""
+        self.is_analyzing = True
+        self.cancel_token = CancellationToken()
+        # El hilo de análisis publica el progreso; Tk lo muestra a ~15 Hz
+        self.progress_channel = ProgressChannel(self.root, self.update_progress).start()
+        self.pause_button.config(text="⏸ Pausar")
+        self.progress_frame.pack(fill=tk.X, pady=10)
+    
+    def toggle_pause(self):
+        """Pausa o reanuda el análisis en curso"""
+        if not self.is_analyzing or self.cancel_token is None:
+            return
+        if self.cancel_token.is_paused:
+            self.cancel_token.resume()
+            self.pause_button.config(text="⏸ Pausar")
+        else:
+            self.cancel_token.pause()
+            self.pause_button.config(text="▶ Reanudar")
+            self.progress_label.config(text="⏸ En pausa (se detiene al terminar la medición actual)")
+    
+    def cancel_analysis(self):
+        """Cancela el análisis en curso"""
+        if not self.is_analyzing or self.cancel_token is None:
+            return
+        self.cancel_token.cancel()
+        self.progress_label.config(text="Cancelando análisis...")
+    
     def validate_generate_mode(self) -> bool:
         """Valida configuración del modo generación"""
+        if self.budget_var.get():
+            try:
+                if float(self.budget_entry.get()) <= 0:
+                    raise ValueError
+            except ValueError:
+                messagebox.showerror("Error", "El presupuesto debe ser un número de minutos mayor a 0")
+                return False
+            return True
         if self.size_var.get() == "Personalizado":
             try:
                 size = int(self.custom_size_entry.get())
@@ -537,6 +744,23 @@ class SortingAnalyzerGUI:
             except ValueError:
                 messagebox.showerror("Error", "Tamaño inválido")
                 return False
+        
+        if self.size_schedule_var.get() == DatasetManager.CUSTOM:
+            sizes, msg = DatasetManager.parse_custom_sizes(self.custom_sizes_entry.get())
+            if sizes is None:
+                messagebox.showerror("Error", msg)
+                return False
+        else:
+            try:
+                count = int(self.subset_count_var.get())
+            except ValueError:
+                count = 0
+            if not 2 <= count <= DatasetManager.MAX_SUBSETS:
+                messagebox.showerror(
+                    "Error",
+                    f"La cantidad de subconjuntos debe estar entre 2 y {DatasetManager.MAX_SUBSETS}"
+                )
+                return False
         return True
     
     def validate_load_mode(self) -> bool:
@@ -548,12 +772,74 @@ class SortingAnalyzerGUI:
             return False
         return True
     
-    def run_analysis(self):
+    def resume_analysis(self, filepath: str = None): # type: ignore
+        """Reanuda una corrida interrumpida a partir de su diario de resultados"""
+        if self.is_analyzing:
+            messagebox.showwarning("Advertencia", "Ya hay un análisis en curso")
+            return
+        
+        if not filepath:
+            filepath = filedialog.askopenfilename(
+                title="Seleccionar análisis a reanudar",
+                initialdir=ResultsJournal.JOURNAL_DIR,
+                filetypes=[("Diario de análisis", "*.jsonl"), ("All files", "*.*")]
+            )
+            if not filepath:
+                return
+        
+        run, cells, error = ResultsJournal.load_run(filepath)
+        if run is None:
+            messagebox.showerror("Error", error)
+            return
+        
+        self.apply_run_config(run['config'])
+        
+        self.begin_analysis()
+        
+        thread = threading.Thread(target=self.run_analysis, args=(filepath,), daemon=True)
+        thread.start()
+    
+    def apply_run_config(self, config: Dict):
+        """Refleja en los controles la configuración de una corrida guardada"""
+        self.mode_var.set("generate")
+        self.on_mode_change()
+        
+        for algo, var in self.algorithm_vars.items():
+            var.set(algo in config['algorithms'])
+        
+        plan = config.get('plan')
+        self.budget_var.set(plan is not None)
+        if plan is not None:
+            self.budget_entry.delete(0, tk.END)
+            self.budget_entry.insert(0, f"{plan['budget'] / 60:g}")
+        elif config['max_size'] in DatasetManager.PREDEFINED_SIZES:
+            self.size_var.set(str(config['max_size']))
+        else:
+            self.size_var.set("Personalizado")
+            self.custom_size_entry.delete(0, tk.END)
+            self.custom_size_entry.insert(0, str(config['max_size']))
+        self.on_size_change()
+        
+        self.size_schedule_var.set(config.get('schedule', DatasetManager.LINEAR))
+        self.subset_count_var.set(str(config.get('count', DatasetManager.NUM_SUBSETS)))
+        if config.get('custom_sizes'):
+            self.custom_sizes_entry.delete(0, tk.END)
+            self.custom_sizes_entry.insert(0, ", ".join(str(n) for n in config['custom_sizes']))
+        self.on_schedule_change()
+        
+        self.distribution_var.set(SortingAnalyzerGUI.config_distribution(config))
+        self.precise_var.set(config.get('precise', False))
+        self.strategy_var.set(config.get('strategy', TrialScheduler.SEQUENTIAL))
+        self.trials_var.set(str(config.get('trials', 1)))
+    
+    def run_analysis(self, resume_path: str = None): # type: ignore
         """Ejecuta el análisis (corre en thread separado)"""
         try:
             selected_algos = self.get_selected_algorithms()
             
-            if self.mode_var.get() == "generate":
+            if resume_path:
+                self.run_resumed_analysis(resume_path)
+            elif self.mode_var.get() == "generate":
                 self.run_generate_analysis(selected_algos)
             else:
                 self.run_load_analysis(selected_algos)
@@ -565,29 +851,247 @@ class SortingAnalyzerGUI:
             ))
         finally:
             self.is_analyzing = False
+            self.root.after(0, self.progress_channel.stop)
             self.root.after(0, self.progress_frame.pack_forget)
     
     def run_generate_analysis(self, algorithms: List[str]):
         """Ejecuta análisis con conjuntos generados"""
+        if self.budget_var.get():
+            self.run_planned_analysis(algorithms)
+            return
+        
         # Obtener tamaño
         if self.size_var.get() == "Personalizado":
             max_size = int(self.custom_size_entry.get())
         else:
             max_size = int(self.size_var.get())
         
-        # Generar datasets
-        ordered = self.order_var.get() == "ordenado"
-        datasets = DatasetManager.generate_subsets(max_size, ordered)
+        size_schedule = self.get_size_schedule()
+        if size_schedule['schedule'] == DatasetManager.CUSTOM:
+            max_size = size_schedule['custom_sizes'][-1]
+        
+        config = {
+            'algorithms': algorithms,
+            'max_size': max_size,
+            **size_schedule,
+            'distribution': self.distribution_var.get(),
+            'precise': self.precise_var.get(),
+            'strategy': self.strategy_var.get(),
+            'trials': int(self.trials_var.get())
+        }
+        seed = DatasetManager.new_seed()
         
-        # Analizar
-        results = SortingAnalyzer.analyze_multiple_algorithms(
+        # Los resultados parciales se guardan en disco a medida que llegan
+        journal = ResultsJournal.create()
+        journal.write_header(config, seed)
+        
+        self.run_checkpointed_sweep(journal, config, seed, [])
+    
+    def run_planned_analysis(self, algorithms: List[str]):
+        """Planifica tamaños y repeticiones para el presupuesto y, si se confirma, los mide"""
+        distribution = self.distribution_var.get()
+        plan = SweepPlanner.plan(
             algorithms,
-            datasets,
-            lambda p, a, s: self.root.after(0, lambda: self.update_progress(p, a, s))
+            float(self.budget_entry.get()) * 60,
+            distribution,
+            progress_callback=lambda a: self.root.after(
+                0, lambda: self.progress_label.config(text=f"Midiendo piloto de {a}...")
+            ),
+            cancel_token=self.cancel_token, # type: ignore
+            measure_runs=PreciseRunner.SCHEDULED_TRIALS if self.precise_var.get() else 1
         )
+        if plan['cancelled']:
+            self.root.after(0, lambda: messagebox.showinfo("Cancelado", "Análisis cancelado"))
+            return
         
-        self.results = results
-        self.root.after(0, lambda: self.display_results(results, "multiple"))
+        # Confirmar el plan en el hilo de la interfaz
+        answer = {}
+        answered = threading.Event()
+        def confirm():
+            answer['ok'] = messagebox.askyesno(
+                "Plan de medición",
+                SweepPlanner.describe(plan) + "\n\n¿Ejecutar este plan?"
+            )
+            answered.set()
+        self.root.after(0, confirm)
+        answered.wait()
+        if not answer['ok']:
+            return
+        
+        config = {
+            'algorithms': algorithms,
+            'distribution': distribution,
+            'precise': self.precise_var.get(),
+            'plan': plan
+        }
+        seed = DatasetManager.new_seed()
+        
+        journal = ResultsJournal.create()
+        journal.write_header(config, seed)
+        
+        self.run_checkpointed_sweep(journal, config, seed, [])
+    
+    def run_resumed_analysis(self, filepath: str):
+        """Continúa una corrida guardada midiendo solo las celdas faltantes"""
+        run, cells, error = ResultsJournal.load_run(filepath)
+        if run is None:
+            self.root.after(0, lambda: messagebox.showerror("Error", error))
+            return
+        
+        journal = ResultsJournal.reopen(filepath)
+        self.run_checkpointed_sweep(journal, run['config'], run['seed'], cells)
+    
+    @staticmethod
+    def config_distribution(config: Dict) -> str:
+        """Distribución de una corrida (las guardadas antes solo indicaban 'ordered')"""
+        if 'distribution' in config:
+            return config['distribution']
+        return InputDistributions.ORDERED if config.get('ordered') else InputDistributions.RANDOM
+    
+    def run_checkpointed_sweep(self, journal: ResultsJournal, config: Dict, seed: int, previous_events: List[Dict]):
+        """Mide las celdas pendientes de una corrida registrando cada una en el diario"""
+        algorithms = config['algorithms']
+        plan = config.get('plan')
+        progress = self.progress_channel
+        
+        # La misma semilla reconstruye exactamente los mismos conjuntos
+        if plan is not None:
+            sizes = max((e['sizes'] for e in plan['algorithms'].values()), key=len)
+            unplanned = [
+                {'algorithm': a, 'dataset_index': 0, 'size': 0, 'time': 0.0,
+                 'cpu_time': 0.0, 'success': False, 'error': e['error']}
+                for a, e in plan['algorithms'].items() if e['error']
+            ]
+        else:
+            datasets = DatasetManager.generate_subsets(
+                config['max_size'],
+                seed=seed,
+                schedule=config.get('schedule', DatasetManager.LINEAR),
+                count=config.get('count', DatasetManager.NUM_SUBSETS),
+                custom_sizes=config.get('custom_sizes'),
+                distribution=SortingAnalyzerGUI.config_distribution(config)
+            )
+            sizes = datasets.sizes
+            unplanned = []
+        if plan is not None:
+            ladders = {a: e.get('sizes', []) for a, e in plan['algorithms'].items()}
+        else:
+            ladders = {a: sizes for a in algorithms}
+        skip_cells = SortingAnalyzer.completed_cells(previous_events, ladders)
+        
+        # Manifiesto de los conjuntos: suficiente para regenerarlos exactamente
+        if plan is not None:
+            self.dataset_manifest = SweepPlanner.manifests(plan, seed)
+        else:
+            self.dataset_manifest = {algo: datasets.manifests() for algo in algorithms}
+        # Una corrida interrumpida antes de su primera celda ya puede tenerlo
+        if not journal.contains('manifest'):
+            journal.append({'type': 'manifest', 'datasets': self.dataset_manifest})
+        
+        # Con un plan, cada algoritmo tiene su propia escalera de tamaños
+        self.root.after(0, lambda: self.prepare_live_results(
+            algorithms, len(sizes), None if plan is not None else sizes
+        ))
+        for event in previous_events + unplanned:
+            self.root.after(0, lambda e=event: self.on_cell_result(e))
+        
+        # Analizar celda por celda; la misma semilla reproduce el orden de medición
+        drift_monitor = DriftMonitor()
+        with PreciseRunner(PreciseRunner.SCHEDULED_TRIALS) if config.get('precise') else contextlib.nullcontext() as runner:
+            if plan is not None:
+                events = SweepPlanner.iter_plan(
+                    plan, seed, progress, skip_cells, self.cancel_token, # type: ignore
+                    runner, drift_monitor # type: ignore
+                )
+            else:
+                events = SortingAnalyzer.iter_analysis(
+                    algorithms,
+                    datasets,
+                    progress,
+                    skip_cells,
+                    self.cancel_token,
+                    runner, # type: ignore
+                    trials=config.get('trials', 1),
+                    strategy=config.get('strategy', TrialScheduler.SEQUENTIAL),
+                    seed=seed,
+                    drift_monitor=drift_monitor
+                )
+            for event in events:
+                journal.append(dict(event, type='cell'))
+                self.root.after(0, lambda e=event: self.on_cell_result(e))
+            
+            if runner is not None and runner.calibration:
+                journal.append(dict(runner.calibration, type='calibration'))
+        
+        drift = drift_monitor.report()
+        journal.append(dict(drift, type='drift'))
+        
+        cancelled = self.cancel_token.is_cancelled # type: ignore
+        self.root.after(0, lambda: self.display_results(
+            self.results, "multiple", cancelled, journal.filepath, drift # type: ignore
+        ))
+    
+    def prepare_live_results(self, algorithms: List[str], num_subsets: int, sizes: List[int] = None): # type: ignore
+        """Prepara la tabla y el gráfico para recibir resultados incrementales"""
+        import sys
+        import os
+        sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+        from theme import ModernDarkTheme
+        colors = ModernDarkTheme.get_chart_colors()
+        
+        self.results = {}
+        self.live_rows = {}
+        self.live_lines = {}
+        
+        for item in self.results_tree.get_children():
+            self.results_tree.delete(item)
+        self.configure_multiple_columns(num_subsets, sizes)
+        
+        algo_info = SortingAlgorithms.get_algorithm_info()
+        self.ax.clear()
+        for i, algo_name in enumerate(algorithms):
+            complexity = algo_info[algo_name]['average']
+            self.live_rows[algo_name] = self.results_tree.insert(
+                '', tk.END, values=[algo_name, complexity, '']
+            )
+            self.live_lines[algo_name], = self.ax.plot(
+                [], [],
+                'o-',
+                label=f"{algo_name} ({complexity})",
+                linewidth=2.5,
+                markersize=7,
+                color=colors[i % len(colors)],
+                markeredgewidth=0,
+                alpha=0.9
+            )
+        
+        self.style_multiple_axes()
+        self.figure.tight_layout()
+        self.canvas.draw_idle()
+    
+    def on_cell_result(self, event: Dict):
+        """Agrega una celda recién medida a la tabla y extiende su línea en el gráfico"""
+        SortingAnalyzer.apply_event(self.results, event) # type: ignore
+        algo_name = event['algorithm']
+        
+        row = self.live_rows.get(algo_name)
+        if row is not None:
+            values = list(self.results_tree.item(row, 'values'))
+            column = 3 + event['dataset_index']
+            values.extend([''] * (column + 1 - len(values)))
+            if event['success']:
+                values[column] = SortingAnalyzer.format_time(event['time'])
+            else:
+                values[column] = "Error: " + event['error']
+            self.results_tree.item(row, values=values)
+        
+        line = self.live_lines.get(algo_name)
+        if line is not None and event['success']:
+            data = self.results[algo_name] # type: ignore
+            line.set_data(data['sizes'], data['times'])
+            self.ax.relim()
+            self.ax.autoscale_view()
+            self.canvas.draw_idle()
     
     def run_load_analysis(self, algorithms: List[str]):
         """Ejecuta análisis con conjunto cargado"""
@@ -602,19 +1106,31 @@ class SortingAnalyzerGUI:
         results = SortingAnalyzer.analyze_single_dataset(
             algorithms,
             dataset,
-            lambda p, a, s: self.root.after(0, lambda: self.update_progress(p, a, s))
+            self.progress_channel,
+            self.cancel_token, # type: ignore
+            self.precise_var.get()
         )
         
         self.results = results
-        self.root.after(0, lambda: self.display_results(results, "single"))
+        cancelled = self.cancel_token.is_cancelled # type: ignore
+        if not results:
+            self.root.after(0, lambda: messagebox.showinfo("Cancelado", "Análisis cancelado"))
+            return
+        self.root.after(0, lambda: self.display_results(results, "single", cancelled))
     
-    def display_results(self, results: Dict, mode: str):
+    def display_results(self, results: Dict, mode: str, cancelled: bool = False,
+                        journal_path: str = None, drift: Dict = None): # type: ignore
         """Muestra los resultados en la tabla y gráfico"""
+        if not results:
+            messagebox.showinfo("Cancelado", "Análisis cancelado antes de completar alguna medición")
+            return
+        
         # Limpiar tabla
         for item in self.results_tree.get_children():
             self.results_tree.delete(item)
         
         if mode == "multiple":
+            SortingAnalyzer.fit_complexity(results)
             self.display_multiple_results(results)
         else:
             self.display_single_results(results)
@@ -625,7 +1141,23 @@ class SortingAnalyzerGUI:
         # Actualizar visibilidad del botón de comparación de barras
         self.update_bar_comparison_button_visibility()
         
-        messagebox.showinfo("Éxito", "Análisis completado correctamente")
+        drift_note = ""
+        if drift and drift['drift_detected']:
+            drift_note = (
+                f"\n\n⚠ La velocidad de la máquina varió {drift['max_deviation_pct']:.1f}% "
+                f"durante la corrida (umbral {drift['threshold_pct']:.0f}%). "
+                "Los tiempos pueden no ser comparables entre sí."
+            )
+        
+        if cancelled:
+            message = "Análisis cancelado. Se muestran los resultados parciales."
+            if journal_path:
+                message += f"\n\nPuede reanudarlo más tarde desde:\n{journal_path}"
+            messagebox.showinfo("Cancelado", message + drift_note)
+        elif drift_note:
+            messagebox.showwarning("Deriva detectada", "Análisis completado." + drift_note)
+        else:
+            messagebox.showinfo("Éxito", "Análisis completado correctamente")
     
     def display_multiple_results(self, results: Dict):
         """Muestra resultados de análisis con múltiples conjuntos"""
@@ -633,11 +1165,34 @@ class SortingAnalyzerGUI:
         if not results:
             return
         
-        # Obtener número de conjuntos
-        first_algo = list(results.keys())[0]
-        num_subsets = len(results[first_algo]['times']) if results[first_algo]['success'] else 0
+        # Cada celda va en la columna de su conjunto: con órdenes intercalados
+        # un error puede dejar huecos antes de tamaños ya medidos
+        cells = {}
+        for algo_name, data in results.items():
+            indices = data.get('dataset_indices', range(len(data['times'])))
+            algo_cells = {i: SortingAnalyzer.format_time(t) for i, t in zip(indices, data['times'])}
+            for error in data['errors']:
+                algo_cells[error['dataset_index']] = "Error: " + error['error']
+            cells[algo_name] = algo_cells
+        
+        # Obtener número de conjuntos (puede variar entre algoritmos)
+        num_subsets = max((max(c, default=-1) + 1 for c in cells.values()), default=0)
+        self.configure_multiple_columns(num_subsets, SortingAnalyzer.shared_sizes(results))
+
+        # Insertar datos
+        for algo_name, data in results.items():
+            empirical = data.get('empirical') or {}
+            row = [algo_name, data['complexity']['average'], empirical.get('notation', "-")]
+            row.extend(cells[algo_name].get(i, "") for i in range(num_subsets))
+            self.results_tree.insert('', tk.END, values=row)
+    
+    def configure_multiple_columns(self, num_subsets: int, sizes: List[int] = None): # type: ignore
+        """
+        Configura las columnas de la tabla para múltiples conjuntos
         
-        columns = ['Algoritmo', 'Complejidad'] + [f'Conj{i+1}' for i in range(num_subsets)]
+        Si todos los algoritmos comparten los tamaños, el encabezado muestra n
+        """
+        columns = ['Algoritmo', 'Complejidad', 'Empírica'] + [f'Conj{i+1}' for i in range(num_subsets)]
         self.results_tree['columns'] = columns
         self.results_tree['show'] = 'headings'
         
@@ -647,22 +1202,15 @@ class SortingAnalyzerGUI:
         
         self.results_tree.heading('Complejidad', text='Complejidad')
         self.results_tree.column('Complejidad', width=100, minwidth=80, anchor=tk.CENTER)
+        
+        self.results_tree.heading('Empírica', text='Empírica')
+        self.results_tree.column('Empírica', width=100, minwidth=80, anchor=tk.CENTER)
 
         for i in range(num_subsets):
             col_name = f'Conj{i+1}'
-            self.results_tree.heading(col_name, text=col_name)
+            heading = f"n={sizes[i]:,}" if sizes and i < len(sizes) else col_name
+            self.results_tree.heading(col_name, text=heading)
             self.results_tree.column(col_name, width=80, minwidth=70, anchor=tk.CENTER)
-
-        # Insertar datos
-        for algo_name, data in results.items():
-            if data['success']:
-                row = [algo_name, data['complexity']['average']]
-                for time_val in data['times']:
-                    row.append(SortingAnalyzer.format_time(time_val))
-                self.results_tree.insert('', tk.END, values=row)
-            else:
-                row = [algo_name, data['complexity']['average'], "Error: " + data['errors'][0]['error']]
-                self.results_tree.insert('', tk.END, values=row)
     
     def display_single_results(self, results: Dict):
         """Muestra resultados de análisis con conjunto único"""
@@ -727,7 +1275,24 @@ class SortingAnalyzerGUI:
                     markeredgewidth=0,
                     alpha=0.9
                 )
-        
+                
+                # Curva del modelo ajustado
+                empirical = data.get('empirical')
+                if empirical and empirical['success']:
+                    fit_sizes, fit_times = ComplexityFitter.curve(empirical, data['sizes'])
+                    self.ax.plot(
+                        fit_sizes,
+                        fit_times,
+                        ':',
+                        linewidth=1.5,
+                        color=color,
+                        alpha=0.8
+                    )
+        
+        self.style_multiple_axes()
+    
+    def style_multiple_axes(self):
+        """Aplica etiquetas y estilo al gráfico comparativo de múltiples conjuntos"""
         self.ax.set_xlabel('Tamaño del conjunto (n)', fontsize=12, fontweight='600')
         self.ax.set_ylabel('Tiempo de ejecución (s)', fontsize=12, fontweight='600')
         self.ax.set_title('Comparación de Algoritmos de Ordenamiento', 
@@ -873,23 +1438,48 @@ class SortingAnalyzerGUI:
                 mode = "multiple" if 'times' in list(self.results.values())[0] else "single"
                 
                 if mode == "multiple":
-                    # Exportar resultados múltiples
-                    first_algo = list(self.results.keys())[0]
-                    num_subsets = len(self.results[first_algo]['times']) if self.results[first_algo]['success'] else 0
+                    # Exportar resultados múltiples (cada algoritmo puede tener
+                    # distinta cantidad de conjuntos y distintos tamaños)
+                    num_subsets = max(len(data['times']) for data in self.results.values())
                     
-                    header = "Algoritmo,Complejidad," + ",".join([f"Conjunto{i+1}" for i in range(num_subsets)])
+                    header = "Algoritmo,Complejidad,Empírica,R²," + ",".join([f"Conjunto{i+1}" for i in range(num_subsets)])
                     f.write(header + "\n")
                     
                     for algo_name, data in self.results.items():
-                        if data['success']:
+                        if data['times']:
                             times_str = ",".join([str(t) for t in data['times']])
-                            f.write(f"{algo_name},{data['complexity']['average']},{times_str}\n")
+                            empirical = data.get('empirical') or {}
+                            r_squared = empirical.get('r_squared', '')
+                            f.write(f"{algo_name},{data['complexity']['average']},"
+                                    f"{empirical.get('notation', '')},{r_squared},{times_str}\n")
+                    
+                    f.write("\nTamaño (n)\n")
+                    for algo_name, data in self.results.items():
+                        if data['sizes']:
+                            sizes_str = ",".join([str(n) for n in data['sizes']])
+                            f.write(f"{algo_name},{data['complexity']['average']},,,{sizes_str}\n")
+                    
+                    # Semilla, distribución y parámetros de cada conjunto
+                    if self.dataset_manifest:
+                        f.write("\nManifiesto\nAlgoritmo,Conjunto,Tamaño,Distribución,Parámetros,Semilla,Generador\n")
+                        for algo_name, manifests in self.dataset_manifest.items():
+                            for m in manifests:
+                                params = ";".join(f"{k}={v}" for k, v in m['params'].items())
+                                f.write(f"{algo_name},{m['index'] + 1},{m['size']},{m['distribution']},"
+                                        f"{params},{m['seed']},{m['generator']}\n")
+                    
+                    # Tiempo de CPU (la diferencia con el de pared indica contención)
+                    f.write("\nTiempo de CPU (s)\n")
+                    for algo_name, data in self.results.items():
+                        if data.get('cpu_times'):
+                            cpu_str = ",".join([str(t) for t in data['cpu_times']])
+                            f.write(f"{algo_name},{data['complexity']['average']},,,{cpu_str}\n")
                 else:
                     # Exportar resultados únicos
-                    f.write("Algoritmo,Complejidad,Tamaño,Tiempo(s)\n")
+                    f.write("Algoritmo,Complejidad,Tamaño,Tiempo(s),TiempoCPU(s)\n")
                     for algo_name, data in self.results.items():
                         if data['success']:
-                            f.write(f"{algo_name},{data['complexity']['average']},{data['size']},{data['time']}\n")
+                            f.write(f"{algo_name},{data['complexity']['average']},{data['size']},{data['time']},{data.get('cpu_time', '')}\n")
             
             messagebox.showinfo("Éxito", f"Resultados exportados a:\n{filepath}")
         except Exception as e:
@@ -925,6 +1515,7 @@ class SortingAnalyzerGUI:
                 "Un análisis está en curso. ¿Seguro que desea volver?"
             ):
                 return
+            self.cancel_token.cancel() # type: ignore
         # Ejecutar callback para volver al menú
         if self.return_callback:
             self.return_callback()
@@ -991,6 +1582,18 @@ class IndividualGraphWindow:
                     fg=color,
                     bg=self.colors['bg_primary']).pack(side=tk.LEFT, padx=5)
         
+        empirical = self.data.get('empirical')
+        if empirical and empirical['success']:
+            fit_text = (
+                f"Ajuste empírico: {empirical['notation']}   "
+                f"constante={empirical['constant']:.3e}   "
+                f"R²={empirical['r_squared']:.4f}   "
+                f"confianza={empirical['confidence'] * 100:.0f}%"
+            )
+            if empirical['exponent'] is not None:
+                fit_text += f"   exponente={empirical['exponent']:.2f}"
+            ttk.Label(info_frame, text=fit_text, style='Secondary.TLabel').pack(anchor=tk.W)
+        
         # Gráfico
         fig, ax = plt.subplots(figsize=(10, 6))
         canvas = FigureCanvasTkAgg(fig, self.window)
@@ -1013,6 +1616,27 @@ class IndividualGraphWindow:
             )
             ax.fill_between(self.data['sizes'], self.data['times'], 
                            alpha=0.2, color=chart_colors)
+            empirical = self.data.get('empirical')
+            if empirical and empirical['success']:
+                fit_sizes, fit_times = ComplexityFitter.curve(empirical, self.data['sizes'])
+                ax.plot(
+                    fit_sizes,
+                    fit_times,
+                    ':',
+                    linewidth=2,
+                    color=self.colors['accent'],
+                    label=f"Ajuste {empirical['notation']}"
+                )
+            if self.data.get('cpu_times'):
+                ax.plot(
+                    self.data['sizes'],
+                    self.data['cpu_times'],
+                    '--',
+                    linewidth=1.5,
+                    color=self.colors['text_secondary'],
+                    alpha=0.9,
+                    label="Tiempo de CPU"
+                )
             ax.set_xlabel('Tamaño del conjunto (n)', fontsize=12, fontweight='600')
             ax.set_ylabel('Tiempo de ejecución (s)', fontsize=12, fontweight='600')
             ax.set_title(f'{self.algo_name} - Análisis de Rendimiento', 
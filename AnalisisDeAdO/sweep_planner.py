@@ -0,0 +1,282 @@
+# sweep_planner.py
+import math
+from typing import List, Dict, Any, Callable, Iterator, Set, Tuple
+
+from sorting_algorithms import SortingAlgorithms
+from dataset_manager import DatasetManager
+from sorting_analyzer import SortingAnalyzer
+from precise_timing import PreciseRunner
+from trial_scheduler import DriftMonitor
+from input_distributions import InputDistributions
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+from cancellation import CancellationToken
+
+
+class SweepPlanner:
+    """
+    Planifica un barrido de tamaños que cabe en un presupuesto de tiempo
+
+    Unas corridas piloto pequeñas calibran el modelo de costo de cada
+    algoritmo; con él se elige el mayor tamaño factible, una escalera
+    geométrica de tamaños y la cantidad de repeticiones.
+    """
+
+    PILOT_SIZES = [500, 1000, 2000]
+    PILOT_REPEATS = 2
+    MIN_SIZE = 100
+    POINTS = 10
+    DEFAULT_TRIALS = 3
+    MAX_TRIALS = 7
+    BUDGET_USAGE = 0.8  # Margen para generación de datos y errores del modelo
+
+    # Forma del caso promedio declarado -> función de costo
+    COST_SHAPES = {
+        'O(n log n)': lambda n: n * math.log2(max(n, 2)),
+        'O(n²)': lambda n: n ** 2,
+        'O(n + k)': lambda n: n,
+        'O(d(n + k))': lambda n: n,
+    }
+
+    @staticmethod
+    def pilot(algorithm_name: str, distribution: str = InputDistributions.RANDOM) -> Dict[str, Any]:
+        """
+        Mide el algoritmo en tamaños pequeños y ajusta su modelo de costo
+
+        El costo predicho es el mayor entre el caso promedio declarado
+        (escalado con la constante medida) y la ley de potencias observada
+        entre el primer y el último piloto, para no subestimar algoritmos
+        que degeneran con la entrada elegida (p. ej. Quick Sort ordenado).
+
+        Returns:
+            Diccionario con 'success', 'error', 'constant', 'exponent' y los
+            tiempos piloto
+        """
+        algo_func = SortingAlgorithms.get_sorting_function(algorithm_name)
+        datasets = DatasetManager.generate_for_sizes(SweepPlanner.PILOT_SIZES, seed=0, distribution=distribution)
+        shape = SweepPlanner.COST_SHAPES.get(
+            SortingAlgorithms.get_algorithm_info()[algorithm_name]['average'], # type: ignore
+            SweepPlanner.COST_SHAPES['O(n²)']
+        )
+
+        times = []
+        for dataset in datasets:
+            best = float('inf')
+            for _ in range(SweepPlanner.PILOT_REPEATS):
+                elapsed, success, error = SortingAnalyzer.measure_sorting_time(algo_func, dataset) # type: ignore
+                if not success:
+                    return {'success': False, 'error': error}
+                best = min(best, elapsed)
+            times.append(max(best, 1e-9))
+
+        sizes = SweepPlanner.PILOT_SIZES
+        constant = max(t / shape(n) for n, t in zip(sizes, times))
+        exponent = math.log(times[-1] / times[0]) / math.log(sizes[-1] / sizes[0])
+
+        return {
+            'success': True,
+            'error': "",
+            'sizes': sizes,
+            'times': times,
+            'constant': constant,
+            'exponent': max(exponent, 1.0),
+            'shape': SortingAlgorithms.get_algorithm_info()[algorithm_name]['average'] # type: ignore
+        }
+
+    @staticmethod
+    def predict(model: Dict[str, Any], size: int) -> float:
+        """Tiempo predicho (segundos) de una medición de tamaño dado"""
+        shape = SweepPlanner.COST_SHAPES.get(model['shape'], SweepPlanner.COST_SHAPES['O(n²)'])
+        by_class = model['constant'] * shape(size)
+        by_power = model['times'][-1] * (size / model['sizes'][-1]) ** model['exponent']
+        return max(by_class, by_power)
+
+    @staticmethod
+    def ladder(max_size: int, points: int = POINTS) -> List[int]:
+        """Escalera geométrica de tamaños desde MIN_SIZE hasta max_size"""
+        return DatasetManager.get_subset_sizes(
+            max_size, DatasetManager.LOG_UNIFORM, points, min_size=SweepPlanner.MIN_SIZE
+        )
+
+    @staticmethod
+    def ladder_cost(model: Dict[str, Any], sizes: List[int], trials: int) -> float:
+        return trials * sum(SweepPlanner.predict(model, n) for n in sizes)
+
+    @staticmethod
+    def _largest_size(model: Dict[str, Any], share: float, trials: int, points: int) -> int:
+        """Mayor tamaño máximo cuya escalera cabe en la cuota (0 si ninguno cabe)"""
+        if SweepPlanner.ladder_cost(model, SweepPlanner.ladder(SweepPlanner.MIN_SIZE, points), trials) > share:
+            return 0
+        low, high = SweepPlanner.MIN_SIZE, DatasetManager.MAX_SIZE
+        while low < high:
+            mid = (low + high + 1) // 2
+            if SweepPlanner.ladder_cost(model, SweepPlanner.ladder(mid, points), trials) <= share:
+                low = mid
+            else:
+                high = mid - 1
+        return low
+
+    @staticmethod
+    def plan(
+        algorithm_names: List[str],
+        budget_seconds: float,
+        distribution: str = InputDistributions.RANDOM,
+        points: int = POINTS,
+        progress_callback: Callable = None, # type: ignore
+        cancel_token: CancellationToken = None, # type: ignore
+        measure_runs: int = 1
+    ) -> Dict[str, Any]:
+        """
+        Construye el plan de medición para un presupuesto total
+
+        El presupuesto se reparte en partes iguales entre los algoritmos. Cada
+        uno recibe el mayor tamaño cuya escalera cabe con DEFAULT_TRIALS
+        repeticiones (o con una sola si ni así cabe); si llega a MAX_SIZE con
+        tiempo de sobra, ese tiempo se usa en más repeticiones.
+
+        Los pilotos se miden siempre en el proceso actual; en modo preciso
+        cada repetición ejecuta el algoritmo measure_runs veces dentro del
+        trabajador (PreciseRunner.trials), y el costo predicho lo incluye.
+
+        Args:
+            algorithm_names: Algoritmos a planificar
+            budget_seconds: Tiempo total deseado
+            distribution: Distribución de los conjuntos
+            points: Tamaños por escalera
+            progress_callback: Función (algoritmo) llamada antes de cada piloto
+            cancel_token: Token para cancelar entre pilotos
+            measure_runs: Ejecuciones por repetición (PreciseRunner.trials en modo preciso)
+
+        Returns:
+            Plan serializable a JSON; 'cancelled' es True si se canceló
+        """
+        usable = budget_seconds * SweepPlanner.BUDGET_USAGE
+        share = usable / max(len(algorithm_names), 1)
+        plan = {
+            'budget': budget_seconds,
+            'distribution': distribution,
+            'points': points,
+            'algorithms': {},
+            'predicted_total': 0.0,
+            'cancelled': False
+        }
+
+        for algo_name in algorithm_names:
+            if cancel_token and not cancel_token.checkpoint():
+                plan['cancelled'] = True
+                return plan
+            if progress_callback:
+                progress_callback(algo_name)
+
+            model = SweepPlanner.pilot(algo_name, distribution)
+            entry = {'sizes': [], 'trials': 0, 'predicted_time': 0.0, 'error': model['error']}
+            if model['success']:
+                trials = SweepPlanner.DEFAULT_TRIALS
+                max_size = SweepPlanner._largest_size(model, share, trials * measure_runs, points)
+                if max_size == 0:
+                    trials = 1
+                    max_size = SweepPlanner._largest_size(model, share, trials * measure_runs, points)
+
+                if max_size == 0:
+                    entry['error'] = "No cabe en el presupuesto ni con el tamaño mínimo"
+                else:
+                    sizes = SweepPlanner.ladder(max_size, points)
+                    cost = SweepPlanner.ladder_cost(model, sizes, measure_runs)
+                    if max_size == DatasetManager.MAX_SIZE:
+                        trials = max(trials, min(SweepPlanner.MAX_TRIALS, int(share // cost)))
+                    entry.update({
+                        'sizes': sizes,
+                        'trials': trials,
+                        'predicted_time': cost * trials,
+                        'model': {k: model[k] for k in ('sizes', 'times', 'constant', 'exponent', 'shape')}
+                    })
+            plan['algorithms'][algo_name] = entry
+            plan['predicted_total'] += entry['predicted_time']
+
+        return plan
+
+    @staticmethod
+    def describe(plan: Dict[str, Any]) -> str:
+        """Texto legible del plan para confirmarlo antes de ejecutarlo"""
+        lines = [
+            f"Presupuesto: {SortingAnalyzer.format_time(plan['budget'])}  "
+            f"(predicho: {SortingAnalyzer.format_time(plan['predicted_total'])})",
+            ""
+        ]
+        for algo_name, entry in plan['algorithms'].items():
+            if entry['error']:
+                lines.append(f"• {algo_name}: {entry['error']}")
+                continue
+            lines.append(
+                f"• {algo_name}: hasta n={entry['sizes'][-1]:,} "
+                f"({len(entry['sizes'])} tamaños, {entry['trials']} rep.) "
+                f"≈ {SortingAnalyzer.format_time(entry['predicted_time'])}"
+            )
+        return "\n".join(lines)
+
+    @staticmethod
+    def datasets_for(plan: Dict[str, Any], algorithm_name: str, seed: int):
+        """Conjuntos (perezosos) de la escalera de un algoritmo del plan"""
+        return DatasetManager.generate_for_sizes(
+            plan['algorithms'][algorithm_name]['sizes'],
+            plan.get('ordered', False),
+            seed,
+            plan.get('distribution')
+        )
+
+    @staticmethod
+    def manifests(plan: Dict[str, Any], seed: int) -> Dict[str, List[Dict[str, Any]]]:
+        """Manifiesto de los conjuntos de cada algoritmo del plan"""
+        return {
+            algo_name: SweepPlanner.datasets_for(plan, algo_name, seed).manifests()
+            for algo_name, entry in plan['algorithms'].items() if not entry['error']
+        }
+
+    @staticmethod
+    def iter_plan(
+        plan: Dict[str, Any],
+        seed: int,
+        progress_callback: Callable = None, # type: ignore
+        skip_cells: Set[Tuple[str, int]] = None, # type: ignore
+        cancel_token: CancellationToken = None, # type: ignore
+        precise_runner: PreciseRunner = None, # type: ignore
+        drift_monitor: DriftMonitor = None # type: ignore
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Ejecuta un plan con SortingAnalyzer, algoritmo por algoritmo
+
+        Cada algoritmo usa su propia escalera. Cada conjunto depende de la
+        semilla y de su índice en la escalera (no solo de su tamaño), así la
+        misma semilla reproduce exactamente los datos de cada algoritmo. El
+        progreso global se pondera por el tiempo predicho de cada algoritmo.
+
+        Yields:
+            Los mismos eventos de celda que SortingAnalyzer.iter_analysis
+        """
+        runnable = {name: e for name, e in plan['algorithms'].items() if not e['error']}
+        total = sum(e['predicted_time'] for e in runnable.values()) or 1.0
+        done = 0.0
+
+        for algo_name, entry in runnable.items():
+            datasets = SweepPlanner.datasets_for(plan, algo_name, seed)
+            start = done
+            fraction = entry['predicted_time'] / total
+
+            def algo_progress(p, a, s, start=start, fraction=fraction):
+                if progress_callback:
+                    progress_callback(start * 100 + p * fraction, a, s)
+
+            yield from SortingAnalyzer.iter_analysis(
+                [algo_name],
+                datasets,
+                algo_progress,
+                skip_cells,
+                cancel_token,
+                precise_runner,
+                trials=entry['trials'],
+                drift_monitor=drift_monitor
+            )
+            if cancel_token and cancel_token.is_cancelled:
+                return
+            done += fraction
@@ -0,0 +1,176 @@
+# trial_scheduler.py
+import random
+import statistics
+import time
+from typing import List, Tuple, Dict, Any
+
+from sorting_algorithms import SortingAlgorithms
+
+
+class TrialScheduler:
+    """Decide el orden en que se miden las celdas (algoritmo, conjunto, repetición)"""
+
+    SEQUENTIAL = "secuencial"
+    BY_DATASET = "por conjunto"
+    RANDOM = "aleatorio"
+    LATIN_SQUARE = "cuadrado latino"
+    STRATEGIES = [SEQUENTIAL, BY_DATASET, RANDOM, LATIN_SQUARE]
+
+    @staticmethod
+    def build_schedule(
+        algorithm_names: List[str],
+        num_datasets: int,
+        trials: int = 1,
+        strategy: str = SEQUENTIAL,
+        seed: int = None # type: ignore
+    ) -> List[Tuple[str, int, int]]:
+        """
+        Construye el orden de medición
+
+        Con el orden secuencial, todos los tamaños de un algoritmo se miden
+        antes de pasar al siguiente, de modo que el calentamiento térmico o la
+        carga de fondo favorecen siempre a los primeros. Los órdenes
+        intercalados reparten esa deriva entre todos los algoritmos.
+
+        El orden por conjunto mide todos los algoritmos sobre un conjunto
+        antes de pasar al siguiente, así cada conjunto se genera una sola vez
+        (el cuadrado latino también agrupa por conjunto). Los órdenes
+        secuencial y aleatorio vuelven a generar un conjunto cada vez que lo
+        retoman.
+
+        Args:
+            algorithm_names: Lista de nombres de algoritmos
+            num_datasets: Número de conjuntos
+            trials: Repeticiones por celda
+            strategy: "secuencial", "por conjunto", "aleatorio" o "cuadrado latino"
+            seed: Semilla del orden (mismo valor, mismo orden)
+
+        Returns:
+            Lista de tuplas (algoritmo, índice_conjunto, repetición)
+        """
+        if strategy == TrialScheduler.SEQUENTIAL:
+            return [
+                (algo, i, t)
+                for algo in algorithm_names
+                for i in range(num_datasets)
+                for t in range(trials)
+            ]
+
+        if strategy == TrialScheduler.BY_DATASET:
+            return [
+                (algo, i, t)
+                for i in range(num_datasets)
+                for algo in algorithm_names
+                for t in range(trials)
+            ]
+
+        rng = random.Random(seed)
+
+        if strategy == TrialScheduler.RANDOM:
+            schedule = [
+                (algo, i, t)
+                for algo in algorithm_names
+                for i in range(num_datasets)
+                for t in range(trials)
+            ]
+            rng.shuffle(schedule)
+            return schedule
+
+        if strategy == TrialScheduler.LATIN_SQUARE:
+            # Cada bloque (conjunto, repetición) mide todos los algoritmos; el
+            # orden dentro del bloque rota, así cada algoritmo ocupa cada
+            # posición la misma cantidad de veces
+            blocks = [(i, t) for t in range(trials) for i in range(num_datasets)]
+            rng.shuffle(blocks)
+            base_order = list(algorithm_names)
+            rng.shuffle(base_order)
+            n = len(base_order)
+
+            schedule = []
+            for k, (i, t) in enumerate(blocks):
+                shift = k % n if n else 0
+                for algo in base_order[shift:] + base_order[:shift]:
+                    schedule.append((algo, i, t))
+            return schedule
+
+        raise ValueError(f"Estrategia de orden no soportada: {strategy}")
+
+
+class DriftMonitor:
+    """
+    Vuelve a medir periódicamente una celda de referencia fija para detectar
+    cambios en la velocidad de la máquina durante la corrida
+    """
+
+    REFERENCE_ALGORITHM = 'Merge Sort'
+    REFERENCE_SIZE = 40000   # Unos 50 ms o más: el ruido del reloj queda muy por debajo del umbral
+    REFERENCE_REPEATS = 3
+    BASELINE_SAMPLES = 3     # La línea base es la mediana de las primeras mediciones
+
+    def __init__(self, interval: int = 10, threshold_pct: float = 10.0):
+        """
+        Args:
+            interval: Cada cuántas celdas se vuelve a medir la referencia
+            threshold_pct: Variación máxima tolerada respecto a la línea base
+        """
+        self.interval = interval
+        self.threshold_pct = threshold_pct
+        self.samples = []
+        self._reference_func = SortingAlgorithms.get_sorting_function(DriftMonitor.REFERENCE_ALGORITHM)
+        self._reference_data = list(range(DriftMonitor.REFERENCE_SIZE))
+        random.Random(0).shuffle(self._reference_data)
+
+    def _time_reference(self) -> float:
+        """Tiempo mínimo de varias repeticiones de la celda de referencia"""
+        best = float('inf')
+        for _ in range(DriftMonitor.REFERENCE_REPEATS):
+            start = time.perf_counter()
+            self._reference_func(self._reference_data)
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    def maybe_sample(self, cells_done: int, precise_runner=None):
+        """
+        Mide la referencia si corresponde según el intervalo
+
+        Args:
+            cells_done: Celdas medidas hasta ahora
+            precise_runner: Si se indica, la referencia se mide en el mismo
+                            proceso aislado que las celdas
+        """
+        if cells_done % self.interval != 0:
+            return
+        if precise_runner is not None:
+            best = float('inf')
+            for _ in range(DriftMonitor.REFERENCE_REPEATS):
+                measured = precise_runner.measure(DriftMonitor.REFERENCE_ALGORITHM, self._reference_data)
+                if not measured or not measured['success']:
+                    return
+                best = min(best, measured['time'])
+            self.samples.append((cells_done, best))
+        else:
+            self.samples.append((cells_done, self._time_reference()))
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Resume la deriva observada
+
+        Returns:
+            Diccionario con la línea base, la desviación máxima (%) y si se
+            superó el umbral
+        """
+        if not self.samples:
+            return {'samples': [], 'baseline': None, 'max_deviation_pct': 0.0,
+                    'threshold_pct': self.threshold_pct, 'drift_detected': False}
+
+        baseline = statistics.median(t for _, t in self.samples[:DriftMonitor.BASELINE_SAMPLES])
+        deviations = [abs(t - baseline) / baseline * 100 for _, t in self.samples if baseline > 0]
+        max_deviation = max(deviations) if deviations else 0.0
+
+        return {
+            'samples': self.samples,
+            'baseline': baseline,
+            'max_deviation_pct': max_deviation,
+            'threshold_pct': self.threshold_pct,
+            'drift_detected': max_deviation > self.threshold_pct
+        }
@@ -100,9 +100,11 @@ class TutorialWindow:
             },
             {
                 "title": "🎯 Modo de Operación",
-                "content": "• Generar conjuntos internamente: El programa crea 15 subconjuntos balanceados "
-                          "desde tamaños pequeños hasta el máximo que especifiques.\n"
-                          "• Cargar desde archivo .txt: Ingresa tu propio conjunto de datos en formato CSV.\n"
+                "content": "• Generar conjuntos internamente: El programa crea subconjuntos (15 por defecto) "
+                          "desde tamaños pequeños hasta el máximo que especifiques, con tamaños "
+                          "lineales, geométricos, log-uniformes o una lista personalizada.\n"
+                          "• Cargar desde archivo: Ingresa tu propio conjunto de datos en formato CSV "
+                          "(.txt, o comprimido .txt.gz / .txt.xz) o binario (.npy, .bin int64).\n"
                           "Ejemplo: 42,17,93,8,56,31,205"
             },
             {
@@ -183,13 +185,18 @@ class HelpDialog:
             "title": "Modo de Operación",
             "content": "Selecciona cómo proporcionar los datos:\n\n"
                       "🔸 Generar conjuntos internamente:\n"
-                      "El programa creará automáticamente 15 subconjuntos balanceados "
+                      "El programa creará automáticamente subconjuntos (15 por defecto) "
                       "desde tamaños pequeños hasta el máximo especificado. "
+                      "Los esquemas geométrico y log-uniforme dan más resolución en "
+                      "tamaños pequeños, donde se cruzan O(n²) y O(n log n). "
                       "Esto permite analizar cómo crece el tiempo de ejecución.\n\n"
-                      "🔸 Cargar desde archivo .txt:\n"
+                      "🔸 Cargar desde archivo:\n"
                       "Carga tu propio conjunto de datos desde un archivo.\n"
-                      "Formato: números separados por comas\n"
-                      "Ejemplo: 42, 17, 93, 8, 56, 31\n\n"
+                      "Formato .txt: números separados por comas\n"
+                      "Ejemplo: 42, 17, 93, 8, 56, 31\n"
+                      "También se aceptan .txt.gz y .txt.xz (texto comprimido), "
+                      ".npy (arreglo de NumPy) y .bin (enteros int64 little-endian). "
+                      "Los binarios se abren mapeados en memoria.\n\n"
                       "⚠️ Nota: Al cargar datos, el tamaño se determina por el archivo."
         },
         "tamano": {
@@ -213,11 +220,16 @@ class HelpDialog:
                       "Números ya ordenados de menor a mayor.\n"
                       "Representa el MEJOR CASO para algunos algoritmos.\n"
                       "Insertion Sort es muy rápido con datos ordenados.\n\n"
-                      "🔸 Desordenado:\n"
+                      "🔸 Aleatorio:\n"
                       "Números en orden completamente aleatorio.\n"
                       "Representa el CASO PROMEDIO.\n"
                       "Más realista para la mayoría de aplicaciones.\n\n"
-                      "💡 Prueba ambos para ver la diferencia de rendimiento."
+                      "🔸 Otras distribuciones:\n"
+                      "Invertido, casi ordenado, pocos únicos, diente de sierra, "
+                      "tubo de órgano, gaussiano, zipf y rango amplio. Cada una "
+                      "castiga a algoritmos distintos (p. ej. rango amplio supera "
+                      "el rango admitido por Counting Sort).\n\n"
+                      "💡 Prueba varias para ver la diferencia de rendimiento."
         },
         "algoritmos": {
             "title": "Selección de Algoritmos",
@@ -1,59 +1,394 @@
 # code_executor.py
+import ast
+import contextvars
+import hashlib
 import sys
+import textwrap
+import threading
 import time
 import traceback
+from collections import OrderedDict, deque
+from contextlib import contextmanager
 from io import StringIO
-from typing import Dict, Any
+from types import CodeType
+from typing import Dict, Any, Tuple, Callable, Iterator
+from cost_counter import CostCounter
+
+
+class NullSink:
+    """Salida que descarta todo lo que se escribe"""
+    
+    def write(self, text: str) -> int:
+        return len(text)
+    
+    def flush(self):
+        pass
+    
+    def getvalue(self) -> str:
+        return ""
+
+
+class BoundedCapture:
+    """
+    Salida acotada: conserva los primeros y los últimos `limit` caracteres
+    
+    Lo del medio se descarta al vuelo y solo se cuenta, así que la memoria
+    no crece con la cantidad de texto impreso.
+    """
+    
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._head = StringIO()
+        self._head_size = 0
+        self._tail = deque()
+        self._tail_size = 0
+        self.dropped = 0
+    
+    def write(self, text: str) -> int:
+        written = len(text)
+        room = self.limit - self._head_size
+        if room > 0:
+            self._head.write(text[:room])
+            self._head_size += min(room, written)
+            text = text[room:]
+        if text:
+            self._tail.append(text)
+            self._tail_size += len(text)
+            # Descartar fragmentos enteros mientras sobre al menos `limit`
+            while self._tail_size - len(self._tail[0]) >= self.limit:
+                self._trim(self._tail.popleft())
+            if self._tail_size > 2 * self.limit:
+                joined = ''.join(self._tail)
+                self._trim(joined[:-self.limit])
+                self._tail = deque([joined[-self.limit:]])
+                self._tail_size = self.limit
+        return written
+    
+    def _trim(self, chunk: str):
+        self._tail_size -= len(chunk)
+        self.dropped += len(chunk)
+    
+    def flush(self):
+        pass
+    
+    def getvalue(self) -> str:
+        tail = ''.join(self._tail)
+        extra = max(len(tail) - self.limit, 0)
+        omitted = self.dropped + extra
+        if not omitted:
+            return self._head.getvalue() + tail
+        return f"{self._head.getvalue()}\n... [{omitted:,} caracteres omitidos] ...\n{tail[extra:]}"
+
+
+class _StdoutRouter:
+    """
+    Reemplazo de sys.stdout que escribe en la salida del contexto actual
+    
+    La salida de cada ejecución se elige con una ContextVar, así que la
+    captura de un hilo de análisis no se queda con lo que imprime el hilo
+    de la interfaz (los hilos nuevos empiezan sin captura).
+    """
+    
+    def __init__(self, fallback):
+        self.fallback = fallback  # sys.stdout original (None sin consola)
+    
+    def _target(self):
+        sink = CodeExecutor._stdout_sink.get()
+        return sink if sink is not None else self.fallback
+    
+    def write(self, text: str) -> int:
+        target = self._target()
+        return target.write(text) if target is not None else len(text)
+    
+    def flush(self):
+        target = self._target()
+        if target is not None:
+            target.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self.fallback, name)
 
 
 class CodeExecutor:
     """Ejecuta código y mide su tiempo de ejecución"""
     
+    # Modos de captura de la salida estándar del código
+    CAPTURE_DISCARD = "descartar"
+    CAPTURE_BOUNDED = "acotada"
+    CAPTURE_FULL = "completa"
+    CAPTURE_MODES = [CAPTURE_DISCARD, CAPTURE_BOUNDED, CAPTURE_FULL]
+    BOUNDED_LIMIT = 4096  # Caracteres conservados al inicio y al final
+    
+    CACHE_SIZE = 64  # Objetos de código compilados que se conservan (LRU)
+    COMPILE_SAMPLES = 5  # Compilaciones para estimar el costo de compilar
+    
+    # Plantilla del modo por lotes (como timeit): el código es el cuerpo del
+    # bucle, así K ejecuciones pagan una sola vez el costo del arnés
+    BATCH_TEMPLATE = """
+def __batch(__loops, __timer):
+    __start = __timer()
+    for __i in range(__loops):
+{body}
+    return __timer() - __start
+"""
+    
+    _stdout_sink: "contextvars.ContextVar[Any]" = contextvars.ContextVar('stdout_sink', default=None)
+    _router_lock = threading.Lock()
+    
+    _code_cache: "OrderedDict[str, CodeType]" = OrderedDict()
+    _cache_lock = threading.Lock()
+    _cache_stats = {'hits': 0, 'misses': 0}
+    
     @staticmethod
-    def execute_code(code: str, dataset_value: Any = None) -> Dict[str, Any]:
-        """Ejecuta el código proporcionado y retorna el tiempo y resultado"""
-        global_vars = {
+    def source_hash(code: str) -> str:
+        """Clave del caché: hash SHA-256 del código fuente"""
+        return hashlib.sha256(code.encode('utf-8')).hexdigest()
+    
+    @staticmethod
+    def compile_cached(code: str) -> CodeType:
+        """
+        Compila el código una sola vez y reutiliza el objeto de código
+        
+        El caché está acotado a CACHE_SIZE entradas y descarta la usada hace
+        más tiempo. Los errores de sintaxis se propagan (no se guardan).
+        """
+        key = CodeExecutor.source_hash(code)
+        with CodeExecutor._cache_lock:
+            compiled = CodeExecutor._code_cache.get(key)
+            if compiled is not None:
+                CodeExecutor._code_cache.move_to_end(key)
+                CodeExecutor._cache_stats['hits'] += 1
+                return compiled
+        
+        compiled = compile(code, '<string>', 'exec')
+        with CodeExecutor._cache_lock:
+            CodeExecutor._code_cache[key] = compiled
+            CodeExecutor._cache_stats['misses'] += 1
+            while len(CodeExecutor._code_cache) > CodeExecutor.CACHE_SIZE:
+                CodeExecutor._code_cache.popitem(last=False)
+        return compiled
+    
+    @staticmethod
+    def cache_info() -> Dict[str, int]:
+        """Aciertos, fallos y tamaño actual del caché de código"""
+        with CodeExecutor._cache_lock:
+            return {**CodeExecutor._cache_stats, 'size': len(CodeExecutor._code_cache)}
+    
+    @staticmethod
+    def clear_cache():
+        with CodeExecutor._cache_lock:
+            CodeExecutor._code_cache.clear()
+            CodeExecutor._cache_stats.update(hits=0, misses=0)
+    
+    @staticmethod
+    def make_sink(capture: str):
+        """Salida para un modo de captura (NullSink, BoundedCapture o StringIO)"""
+        if capture == CodeExecutor.CAPTURE_DISCARD:
+            return NullSink()
+        if capture == CodeExecutor.CAPTURE_BOUNDED:
+            return BoundedCapture(CodeExecutor.BOUNDED_LIMIT)
+        if capture == CodeExecutor.CAPTURE_FULL:
+            return StringIO()
+        raise ValueError(f"Modo de captura no soportado: {capture}")
+    
+    @staticmethod
+    @contextmanager
+    def capture(capture: str = CAPTURE_FULL) -> Iterator[Any]:
+        """
+        Dirige la salida estándar del contexto actual a una salida nueva
+        
+        sys.stdout se reemplaza una sola vez por un enrutador; después cada
+        captura solo fija una ContextVar, sin tocar el sys.stdout global.
+        
+        Yields:
+            La salida (tiene getvalue())
+        """
+        with CodeExecutor._router_lock:
+            if not isinstance(sys.stdout, _StdoutRouter):
+                sys.stdout = _StdoutRouter(sys.stdout)
+        sink = CodeExecutor.make_sink(capture)
+        token = CodeExecutor._stdout_sink.set(sink)
+        try:
+            yield sink
+        finally:
+            CodeExecutor._stdout_sink.reset(token)
+    
+    @staticmethod
+    def make_globals(dataset_value: Any = None, global_vars: Dict[str, Any] = None) -> Dict[str, Any]: # type: ignore
+        """
+        Diccionario de globales para una ejecución
+        
+        Si se pasa global_vars, se vacía y se vuelve a llenar en el lugar, así
+        una ejecución nunca ve variables que dejó la anterior.
+        """
+        if global_vars is None:
+            global_vars = {}
+        else:
+            global_vars.clear()
+        global_vars.update({
             'arr': dataset_value,
             'conjunto': dataset_value,
             'data': dataset_value,
             '__builtins__': __builtins__
-        }
+        })
+        return global_vars
+    
+    @staticmethod
+    def execute_compiled(
+        compiled: CodeType,
+        dataset_value: Any = None,
+        global_vars: Dict[str, Any] = None, # type: ignore
+        capture: str = CAPTURE_FULL
+    ) -> Dict[str, Any]:
+        """
+        Ejecuta un objeto de código ya compilado y retorna el tiempo y resultado
         
-        old_stdout = sys.stdout
-        sys.stdout = captured_output = StringIO()
+        Args:
+            compiled: Objeto de código (ver compile_cached)
+            dataset_value: Valor expuesto como arr/conjunto/data
+            global_vars: Diccionario a reutilizar (se reinicia antes de ejecutar)
+            capture: Uno de CAPTURE_MODES
+        """
+        global_vars = CodeExecutor.make_globals(dataset_value, global_vars)
         
-        try:
-            start_time = time.perf_counter()
-            exec(code, global_vars)
-            end_time = time.perf_counter()
+        with CodeExecutor.capture(capture) as captured_output:
+            try:
+                start_time = time.perf_counter()
+                exec(compiled, global_vars)
+                end_time = time.perf_counter()
+                
+                execution_time = end_time - start_time
+                output = captured_output.getvalue()
+                
+                return {
+                    'success': True,
+                    'time': execution_time,
+                    'output': output,
+                    'error': None
+                }
             
-            execution_time = end_time - start_time
-            output = captured_output.getvalue()
-            
-            return {
-                'success': True,
-                'time': execution_time,
-                'output': output,
-                'error': None
-            }
-        
-        except Exception as e:
-            error_msg = traceback.format_exc()
+            except Exception as e:
+                error_msg = traceback.format_exc()
+                return {
+                    'success': False,
+                    'time': 0,
+                    'output': captured_output.getvalue(),
+                    'error': error_msg
+                }
+    
+    @staticmethod
+    def execute_code(code: str, dataset_value: Any = None, capture: str = CAPTURE_FULL) -> Dict[str, Any]:
+        """Ejecuta el código proporcionado y retorna el tiempo y resultado"""
+        try:
+            compiled = CodeExecutor.compile_cached(code)
+        except SyntaxError:
             return {
                 'success': False,
                 'time': 0,
-                'output': captured_output.getvalue(),
-                'error': error_msg
+                'output': "",
+                'error': traceback.format_exc()
             }
+        return CodeExecutor.execute_compiled(compiled, dataset_value, None, capture)
+    
+    @staticmethod
+    def count_cost(code: str, dataset_value: Any = None) -> Dict[str, Any]:
+        """
+        Ejecuta el código una vez contando su costo determinista (ver CostCounter)
         
-        finally:
-            sys.stdout = old_stdout
+        Se compila aparte, sin el caché, para que ningún otro hilo esté
+        ejecutando los mismos objetos de código mientras se cuentan.
+        
+        Returns:
+            Diccionario con 'success', 'error', 'instructions', 'lines',
+            'calls' y 'backend'
+        """
+        try:
+            compiled = compile(code, '<string>', 'exec')
+        except SyntaxError:
+            return {'success': False, 'error': traceback.format_exc()}
+        
+        outcome = {}
+        counts = CostCounter.count(
+            lambda: outcome.update(
+                CodeExecutor.execute_compiled(compiled, dataset_value, None, CodeExecutor.CAPTURE_DISCARD)
+            ),
+            CostCounter.code_objects(compiled)
+        )
+        return {'success': outcome['success'], 'error': outcome['error'], **counts}
+    
+    @staticmethod
+    def compile_batched(code: str) -> Callable[[int], float]:
+        """
+        Compila el código como cuerpo de un bucle dentro de una función
+        
+        Las variables del código pasan a ser locales de esa función y la
+        salida estándar se descarta mientras corre el lote. Por eso el
+        código con declaraciones 'global' no se acepta: esos nombres ya no
+        estarían en el espacio global y la ejecución fallaría.
+        
+        Returns:
+            Función (iteraciones) -> segundos que tardó el lote completo
+        
+        Raises:
+            SyntaxError: Si el código no puede ir dentro de una función
+        """
+        if any(isinstance(node, ast.Global) for node in ast.walk(ast.parse(code))):
+            raise SyntaxError("'global' requiere ejecutar el código a nivel de módulo")
+        body = textwrap.indent(code, ' ' * 8) if code.strip() else ' ' * 8 + 'pass'
+        compiled = CodeExecutor.compile_cached(CodeExecutor.BATCH_TEMPLATE.format(body=body))
+        namespace = CodeExecutor.make_globals()
+        exec(compiled, namespace)
+        batch = namespace['__batch']
+        timer = time.perf_counter
+        
+        def run(loops: int) -> float:
+            with CodeExecutor.capture(CodeExecutor.CAPTURE_DISCARD):
+                return batch(loops, timer)
+        return run
+    
+    @staticmethod
+    def batch_matches(code: str) -> bool:
+        """
+        Indica si el código corre en un lote igual que ejecutado tal cual
+        
+        Ejecuta una vez el código sin envolver de las dos formas: si tal cual
+        termina bien pero dentro del lote lanza una excepción, medir por lotes
+        cronometraría una ejecución cortada a la mitad.
+        """
+        plain = CodeExecutor.execute_compiled(
+            CodeExecutor.compile_cached(code), None, None, CodeExecutor.CAPTURE_DISCARD
+        )
+        if not plain['success']:
+            return True  # Falla igual en ambos modos
+        try:
+            CodeExecutor.compile_batched(code)(1)
+        except Exception:
+            return False
+        return True
+    
+    @staticmethod
+    def measure_compile_time(code: str, samples: int = COMPILE_SAMPLES) -> Tuple[float, str]:
+        """
+        Mide cuánto tarda compilar el código sin caché (mínimo de varias veces)
+        
+        Returns:
+            Tupla (segundos, mensaje_error)
+        """
+        best = float('inf')
+        try:
+            for _ in range(samples):
+                start = time.perf_counter()
+                compile(code, '<string>', 'exec')
+                best = min(best, time.perf_counter() - start)
+        except SyntaxError as e:
+            return 0.0, str(e)
+        return best, ""
     
     @staticmethod
     def test_code_syntax(code: str) -> Dict[str, Any]:
         """Verifica la sintaxis del código sin ejecutarlo"""
         try:
-            compile(code, '<string>', 'exec')
+            CodeExecutor.compile_cached(code)
             return {'valid': True, 'error': None}
         except SyntaxError as e:
-            return {'valid': False, 'error': str(e)}
\ No newline at end of file
+            return {'valid': False, 'error': str(e)}
@@ -1,8 +1,41 @@
 # complexity_analyzer.py
-import numpy as np
+import contextlib
+import os
+import sys
+import threading
 import time
-from typing import List, Dict, Any, Tuple
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Tuple, Callable, Iterator
 from code_executor import CodeExecutor
+from cost_counter import CostCounter
+from streaming_stats import StreamingStats
+
+# Importar utilidades compartidas desde la raíz
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+from cancellation import CancellationToken, AnalysisCancelled
+
+
+class _LinkedToken:
+    """
+    Token de las tareas en paralelo: se cancela si lo cancela el usuario o
+    si otra tarea falló (así no se sigue midiendo un resultado inútil)
+    """
+    
+    def __init__(self, parent: CancellationToken = None): # type: ignore
+        self.parent = parent
+        self._aborted = threading.Event()
+    
+    def abort(self):
+        self._aborted.set()
+    
+    @property
+    def is_cancelled(self) -> bool:
+        return self._aborted.is_set() or (self.parent is not None and self.parent.is_cancelled)
+    
+    @property
+    def is_paused(self) -> bool:
+        return self.parent is not None and self.parent.is_paused
 
 
 class ComplexityAnalyzer:
@@ -10,73 +43,357 @@ class ComplexityAnalyzer:
     
     SAMPLE_POINTS = 20  # Número de puntos a graficar
     
+    # Modos de medición
+    BATCHED = "por lotes"
+    PER_ITERATION = "por iteración"
+    MODES = [BATCHED, PER_ITERATION]
+    
+    AUTORANGE_TARGET = 0.005  # Duración mínima de un lote (segundos)
+    OVERHEAD_SAMPLES = 5
+    
+    # Cómo se reparten las configuraciones entre procesos
+    ISOLATION = "aislamiento"  # Una medición a la vez: no compiten por la CPU
+    THROUGHPUT = "rendimiento"  # En paralelo: termina antes, pero con más ruido
+    SCHEDULES = [ISOLATION, THROUGHPUT]
+    MIN_SHARD = 5000  # Ejecuciones mínimas por fragmento de una configuración
+    
+    # Modo automático: una configuración puede ser una precisión objetivo
+    # (p. ej. 0.02 para ±2% de la mediana) en vez de un número de ejecuciones
+    MAX_EXECUTIONS = 1000000  # Tope de ejecuciones de una configuración
+    AUTO_BUDGET = 10.0  # Segundos máximos de medición por precisión objetivo
+    AUTO_MIN_MEASUREMENTS = 30  # Mediciones antes de evaluar la precisión
+    CHECK_INTERVAL = 0.05  # Segundos entre evaluaciones de la precisión
+    
+    # Motivos de fin del modo automático
+    STOP_CONVERGED = "precisión alcanzada"
+    STOP_BUDGET = "tiempo agotado"
+    STOP_EXHAUSTED = "tope de ejecuciones"
+    
+    @staticmethod
+    def is_target(config) -> bool:
+        """Si la configuración es una precisión objetivo (y no un número de ejecuciones)"""
+        return isinstance(config, float) and 0 < config < 1
+    
+    @staticmethod
+    def describe_config(config) -> str:
+        """Texto de una configuración: '1,500 ejecuciones' o 'precisión ±2%'"""
+        if ComplexityAnalyzer.is_target(config):
+            return f"precisión ±{config * 100:g}%"
+        return f"{config:,} ejecuciones"
+    
+    @staticmethod
+    def analyze_config(
+        code: str,
+        config,
+        progress_callback=None,
+        cancel_token: CancellationToken = None, # type: ignore
+        mode: str = BATCHED
+    ) -> Dict[str, Any]:
+        """Analiza una configuración: número de ejecuciones o precisión objetivo"""
+        if ComplexityAnalyzer.is_target(config):
+            return ComplexityAnalyzer.analyze_code_execution(
+                code, ComplexityAnalyzer.MAX_EXECUTIONS, progress_callback, cancel_token, mode,
+                target_precision=config
+            )
+        return ComplexityAnalyzer.analyze_code_execution(code, config, progress_callback, cancel_token, mode)
+    
     @staticmethod
     def analyze_code_execution(
         code: str, 
         num_executions: int,
-        progress_callback=None
+        progress_callback=None,
+        cancel_token: CancellationToken = None, # type: ignore
+        mode: str = BATCHED,
+        keep_raw: bool = False,
+        target_precision: float = None, # type: ignore
+        time_budget: float = AUTO_BUDGET
     ) -> Dict[str, Any]:
         """
         Ejecuta el código múltiples veces y mide tiempos
         
+        En modo por lotes (como timeit) el código se compila como cuerpo de
+        un bucle y se ejecuta K veces por cada medición; K se elige con
+        autorange y al tiempo por iteración se le resta el costo del bucle
+        vacío. Si el código no puede ir dentro de una función (p. ej. usa
+        'from x import *' o 'global') o una ejecución de prueba falla solo
+        dentro del lote, se mide iteración por iteración.
+        
+        Con target_precision (modo automático) se ejecuta hasta que el
+        intervalo de confianza del 95% de la mediana tenga un semiancho
+        relativo menor al objetivo, hasta agotar time_budget o hasta
+        num_executions, lo que ocurra primero. El resultado indica las
+        ejecuciones hechas, la precisión lograda y el motivo de fin.
+        
         Args:
             code: Código a ejecutar
-            num_executions: Número de veces a ejecutar
+            num_executions: Número de veces a ejecutar (el tope, en modo automático)
             progress_callback: Callback para reportar progreso
-            
+            cancel_token: Token para pausar o cancelar entre iteraciones
+            mode: BATCHED o PER_ITERATION
+            keep_raw: Conservar todos los tiempos en 'all_times' (arreglo de
+                      NumPy); si no, solo se guardan estadísticas acumuladas
+            target_precision: Semiancho relativo buscado (p. ej. 0.02), o None
+                              para ejecutar exactamente num_executions veces;
+                              no puede ser menor que StreamingStats.PRECISION
+            time_budget: Segundos máximos de medición en modo automático
+        
         Returns:
-            Diccionario con tiempos y puntos muestreados
+            Diccionario con estadísticas, percentiles, puntos muestreados y
+            el acumulador 'stats'. En modo por lotes, cada tiempo es el
+            promedio por iteración de un lote
         """
-        all_times = []
-        sampling_interval = max(1, num_executions // ComplexityAnalyzer.SAMPLE_POINTS)
         sampled_times = []
         sampled_indices = []
         
-        # Preparar código envuelto para medición
+        # Preparar código envuelto para medición; se compila una sola vez y
+        # cada iteración reutiliza el objeto de código y el diccionario de globales
         wrapped_code = ComplexityAnalyzer._prepare_code_for_execution(code)
+        try:
+            compiled = CodeExecutor.compile_cached(wrapped_code)
+        except SyntaxError as e:
+            return {'success': False, 'error': str(e), 'iteration': 0}
+        compile_time, _ = CodeExecutor.measure_compile_time(wrapped_code)
         
-        for i in range(num_executions):
-            # Reportar progreso
-            if progress_callback and i % 10 == 0:
-                progress = (i / num_executions) * 100
-                progress_callback(progress)
-            
-            # Medir tiempo de ejecución
-            start_time = time.perf_counter()
-            result = CodeExecutor.execute_code(wrapped_code, None)
-            end_time = time.perf_counter()
-            
-            if not result['success']:
-                return {
-                    'success': False,
-                    'error': result['error'],
-                    'iteration': i
-                }
-            
-            execution_time = end_time - start_time
-            all_times.append(execution_time)
-            
-            # Muestrear cada N ejecuciones
-            if i % sampling_interval == 0 and len(sampled_times) < ComplexityAnalyzer.SAMPLE_POINTS:
-                sampled_times.append(execution_time)
-                sampled_indices.append(i + 1)
+        batch = None
+        if mode == ComplexityAnalyzer.BATCHED:
+            try:
+                batch = CodeExecutor.compile_batched(wrapped_code)
+                if not CodeExecutor.batch_matches(code):
+                    batch = None
+            except SyntaxError:
+                pass
+            if batch is None:
+                mode = ComplexityAnalyzer.PER_ITERATION
+        
+        auto = target_precision is not None
+        if auto:
+            # El histograma no resuelve semianchos menores que su propia precisión
+            target_precision = max(target_precision, StreamingStats.PRECISION)
+        stop_reason = None
+        precision = 0.0
+        done = 0
+        try:
+            with cancel_token.interruptible() if cancel_token else contextlib.nullcontext():
+                if batch is not None:
+                    empty = CodeExecutor.compile_batched("")
+                    # Como máximo N/20 iteraciones por lote para conservar los 20 puntos
+                    batch_size = ComplexityAnalyzer.autorange(
+                        batch, max(1, num_executions // ComplexityAnalyzer.SAMPLE_POINTS)
+                    )
+                    loop_overhead = ComplexityAnalyzer.loop_overhead(empty, batch_size)
+                    measurements = ComplexityAnalyzer._iter_batches(batch, num_executions, batch_size, loop_overhead)
+                    num_measurements = -(-num_executions // batch_size)
+                else:
+                    batch_size = 1
+                    loop_overhead = 0.0
+                    measurements = ComplexityAnalyzer._iter_single(compiled, num_executions)
+                    num_measurements = num_executions
+                stats = StreamingStats(num_measurements if keep_raw else 0)
+                sampling_interval = max(1, num_measurements // ComplexityAnalyzer.SAMPLE_POINTS)
+                start = next_check = time.perf_counter()
+                
+                for index, (done, execution_time, error) in enumerate(measurements):
+                    if error:
+                        return {
+                            'success': False,
+                            'error': error,
+                            'iteration': done
+                        }
+                    stats.add(execution_time, done)
+                    
+                    if cancel_token:
+                        paused_from = time.perf_counter()
+                        if not cancel_token.checkpoint():
+                            raise AnalysisCancelled()
+                        start += time.perf_counter() - paused_from  # La pausa no consume el presupuesto
+                    
+                    if auto:
+                        # Evaluar la precisión cada CHECK_INTERVAL: requiere recorrer el histograma
+                        now = time.perf_counter()
+                        if now < next_check and done < num_executions:
+                            continue
+                        next_check = now + ComplexityAnalyzer.CHECK_INTERVAL
+                        if stats.count >= ComplexityAnalyzer.AUTO_MIN_MEASUREMENTS:
+                            precision = stats.median_precision()
+                            if precision <= target_precision:
+                                stop_reason = ComplexityAnalyzer.STOP_CONVERGED
+                        if stop_reason is None and now - start >= time_budget:
+                            stop_reason = ComplexityAnalyzer.STOP_BUDGET
+                        if stop_reason is not None:
+                            if progress_callback:
+                                progress_callback(100.0)
+                            break
+                        if progress_callback:
+                            # El semiancho decrece como 1/√n: (objetivo/actual)² estima la fracción hecha
+                            estimate = min(1.0, (target_precision / precision) ** 2) if precision else 0.0
+                            progress_callback(
+                                max(estimate, (now - start) / time_budget, done / num_executions) * 100
+                            )
+                        continue
+                    
+                    # Muestrear cada N mediciones
+                    if index % sampling_interval == 0 and len(sampled_times) < ComplexityAnalyzer.SAMPLE_POINTS:
+                        sampled_times.append(execution_time)
+                        sampled_indices.append(done)
+                    
+                    # Reportar progreso
+                    if progress_callback and (batch is not None or index % 10 == 0):
+                        progress_callback((done / num_executions) * 100)
+        except AnalysisCancelled:
+            return {
+                'success': False,
+                'cancelled': True,
+                'error': "Análisis cancelado por el usuario",
+                'iteration': done
+            }
+        
+        if auto:
+            # Sin saber cuántas mediciones habría, los puntos salen del reservorio
+            points = sorted(stats.reservoir)
+            if points[-1][0] != done:
+                points.append((done, execution_time))
+            sampled = ComplexityAnalyzer._spread(points)
+            sampled_indices = [index for index, _ in sampled]
+            sampled_times = [value for _, value in sampled]
+            return ComplexityAnalyzer.build_result(
+                stats, sampled_times, sampled_indices, done,
+                compile_time=compile_time,
+                mode=mode,
+                batch_size=batch_size,
+                loop_overhead=loop_overhead,
+                target_precision=target_precision,
+                precision=stats.median_precision(),
+                stop_reason=stop_reason or ComplexityAnalyzer.STOP_EXHAUSTED
+            )
         
         # Asegurar que tenemos exactamente 20 puntos
-        if len(sampled_times) < ComplexityAnalyzer.SAMPLE_POINTS:
-            sampled_times.append(all_times[-1])
+        if len(sampled_times) < ComplexityAnalyzer.SAMPLE_POINTS and sampled_indices[-1] != num_executions:
+            sampled_times.append(execution_time)
             sampled_indices.append(num_executions)
         
-        return {
+        return ComplexityAnalyzer.build_result(
+            stats, sampled_times, sampled_indices, num_executions,
+            compile_time=compile_time,
+            mode=mode,
+            batch_size=batch_size,
+            loop_overhead=loop_overhead
+        )
+    
+    @staticmethod
+    def _spread(points: List[Tuple[int, float]]) -> List[Tuple[int, float]]:
+        """Hasta SAMPLE_POINTS puntos repartidos a lo largo de points, conservando el último"""
+        step = max(1.0, len(points) / ComplexityAnalyzer.SAMPLE_POINTS)
+        sampled = [points[int(i * step)] for i in range(min(ComplexityAnalyzer.SAMPLE_POINTS, len(points)))]
+        sampled[-1] = points[-1]
+        return sampled
+    
+    @staticmethod
+    def build_result(
+        stats: StreamingStats,
+        sampled_times: List[float],
+        sampled_indices: List[int],
+        num_executions: int,
+        **extra
+    ) -> Dict[str, Any]:
+        """Diccionario de resultado de una configuración a partir del acumulador"""
+        summary = stats.summary()
+        reservoir_indices, reservoir_times = stats.sample()
+        result = {
             'success': True,
-            'all_times': all_times,
             'sampled_times': sampled_times,
             'sampled_indices': sampled_indices,
+            'reservoir_indices': reservoir_indices,
+            'reservoir_times': reservoir_times,
             'num_executions': num_executions,
-            'avg_time': np.mean(all_times),
-            'std_time': np.std(all_times),
-            'min_time': min(all_times),
-            'max_time': max(all_times)
+            'num_measurements': summary['count'],
+            'avg_time': summary['avg_time'],
+            'std_time': summary['std_time'],
+            'min_time': summary['min_time'],
+            'max_time': summary['max_time'],
+            'percentiles': summary['percentiles'],
+            'stats': stats,
+            **extra
         }
+        if len(stats.raw()):
+            result['all_times'] = stats.raw()
+        if 'compile_time' in extra:
+            result['compile_overhead_pct'] = ComplexityAnalyzer.compile_overhead_pct(
+                extra['compile_time'], summary['avg_time']
+            )
+        return result
+    
+    @staticmethod
+    def _iter_single(compiled, num_executions: int) -> Iterator[Tuple[int, float, str]]:
+        """
+        Una medición por ejecución: (iteraciones hechas, tiempo, error)
+        
+        La salida del código se descarta: nadie la lee y acumularla en cada
+        una de hasta un millón de ejecuciones solo consume memoria.
+        """
+        global_vars = {}
+        for i in range(num_executions):
+            start_time = time.perf_counter()
+            result = CodeExecutor.execute_compiled(compiled, None, global_vars, CodeExecutor.CAPTURE_DISCARD)
+            end_time = time.perf_counter()
+            if not result['success']:
+                yield i, 0.0, result['error']
+                return
+            yield i + 1, end_time - start_time, ""
+    
+    @staticmethod
+    def _iter_batches(
+        batch: Callable[[int], float],
+        num_executions: int,
+        batch_size: int,
+        loop_overhead: float
+    ) -> Iterator[Tuple[int, float, str]]:
+        """
+        Una medición por lote de batch_size iteraciones (el último puede ser
+        más corto): (iteraciones hechas, tiempo por iteración, error)
+        """
+        done = 0
+        while done < num_executions:
+            loops = min(batch_size, num_executions - done)
+            try:
+                elapsed = batch(loops)
+            except Exception:
+                yield done, 0.0, traceback.format_exc()
+                return
+            done += loops
+            yield done, max(elapsed / loops - loop_overhead, 0.0), ""
+    
+    @staticmethod
+    def autorange(batch: Callable[[int], float], max_loops: int) -> int:
+        """
+        Iteraciones por lote, como timeit.Timer.autorange: prueba 1, 2, 5,
+        10, 20, 50... hasta que un lote dure al menos AUTORANGE_TARGET
+        (sin pasar de max_loops)
+        """
+        loops = 1
+        while True:
+            for factor in (1, 2, 5):
+                candidate = loops * factor
+                if candidate >= max_loops:
+                    return max(max_loops, 1)
+                if batch(candidate) >= ComplexityAnalyzer.AUTORANGE_TARGET:
+                    return candidate
+            loops *= 10
+    
+    @staticmethod
+    def loop_overhead(empty: Callable[[int], float], loops: int) -> float:
+        """Costo por iteración del bucle vacío (mínimo de varias mediciones)"""
+        return min(empty(loops) for _ in range(ComplexityAnalyzer.OVERHEAD_SAMPLES)) / loops
+    
+    @staticmethod
+    def compile_overhead_pct(compile_time: float, avg_time: float) -> float:
+        """
+        Porcentaje del tiempo por iteración que antes era compilación
+        
+        Antes cada iteración compilaba el código, así que su tiempo era
+        aproximadamente compile_time + avg_time.
+        """
+        total = compile_time + avg_time
+        return compile_time / total * 100 if total > 0 else 0.0
     
     @staticmethod
     def _prepare_code_for_execution(code: str) -> str:
@@ -98,7 +415,7 @@ try:
     
     # Ejecutar código del usuario
 {ComplexityAnalyzer._indent_code(code, 4)}
-except:
+except Exception:
     # Si hay error, simplemente hacer una operación trivial
     pass
 """
@@ -114,19 +431,56 @@ except:
     def analyze_multiple_executions(
         code: str,
         execution_configs: List[int],
-        progress_callback=None
+        progress_callback=None,
+        cancel_token: CancellationToken = None, # type: ignore
+        mode: str = BATCHED,
+        pool=None,
+        schedule: str = ISOLATION,
+        count_cost: bool = False
     ) -> Dict[int, Dict[str, Any]]:
         """
         Analiza código con múltiples configuraciones de ejecución
         
         Args:
             code: Código a analizar
-            execution_configs: Lista de números de ejecuciones [700, 1500, 3000]
+            execution_configs: Números de ejecuciones [700, 1500, 3000] o
+                               precisiones objetivo [0.05, 0.02, 0.01]
             progress_callback: Callback para progreso
-            
+            cancel_token: Token para pausar o cancelar entre iteraciones
+            mode: BATCHED o PER_ITERATION
+            pool: SandboxPool opcional; si se indica, cada configuración corre
+                  en un proceso aislado con tiempo límite y límites de recursos
+            schedule: ISOLATION (una configuración tras otra) o THROUGHPUT
+                      (configuraciones y fragmentos en paralelo; requiere pool)
+            count_cost: Contar además el costo determinista de una ejecución
+                        (ver measure_cost); queda en 'cost'
+        
         Returns:
             Diccionario con resultados por configuración
         """
+        if schedule == ComplexityAnalyzer.THROUGHPUT and pool is not None:
+            outcome = ComplexityAnalyzer._analyze_parallel(
+                code, execution_configs, progress_callback, cancel_token, mode, pool
+            )
+        else:
+            outcome = ComplexityAnalyzer._analyze_sequential(
+                code, execution_configs, progress_callback, cancel_token, mode, pool
+            )
+        
+        if count_cost and outcome['success']:
+            outcome['cost'] = ComplexityAnalyzer.measure_cost(code, pool, cancel_token) # type: ignore
+        return outcome
+    
+    @staticmethod
+    def _analyze_sequential(
+        code: str,
+        execution_configs: List[int],
+        progress_callback,
+        cancel_token: CancellationToken,
+        mode: str,
+        pool
+    ) -> Dict[int, Dict[str, Any]]:
+        """Corre las configuraciones una tras otra (en el pool, si se indica)"""
         results = {}
         total_configs = len(execution_configs)
         
@@ -136,15 +490,21 @@ except:
                 if progress_callback:
                     progress_callback(overall_progress, num_exec, progress)
             
-            result = ComplexityAnalyzer.analyze_code_execution(
-                code,
-                num_exec,
-                config_progress
-            )
+            if pool is not None:
+                result = pool.analyze(code, num_exec, mode, config_progress, cancel_token)
+            else:
+                result = ComplexityAnalyzer.analyze_config(
+                    code,
+                    num_exec,
+                    config_progress,
+                    cancel_token,
+                    mode
+                )
             
             if not result['success']:
                 return {
                     'success': False,
+                    'cancelled': result.get('cancelled', False),
                     'error': result['error'],
                     'failed_config': num_exec
                 } # type: ignore
@@ -156,6 +516,143 @@ except:
             'results': results
         } # type: ignore
     
+    @staticmethod
+    def measure_cost(code: str, pool=None, cancel_token: CancellationToken = None) -> Dict[str, Any]: # type: ignore
+        """
+        Costo determinista de una ejecución del código (ver CostCounter)
+        
+        Se descuenta lo que cuesta el envoltorio de _prepare_code_for_execution
+        (las variables de relleno), así que se cuenta solo el código del usuario.
+        
+        Returns:
+            Mismo formato que CodeExecutor.count_cost
+        """
+        def count(source: str) -> Dict[str, Any]:
+            if pool is not None:
+                return pool.count_cost(source, cancel_token)
+            return CodeExecutor.count_cost(source)
+        
+        cost = count(ComplexityAnalyzer._prepare_code_for_execution(code))
+        if not cost['success']:
+            return cost
+        wrapper = count(ComplexityAnalyzer._prepare_code_for_execution(""))
+        if wrapper['success']:
+            for key in CostCounter.KEYS:
+                cost[key] = max(0, cost[key] - wrapper[key])
+        return cost
+    
+    @staticmethod
+    def shard_sizes(num_executions: int, workers: int) -> List[int]:
+        """Reparte una configuración en fragmentos de al menos MIN_SHARD ejecuciones"""
+        if ComplexityAnalyzer.is_target(num_executions):
+            return [num_executions]  # La precisión se evalúa sobre todas las mediciones juntas
+        shards = max(1, min(workers, num_executions // ComplexityAnalyzer.MIN_SHARD))
+        base, extra = divmod(num_executions, shards)
+        return [base + (i < extra) for i in range(shards)]
+    
+    @staticmethod
+    def _analyze_parallel(
+        code: str,
+        execution_configs: List[int],
+        progress_callback,
+        cancel_token: CancellationToken,
+        mode: str,
+        pool
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Corre las configuraciones (y fragmentos de las grandes) a la vez en
+        los trabajadores del pool y une los resultados de cada una
+        
+        El progreso se reporta por configuración desde varios hilos.
+        Las precisiones objetivo no se fragmentan.
+        """
+        configs = list(dict.fromkeys(execution_configs))
+        shards = {n: ComplexityAnalyzer.shard_sizes(n, pool.num_workers) for n in configs}
+        tasks = [(n, index, size) for n in configs for index, size in enumerate(shards[n])]
+        # Peso de cada tarea en el progreso: sus ejecuciones, o 1 si es una precisión objetivo
+        weights = {task: 1.0 if ComplexityAnalyzer.is_target(task[2]) else task[2] for task in tasks}
+        done = {task: 0.0 for task in tasks}  # Parte completada de cada peso
+        total = sum(weights.values())
+        lock = threading.Lock()
+        token = _LinkedToken(cancel_token)
+        
+        def run(task):
+            num_exec, _, size = task
+            
+            def shard_progress(percent):
+                with lock:
+                    done[task] = weights[task] * percent / 100
+                    config_tasks = [(num_exec, i, s) for i, s in enumerate(shards[num_exec])]
+                    config_done = sum(done[t] for t in config_tasks) / sum(weights[t] for t in config_tasks)
+                    overall = sum(done.values()) / total * 100
+                if progress_callback:
+                    progress_callback(overall, num_exec, config_done * 100)
+            
+            result = pool.analyze(code, size, mode, shard_progress, token)
+            if result['success']:
+                shard_progress(100.0)
+            else:
+                token.abort()
+            return result
+        
+        with ThreadPoolExecutor(max_workers=pool.num_workers) as executor:
+            results = dict(zip(tasks, executor.map(run, tasks)))
+        
+        failures = [(task, result) for task, result in results.items() if not result['success']]
+        if failures:
+            # Un error real tiene prioridad sobre las tareas que se abortaron por él
+            errors = [failure for failure in failures if not failure[1].get('cancelled')]
+            task, result = (errors or failures)[0]
+            return {
+                'success': False,
+                'cancelled': not errors,
+                'error': result['error'],
+                'failed_config': task[0]
+            } # type: ignore
+        
+        return {
+            'success': True,
+            'results': {
+                n: ComplexityAnalyzer.merge_results(
+                    [results[(n, index, size)] for index, size in enumerate(shards[n])], n
+                ) if len(shards[n]) > 1 else results[(n, 0, shards[n][0])]
+                for n in configs
+            }
+        } # type: ignore
+    
+    @staticmethod
+    def merge_results(parts: List[Dict[str, Any]], num_executions: int) -> Dict[str, Any]:
+        """
+        Une los resultados de los fragmentos de una configuración
+        
+        Los índices de cada fragmento se desplazan como si los fragmentos
+        hubieran corrido uno tras otro.
+        """
+        stats = StreamingStats(reservoir_size=parts[0]['stats'].reservoir_size)
+        points = []
+        offset = 0
+        for part in parts:
+            stats.merge(part['stats'])
+            points.extend(
+                (offset + index, value) for index, value in zip(part['sampled_indices'], part['sampled_times'])
+            )
+            offset += part['num_executions']
+        
+        # Volver a SAMPLE_POINTS puntos repartidos, conservando el último
+        sampled = ComplexityAnalyzer._spread(points)
+        
+        return ComplexityAnalyzer.build_result(
+            stats,
+            [value for _, value in sampled],
+            [index for index, _ in sampled],
+            num_executions,
+            compile_time=parts[0]['compile_time'],
+            mode=parts[0]['mode'],
+            batch_size=max(part['batch_size'] for part in parts),
+            loop_overhead=sum(part['loop_overhead'] for part in parts) / len(parts),
+            shards=len(parts)
+        )
+    
     @staticmethod
     def format_time(seconds: float) -> str:
         """Formatea el tiempo de ejecución de manera legible"""
@@ -1,8 +1,12 @@
 # complexity_detector.py
 import ast
-import numpy as np
+import sys
+import os
 from typing import List, Dict, Any
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+from complexity_fitter import ComplexityFitter
+
 
 class ComplexityDetector:
     """Detecta la complejidad temporal mediante análisis estático del código"""
@@ -283,27 +287,8 @@ class ComplexityDetector:
     
     @staticmethod
     def estimate_complexity_from_data(sizes: List[int], times: List[float]) -> str:
-        """Estima la complejidad analizando los datos empíricos"""
-        if len(sizes) < 3:
-            return "Datos insuficientes"
-        
-        ratios = []
-        for i in range(1, len(sizes)):
-            size_ratio = sizes[i] / sizes[i-1]
-            time_ratio = times[i] / times[i-1] if times[i-1] > 0 else 0
-            if time_ratio > 0:
-                ratios.append(time_ratio / size_ratio)
-        
-        if not ratios:
-            return "O(1)"
-        
-        avg_ratio = np.mean(ratios)
-        
-        if avg_ratio < 1.5:
-            return "O(n) o O(log n)"
-        elif avg_ratio < 3:
-            return "O(n log n)"
-        elif avg_ratio < 10:
-            return "O(n²)"
-        else:
-            return "O(n³) o mayor"
\ No newline at end of file
+        """Estima la complejidad ajustando modelos a los datos empíricos"""
+        fit = ComplexityFitter.fit(sizes, times)
+        if not fit['success']:
+            return fit['error']
+        return fit['notation']
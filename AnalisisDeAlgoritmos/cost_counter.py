@@ -0,0 +1,148 @@
+# cost_counter.py
+import sys
+import threading
+from types import CodeType
+from typing import Any, Callable, Dict, List, Optional
+
+
+class CostCounter:
+    """
+    Costo determinista del código del usuario: instrucciones de bytecode,
+    líneas y llamadas ejecutadas
+    
+    A diferencia del tiempo, los conteos no dependen de la carga de la
+    máquina: se repiten igual en cada corrida (con el mismo intérprete), y
+    con unos pocos tamaños chicos alcanzan para ajustar la complejidad.
+    
+    En Python 3.12+ se usa sys.monitoring con eventos locales activados
+    solo en los objetos de código del usuario; el resto (la aplicación,
+    las bibliotecas) corre sin instrumentar. En versiones anteriores se usa
+    sys.settrace con eventos por opcode, también limitado a los marcos del
+    usuario: cuenta lo mismo, pero es bastante más lento. Cada evento solo
+    incrementa un contador, sin guardar nada por línea ni por función.
+    """
+    
+    MONITORING = "sys.monitoring"
+    SETTRACE = "sys.settrace"
+    BACKEND = MONITORING if hasattr(sys, 'monitoring') else SETTRACE
+    
+    # Cuántas veces más lenta es una llamada contada que una sin contar
+    # (aproximado: depende de la densidad de instrucciones del código)
+    OVERHEADS = {MONITORING: 10.0, SETTRACE: 50.0}
+    OVERHEAD = OVERHEADS[BACKEND]
+    
+    TOOL_NAME = "analisis_de_algoritmos"
+    KEYS = ('instructions', 'lines', 'calls')
+    
+    # Un conteo a la vez por proceso: sys.monitoring y settrace son globales
+    # al intérprete. Los hilos que cuentan en paralelo se esperan entre sí;
+    # para contar en paralelo hay que hacerlo en procesos separados (SandboxPool)
+    _lock = threading.Lock()
+    
+    @staticmethod
+    def code_objects(code: CodeType) -> List[CodeType]:
+        """El objeto de código y todos los anidados (funciones, clases, comprensiones)"""
+        found = []
+        pending = [code]
+        while pending:
+            current = pending.pop()
+            found.append(current)
+            pending.extend(const for const in current.co_consts if isinstance(const, CodeType))
+        return found
+    
+    @staticmethod
+    def count(func: Callable[[], Any], codes: List[CodeType]) -> Dict[str, Any]:
+        """
+        Llama a func() contando los eventos de los objetos de código indicados
+        
+        Las excepciones de func se propagan (el conteo se desactiva igual).
+        
+        Args:
+            func: Función sin argumentos que ejecuta el código del usuario
+            codes: Objetos de código a contar (ver code_objects)
+        
+        Returns:
+            Diccionario con 'instructions', 'lines', 'calls' y 'backend'
+        """
+        counts = [0, 0, 0]  # Instrucciones, líneas, llamadas
+        with CostCounter._lock:
+            tool = CostCounter._claim_tool() if CostCounter.BACKEND == CostCounter.MONITORING else None
+            if tool is not None:
+                backend = CostCounter.MONITORING
+                CostCounter._count_monitoring(func, codes, counts, tool)
+            else:
+                backend = CostCounter.SETTRACE
+                CostCounter._count_settrace(func, codes, counts)
+        return {
+            'instructions': counts[0],
+            'lines': counts[1],
+            'calls': counts[2],
+            'backend': backend
+        }
+    
+    @staticmethod
+    def _claim_tool() -> Optional[int]:
+        """Identificador libre de sys.monitoring (None si están todos ocupados)"""
+        monitoring = sys.monitoring # type: ignore
+        for tool in (monitoring.PROFILER_ID, 3, 4):
+            if monitoring.get_tool(tool) is None:
+                monitoring.use_tool_id(tool, CostCounter.TOOL_NAME)
+                return tool
+        return None
+    
+    @staticmethod
+    def _count_monitoring(func: Callable[[], Any], codes: List[CodeType], counts: List[int], tool: int):
+        monitoring = sys.monitoring # type: ignore
+        events = monitoring.events
+        
+        def on_instruction(code, offset):
+            counts[0] += 1
+        
+        def on_line(code, line):
+            counts[1] += 1
+        
+        def on_start(code, offset):
+            counts[2] += 1
+        
+        callbacks = {
+            events.INSTRUCTION: on_instruction,
+            events.LINE: on_line,
+            events.PY_START: on_start
+        }
+        try:
+            for event, callback in callbacks.items():
+                monitoring.register_callback(tool, event, callback)
+            for code in codes:
+                monitoring.set_local_events(tool, code, events.INSTRUCTION | events.LINE | events.PY_START)
+            func()
+        finally:
+            for code in codes:
+                monitoring.set_local_events(tool, code, events.NO_EVENTS)
+            for event in callbacks:
+                monitoring.register_callback(tool, event, None)
+            monitoring.free_tool_id(tool)
+    
+    @staticmethod
+    def _count_settrace(func: Callable[[], Any], codes: List[CodeType], counts: List[int]):
+        targets = set(codes)
+        
+        def trace_local(frame, event, arg):
+            if event == 'opcode':
+                counts[0] += 1
+            elif event == 'line':
+                counts[1] += 1
+            return trace_local
+        
+        def trace_call(frame, event, arg):
+            if frame.f_code not in targets:
+                return None  # Fuera del código del usuario no se traza
+            counts[2] += 1
+            frame.f_trace_opcodes = True
+            return trace_local
+        
+        previous = sys.gettrace()
+        sys.settrace(trace_call)
+        try:
+            func()
+        finally:
+            sys.settrace(previous)
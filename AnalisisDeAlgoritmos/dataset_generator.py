@@ -1,14 +1,91 @@
 # dataset_generator.py
-import os
+import hashlib
 import json
-import string
-from typing import List, Any
+import os
+import sys
+import tempfile
+import numpy as np
+from collections.abc import Sequence
+from typing import List, Dict, Any, Iterator, Tuple
+
+from string_generator import StringBatch, StringGenerator
+from input_families import InputFamilies
+
+
+class ShardedDataset(Sequence):
+    """
+    Secuencia perezosa de los conjuntos guardados de un tipo
+    
+    Cada tamaño vive en su propio fragmento binario; se abre mapeado en
+    memoria recién cuando se pide, así obtener el conjunto más chico no
+    obliga a leer los más grandes.
+    """
+    
+    def __init__(self, data_type: str, index: Dict[str, Any]):
+        self.data_type = data_type
+        self.index = index
+        self.sizes = [shard['size'] for shard in index['shards']]
+    
+    def __len__(self) -> int:
+        return len(self.sizes)
+    
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        shard = self.index['shards'][i]
+        return DatasetGenerator.read_shard(self.data_type, shard)
+    
+    def batch(self, i: int) -> StringBatch:
+        """Conjunto de strings i sin decodificar (para tipos numéricos, una lista)"""
+        return DatasetGenerator.read_shard(self.data_type, self.index['shards'][i], lazy=True) # type: ignore
+    
+    def for_size(self, size: int) -> List[Any]:
+        """Conjunto de un tamaño dado (KeyError si no está guardado)"""
+        if size not in self.sizes:
+            raise KeyError(f"No hay conjunto de tamaño {size} para '{self.data_type}'")
+        return self[self.sizes.index(size)]
 
 
 class DatasetGenerator:
-    """Genera y gestiona conjuntos de datos de diferentes tipos"""
+    """
+    Genera y gestiona conjuntos de datos de diferentes tipos
+    
+    Los conjuntos se guardan en datasets/<tipo>/ como un fragmento binario
+    por tamaño (.npy para números; desplazamientos + bytes para strings) y
+    un índice index.json. El índice lleva la versión del formato y un hash
+    de la configuración del generador: si no coinciden, el caché se
+    considera viejo y se regenera. Las familias estructuradas (grafos,
+    matrices, árboles...) usan el mismo formato, pero cada tamaño se genera
+    y se agrega al índice recién cuando se pide. Cada archivo se escribe en un temporal y
+    se reemplaza de forma atómica, y el índice se escribe al final, por lo
+    que una interrupción nunca deja un caché a medio escribir.
+    """
+    
+    # Junto al módulo, no relativo al directorio de trabajo: así todas las
+    # aplicaciones comparten el mismo caché sin importar desde dónde se lancen.
+    # En el ejecutable empaquetado el módulo vive en un directorio temporal
+    # que se borra al salir, así que ahí se usa el directorio de trabajo
+    DATASET_DIR = (
+        "datasets" if getattr(sys, 'frozen', False)
+        else os.path.join(os.path.dirname(os.path.abspath(__file__)), "datasets")
+    )
+    INDEX_FILE = "index.json"
+    FORMAT_VERSION = 1
+    NUM_DATASETS = 15
+    SEED = 0
     
-    DATASET_DIR = "datasets"
+    # Versión de cada generador: cambiarla invalida los cachés de ese tipo
+    GENERATOR_VERSIONS = {
+        'int': 1,
+        'float': 1,
+        'string': 2,
+    }
+    FAMILY_VERSION = 1
+    
+    NUMERIC_DTYPES = {
+        'int': np.int64,
+        'float': np.float64,
+    }
     
     @staticmethod
     def ensure_dataset_dir():
@@ -16,75 +93,284 @@ class DatasetGenerator:
             os.makedirs(DatasetGenerator.DATASET_DIR)
     
     @staticmethod
-    def generate_int_dataset(max_size: int = 15) -> List[List[int]]:
-        """Genera conjuntos de enteros escalables"""
-        datasets = []
+    def dataset_sizes(max_size: int = NUM_DATASETS) -> List[int]:
+        """Tamaños crecientes de los conjuntos: cada uno es 2.5 veces el anterior"""
+        sizes = []
         size = 1
         for i in range(max_size):
-            data = list(range(size))
-            datasets.append(data)
+            sizes.append(size)
             size = size * 2 + size // 2
-        return datasets
+        return sizes
     
     @staticmethod
-    def generate_float_dataset(max_size: int = 15) -> List[List[float]]:
+    def generate_int_dataset(max_size: int = NUM_DATASETS) -> List[List[int]]:
+        """Genera conjuntos de enteros escalables"""
+        return [list(range(size)) for size in DatasetGenerator.dataset_sizes(max_size)]
+    
+    @staticmethod
+    def generate_float_dataset(max_size: int = NUM_DATASETS) -> List[List[float]]:
         """Genera conjuntos de flotantes escalables"""
-        datasets = []
-        size = 1
-        for i in range(max_size):
-            data = [float(x) * 1.5 for x in range(size)]
-            datasets.append(data)
-            size = size * 2 + size // 2
-        return datasets
+        return [
+            [float(x) * 1.5 for x in range(size)]
+            for size in DatasetGenerator.dataset_sizes(max_size)
+        ]
     
     @staticmethod
-    def generate_string_dataset(max_size: int = 15) -> List[List[str]]:
-        """Genera conjuntos de strings escalables"""
-        datasets = []
-        size = 1
-        chars = string.ascii_lowercase
-        for i in range(max_size):
-            data = []
-            for j in range(size):
-                str_len = (j % 10) + 1
-                random_str = ''.join([chars[(j * k) % len(chars)] for k in range(str_len)])
-                data.append(random_str)
-            datasets.append(data)
-            size = size * 2 + size // 2
-        return datasets
+    def generate_string_dataset(max_size: int = NUM_DATASETS, seed: int = SEED) -> List[StringBatch]:
+        """Genera conjuntos de strings aleatorios (longitud 1 a 10) escalables"""
+        return [
+            StringGenerator.generate(size, seed, index)
+            for index, size in enumerate(DatasetGenerator.dataset_sizes(max_size))
+        ]
+    
+    @staticmethod
+    def type_dir(data_type: str) -> str:
+        return os.path.join(DatasetGenerator.DATASET_DIR, data_type)
+    
+    @staticmethod
+    def config_hash(data_type: str, extra: Dict[str, Any] = None) -> str: # type: ignore
+        """Hash de todo lo que determina el contenido del caché de un tipo"""
+        config = {
+            'format': DatasetGenerator.FORMAT_VERSION,
+            'type': data_type,
+            'generator': DatasetGenerator.GENERATOR_VERSIONS.get(data_type, 0),
+            **(extra or {})
+        }
+        return hashlib.sha256(json.dumps(config, sort_keys=True).encode()).hexdigest()[:16]
+    
+    @staticmethod
+    def _atomic_write(path: str, write):
+        """
+        Escribe un archivo mediante un temporal en el mismo directorio y
+        os.replace, así el destino queda completo o no cambia
+        
+        Args:
+            path: Archivo destino
+            write: Función que recibe el archivo temporal abierto en binario
+        """
+        directory = os.path.dirname(path) or "."
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                write(f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    
+    @staticmethod
+    def _write_shard(data_type: str, data: List[Any], config_hash: str) -> Dict[str, Any]:
+        """Guarda un conjunto como fragmento binario y retorna su entrada del índice"""
+        if data_type in DatasetGenerator.NUMERIC_DTYPES:
+            arrays = {'values': np.asarray(data, dtype=DatasetGenerator.NUMERIC_DTYPES[data_type])}
+        else:
+            batch = data if isinstance(data, StringBatch) else StringBatch.from_strings(data)
+            arrays = {
+                'offsets': batch.offsets - batch.offsets[0],
+                'bytes': batch.buffer[batch.offsets[0]:batch.offsets[-1]]
+            }
+        return DatasetGenerator._write_arrays(data_type, len(data), arrays, config_hash)
+    
+    @staticmethod
+    def _write_arrays(data_type: str, size: int, arrays: Dict[str, np.ndarray], config_hash: str) -> Dict[str, Any]:
+        """Guarda cada arreglo como .npy y retorna la entrada del índice del fragmento"""
+        directory = DatasetGenerator.type_dir(data_type)
+        stem = f"n{size}-{config_hash}"
+        shard = {'size': size, 'files': {}}
+        for name, array in arrays.items():
+            filename = f"{stem}.{name}.npy"
+            DatasetGenerator._atomic_write(
+                os.path.join(directory, filename),
+                lambda f, array=array: np.save(f, array, allow_pickle=False)
+            )
+            shard['files'][name] = filename
+        return shard
+    
+    @staticmethod
+    def read_arrays(data_type: str, shard: Dict[str, Any]) -> Dict[str, np.ndarray]:
+        """Abre los arreglos de un fragmento mapeados en memoria (solo lectura)"""
+        directory = DatasetGenerator.type_dir(data_type)
+        return {
+            name: np.load(os.path.join(directory, filename), mmap_mode='r', allow_pickle=False)
+            for name, filename in shard['files'].items()
+        }
+    
+    @staticmethod
+    def read_shard(data_type: str, shard: Dict[str, Any], lazy: bool = False) -> List[Any]:
+        """
+        Lee un fragmento mapeado en memoria y lo convierte en lista
+        
+        Con lazy=True los strings se retornan como StringBatch sin decodificar
+        """
+        arrays = DatasetGenerator.read_arrays(data_type, shard)
+        if 'values' in arrays:
+            return arrays['values'].tolist()
+        
+        batch = StringBatch(arrays['bytes'], arrays['offsets'])
+        return batch if lazy else batch.tolist() # type: ignore
     
     @staticmethod
     def save_dataset(data_type: str, datasets: List[List[Any]]):
-        """Guarda el conjunto de datos en archivo JSON"""
-        DatasetGenerator.ensure_dataset_dir()
-        filename = os.path.join(DatasetGenerator.DATASET_DIR, f"{data_type}.json")
-        with open(filename, 'w') as f:
-            json.dump(datasets, f)
+        """Guarda cada conjunto como fragmento binario y luego el índice"""
+        directory = DatasetGenerator.type_dir(data_type)
+        os.makedirs(directory, exist_ok=True)
+        config_hash = DatasetGenerator.config_hash(data_type)
+        
+        index = {
+            'format_version': DatasetGenerator.FORMAT_VERSION,
+            'type': data_type,
+            'hash': config_hash,
+            'shards': [DatasetGenerator._write_shard(data_type, data, config_hash) for data in datasets]
+        }
+        DatasetGenerator._write_index(data_type, index)
+    
+    @staticmethod
+    def _write_index(data_type: str, index: Dict[str, Any]):
+        """Escribe el índice de forma atómica y borra los fragmentos que ya no referencia"""
+        directory = DatasetGenerator.type_dir(data_type)
+        DatasetGenerator._atomic_write(
+            os.path.join(directory, DatasetGenerator.INDEX_FILE),
+            lambda f: f.write(json.dumps(index, indent=1).encode('utf-8'))
+        )
+        
+        # Borrar fragmentos de versiones anteriores que ya no figuran en el índice
+        referenced = {name for shard in index['shards'] for name in shard['files'].values()}
+        referenced.add(DatasetGenerator.INDEX_FILE)
+        for filename in os.listdir(directory):
+            if filename not in referenced and not filename.startswith(".tmp-"):
+                os.remove(os.path.join(directory, filename))
     
     @staticmethod
-    def load_dataset(data_type: str) -> List[List[Any]]:
-        """Carga el conjunto de datos desde archivo JSON"""
-        filename = os.path.join(DatasetGenerator.DATASET_DIR, f"{data_type}.json")
-        if os.path.exists(filename):
-            with open(filename, 'r') as f:
-                return json.load(f)
-        return None # type: ignore
+    def load_index(data_type: str, config_hash: str = None) -> Dict[str, Any]: # type: ignore
+        """
+        Lee el índice de un tipo
+        
+        Args:
+            data_type: Tipo de dato o clave de familia
+            config_hash: Hash esperado (por defecto, el del tipo)
+        
+        Returns:
+            El índice, o None si no existe, está dañado o es de otra versión
+        """
+        path = os.path.join(DatasetGenerator.type_dir(data_type), DatasetGenerator.INDEX_FILE)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return None # type: ignore
+        
+        if (index.get('format_version') != DatasetGenerator.FORMAT_VERSION
+                or index.get('hash') != (config_hash or DatasetGenerator.config_hash(data_type))):
+            return None # type: ignore
+        directory = DatasetGenerator.type_dir(data_type)
+        for shard in index.get('shards', []):
+            if not all(os.path.exists(os.path.join(directory, f)) for f in shard['files'].values()):
+                return None # type: ignore
+        return index
     
     @staticmethod
-    def get_or_create_dataset(data_type: str) -> List[List[Any]]:
+    def load_dataset(data_type: str) -> ShardedDataset:
+        """Abre el caché de un tipo sin leer los datos (None si no hay uno válido)"""
+        index = DatasetGenerator.load_index(data_type)
+        if index is None:
+            return None # type: ignore
+        return ShardedDataset(data_type, index)
+    
+    @staticmethod
+    def load_size(data_type: str, size: int) -> List[Any]:
+        """Carga solo el conjunto de un tamaño (None si no está en el caché)"""
+        dataset = DatasetGenerator.load_dataset(data_type)
+        if dataset is None or size not in dataset.sizes:
+            return None # type: ignore
+        return dataset.for_size(size)
+    
+    @staticmethod
+    def get_or_create_dataset(data_type: str) -> ShardedDataset:
         """Obtiene o crea un conjunto de datos"""
         dataset = DatasetGenerator.load_dataset(data_type)
         if dataset is not None:
             return dataset
         
         if data_type == "int":
-            dataset = DatasetGenerator.generate_int_dataset()
+            datasets = DatasetGenerator.generate_int_dataset()
         elif data_type == "float":
-            dataset = DatasetGenerator.generate_float_dataset()
+            datasets = DatasetGenerator.generate_float_dataset()
         elif data_type == "string":
-            dataset = DatasetGenerator.generate_string_dataset()
+            datasets = DatasetGenerator.generate_string_dataset()
         else:
             raise ValueError(f"Tipo de dato no soportado: {data_type}")
         
-        DatasetGenerator.save_dataset(data_type, dataset)
-        return dataset
\ No newline at end of file
+        DatasetGenerator.save_dataset(data_type, datasets)
+        return DatasetGenerator.load_dataset(data_type)
+    
+    @staticmethod
+    def family_hash(family: str, seed: int, params: Dict[str, Any] = None) -> str: # type: ignore
+        """Hash de la configuración de una familia (semilla y parámetros incluidos)"""
+        return DatasetGenerator.config_hash(InputFamilies.KEYS[family], {
+            'family_version': DatasetGenerator.FAMILY_VERSION,
+            'seed': seed,
+            'params': InputFamilies.params_for(family, params)
+        })
+    
+    @staticmethod
+    def load_family_arrays(
+        family: str,
+        size: int,
+        seed: int = SEED,
+        params: Dict[str, Any] = None # type: ignore
+    ) -> Dict[str, np.ndarray]:
+        """
+        Arreglos de una familia para un tamaño, generándolos si no están en caché
+        
+        Si el índice existente es de otra semilla, parámetros o versión, se
+        descarta y se empieza uno nuevo.
+        
+        Returns:
+            Diccionario nombre -> arreglo mapeado en memoria
+        """
+        key = InputFamilies.KEYS[family]
+        config_hash = DatasetGenerator.family_hash(family, seed, params)
+        index = DatasetGenerator.load_index(key, config_hash)
+        if index is None:
+            index = {
+                'format_version': DatasetGenerator.FORMAT_VERSION,
+                'type': key,
+                'hash': config_hash,
+                'shards': []
+            }
+        
+        for shard in index['shards']:
+            if shard['size'] == size:
+                return DatasetGenerator.read_arrays(key, shard)
+        
+        os.makedirs(DatasetGenerator.type_dir(key), exist_ok=True)
+        arrays = InputFamilies.generate(family, size, seed, params)
+        shard = DatasetGenerator._write_arrays(key, size, arrays, config_hash)
+        index['shards'] = sorted(index['shards'] + [shard], key=lambda s: s['size'])
+        DatasetGenerator._write_index(key, index)
+        return DatasetGenerator.read_arrays(key, shard)
+    
+    @staticmethod
+    def load_family(
+        family: str,
+        size: int,
+        seed: int = SEED,
+        params: Dict[str, Any] = None # type: ignore
+    ) -> Dict[str, Any]:
+        """Entrada de una familia lista para pasar a la función del usuario"""
+        arrays = DatasetGenerator.load_family_arrays(family, size, seed, params)
+        return InputFamilies.materialize(family, arrays)
+    
+    @staticmethod
+    def iter_family(
+        family: str,
+        sizes: List[int],
+        seed: int = SEED,
+        params: Dict[str, Any] = None # type: ignore
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Recorre los tamaños de un barrido materializando una entrada a la vez"""
+        for size in sizes:
+            yield size, DatasetGenerator.load_family(family, size, seed, params)
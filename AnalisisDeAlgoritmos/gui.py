@@ -10,9 +10,13 @@ from typing import List, Dict, Any
 
 from complexity_detector import ComplexityDetector
 from code_executor import CodeExecutor
+from cost_counter import CostCounter
 from complexity_analyzer import ComplexityAnalyzer
 from AnalisisDeAlgoritmos.tutorial_helperAdG import TutorialWindow, HelpDialog
 from ejemplos_python import EjemplosWindow
+from size_sweep import SizeSweep
+from input_families import InputFamilies
+from sandbox_pool import SandboxPool
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
@@ -20,6 +24,9 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 from theme import ModernDarkTheme
+from cancellation import CancellationToken
+from progress_channel import ProgressChannel
+from complexity_fitter import ComplexityFitter
 
 
 class TemporalAnalyzerGUI:
@@ -36,8 +43,12 @@ class TemporalAnalyzerGUI:
         self.current_results = None
         self.detected_complexity = None
         self.is_analyzing = False
+        self.cancel_token = None
+        self.progress_channel = None
+        self.sandbox = None  # Procesos aislados, se crean en el primer análisis
         
         # Configuraciones de ejecución
+        self.auto_targets = [0.05, 0.02, 0.01]  # Precisión de la mediana: ±5%, ±2%, ±1%
         self.predefined_configs = [700, 1500, 3000]
 
         self.root.protocol("WM_DELETE_WINDOW", self.on_Closing)
@@ -52,10 +63,18 @@ class TemporalAnalyzerGUI:
                 "Un análisis está en curso. ¿Seguro que deseas salir?"
             ):
                 return
+            self.cancel_token.cancel() # type: ignore
+        self.close_sandbox()
         # Ejecutar callback para volver al menú
         if self.return_callback:
             self.return_callback()
     
+    def close_sandbox(self):
+        """Termina los procesos aislados; se vuelven a crear en el próximo análisis"""
+        if self.sandbox is not None:
+            self.sandbox.close()
+            self.sandbox = None
+    
     def setup_ui(self):
         """Configura la interfaz de usuario"""
         # Panel principal
@@ -198,7 +217,15 @@ def suma(a, b):
         exec_frame = ttk.Frame(control_frame)
         exec_frame.pack(fill=tk.X, pady=5)
         
-        self.exec_mode_var = tk.StringVar(value="predefined")
+        self.exec_mode_var = tk.StringVar(value="auto")
+        
+        ttk.Radiobutton(
+            exec_frame,
+            text="🎯 Automático (precisión ±5%, ±2%, ±1%)",
+            variable=self.exec_mode_var,
+            value="auto",
+            command=self.on_exec_mode_change
+        ).pack(anchor=tk.W, pady=3)
         
         ttk.Radiobutton(
             exec_frame,
@@ -249,6 +276,85 @@ def suma(a, b):
             style='Secondary.TLabel'
         ).pack(pady=5)
         
+        # Modo de medición: por lotes (estilo timeit) o una ejecución por medición
+        self.batched_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(
+            control_frame,
+            text="⚡ Medir por lotes (estilo timeit, descuenta el bucle vacío)",
+            variable=self.batched_var
+        ).pack(anchor=tk.W, pady=3)
+        
+        self.isolated_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(
+            control_frame,
+            text="🛡️ Ejecutar en proceso aislado (tiempo límite y memoria acotada)",
+            variable=self.isolated_var
+        ).pack(anchor=tk.W, pady=3)
+        
+        self.cost_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            control_frame,
+            text=f"🧮 Contar instrucciones (costo determinista, {CostCounter.BACKEND})",
+            variable=self.cost_var
+        ).pack(anchor=tk.W, pady=3)
+        
+        # Configuraciones una tras otra (mediciones sin competencia) o en paralelo
+        schedule_row = ttk.Frame(control_frame)
+        schedule_row.pack(fill=tk.X, pady=3)
+        ttk.Label(schedule_row, text="Configuraciones:").pack(side=tk.LEFT, padx=5)
+        self.schedule_var = tk.StringVar(value=ComplexityAnalyzer.ISOLATION)
+        ttk.Radiobutton(
+            schedule_row,
+            text="🔒 Aislamiento",
+            variable=self.schedule_var,
+            value=ComplexityAnalyzer.ISOLATION
+        ).pack(side=tk.LEFT, padx=5)
+        ttk.Radiobutton(
+            schedule_row,
+            text="🚀 Rendimiento (en paralelo, más ruido)",
+            variable=self.schedule_var,
+            value=ComplexityAnalyzer.THROUGHPUT
+        ).pack(side=tk.LEFT, padx=5)
+        
+        # Tipo de análisis: repetir el mismo código o barrer el tamaño de entrada
+        ttk.Label(control_frame, text="Tipo de Análisis", style='Heading.TLabel').pack(anchor=tk.W, pady=(10, 5))
+        
+        self.analysis_type_var = tk.StringVar(value="repeat")
+        ttk.Radiobutton(
+            control_frame,
+            text="🔁 Repeticiones (tiempo vs. ejecución)",
+            variable=self.analysis_type_var,
+            value="repeat",
+            command=self.on_analysis_type_change
+        ).pack(anchor=tk.W, pady=3)
+        
+        self.sweep_radio = ttk.Radiobutton(
+            control_frame,
+            text="📐 Barrido de n (tiempo vs. tamaño de entrada)",
+            variable=self.analysis_type_var,
+            value="sweep",
+            command=self.on_analysis_type_change
+        )
+        self.sweep_radio.pack(anchor=tk.W, pady=3)
+        
+        self.sweep_frame = ttk.Frame(control_frame)
+        family_row = ttk.Frame(self.sweep_frame)
+        family_row.pack(fill=tk.X, pady=3)
+        ttk.Label(family_row, text="Familia de entradas:").pack(side=tk.LEFT, padx=5)
+        self.family_var = tk.StringVar(value=SizeSweep.AUTO)
+        ttk.Combobox(
+            family_row,
+            textvariable=self.family_var,
+            values=[SizeSweep.AUTO] + InputFamilies.FAMILIES,
+            state='readonly',
+            width=26
+        ).pack(side=tk.LEFT, padx=5)
+        ttk.Label(
+            self.sweep_frame,
+            text="ℹ️  La función se detecta sola o se indica con '# entry: nombre'",
+            style='Secondary.TLabel'
+        ).pack(anchor=tk.W, pady=3)
+        
         # Separator
         separator1 = ttk.Frame(control_frame, height=1)
         separator1.pack(fill=tk.X, pady=10)
@@ -302,6 +408,30 @@ def suma(a, b):
         )
         self.progress_bar.pack(fill=tk.X, pady=5)
         
+        # Una barra por configuración (se crean al iniciar cada análisis)
+        self.config_bars_frame = ttk.Frame(self.progress_frame)
+        self.config_bars_frame.pack(fill=tk.X)
+        self.config_bars = {}
+        
+        # Controles de pausa y cancelación
+        run_controls = ttk.Frame(self.progress_frame)
+        run_controls.pack(fill=tk.X, pady=5)
+        run_controls.grid_columnconfigure(0, weight=1)
+        run_controls.grid_columnconfigure(1, weight=1)
+        
+        self.pause_button = ttk.Button(
+            run_controls,
+            text="⏸ Pausar",
+            command=self.toggle_pause
+        )
+        self.pause_button.grid(row=0, column=0, sticky=tk.EW, padx=(0, 3))
+        
+        ttk.Button(
+            run_controls,
+            text="⏹ Cancelar",
+            command=self.cancel_analysis
+        ).grid(row=0, column=1, sticky=tk.EW, padx=(3, 0))
+        
         # Resultados
         results_header = ttk.Frame(parent)
         results_header.pack(fill=tk.X, padx=5, pady=(10, 2))
@@ -320,6 +450,7 @@ def suma(a, b):
         self.results_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         self.on_exec_mode_change()
+        self.on_analysis_type_change()
     
     def setup_right_panel(self, parent):
         """Configura el panel derecho"""
@@ -378,6 +509,13 @@ def suma(a, b):
         else:
             self.custom_exec_frame.pack_forget()
     
+    def on_analysis_type_change(self):
+        """Muestra la elección de familia solo en el barrido de n"""
+        if self.analysis_type_var.get() == "sweep":
+            self.sweep_frame.pack(fill=tk.X, pady=5, after=self.sweep_radio)
+        else:
+            self.sweep_frame.pack_forget()
+    
     def log_result(self, message: str, clear: bool = False):
         """Escribe en el área de resultados"""
         self.results_text.config(state=tk.NORMAL)
@@ -438,8 +576,10 @@ def suma(a, b):
             self.log_result(f"✗ Error de sintaxis:\n{result['error']}", clear=True)
     
     def get_execution_configs(self) -> List[int]:
-        """Obtiene las configuraciones de ejecución"""
-        if self.exec_mode_var.get() == "predefined":
+        """Obtiene las configuraciones de ejecución (o precisiones objetivo)"""
+        if self.exec_mode_var.get() == "auto":
+            return self.auto_targets # type: ignore
+        elif self.exec_mode_var.get() == "predefined":
             return self.predefined_configs
         else:
             try:
@@ -483,9 +623,16 @@ def suma(a, b):
             return
         
         # Obtener configuraciones
-        configs = self.get_execution_configs()
-        if configs is None:
-            return
+        sweep = self.analysis_type_var.get() == "sweep"
+        if sweep:
+            entry, error = SizeSweep.find_entry(code)
+            if error:
+                messagebox.showerror("Barrido de n", error)
+                return
+        else:
+            configs = self.get_execution_configs()
+            if configs is None:
+                return
         
         # Detectar complejidad
         detector = ComplexityDetector(code)
@@ -495,42 +642,115 @@ def suma(a, b):
         
         # Iniciar análisis en thread
         self.is_analyzing = True
+        self.cancel_token = CancellationToken()
+        self.pause_button.config(text="⏸ Pausar")
         self.progress_frame.pack(fill=tk.X, pady=10)
         self.log_result("🔄 Iniciando análisis...", clear=True)
         
-        thread = threading.Thread(
-            target=self.run_analysis,
-            args=(code, configs),
-            daemon=True
-        )
+        # El hilo de análisis publica el progreso; Tk lo muestra a ~15 Hz
+        self.setup_config_bars([] if sweep else configs)
+        if sweep:
+            self.progress_channel = ProgressChannel(self.root, self.update_sweep_progress).start()
+        else:
+            # Un valor pendiente por configuración: pueden avanzar en paralelo
+            self.progress_channel = ProgressChannel(
+                self.root, self.update_progress, key=lambda args: args[1]
+            ).start()
+        
+        if sweep:
+            self.log_result(f"📐 Barrido de n sobre la función '{entry}'")
+            thread = threading.Thread(
+                target=self.run_sweep,
+                args=(code, self.family_var.get()),
+                daemon=True
+            )
+        else:
+            thread = threading.Thread(
+                target=self.run_analysis,
+                args=(code, configs),
+                daemon=True
+            )
         thread.start()
     
+    def toggle_pause(self):
+        """Pausa o reanuda el análisis en curso"""
+        if not self.is_analyzing or self.cancel_token is None:
+            return
+        if self.cancel_token.is_paused:
+            self.cancel_token.resume()
+            self.pause_button.config(text="⏸ Pausar")
+        else:
+            self.cancel_token.pause()
+            self.pause_button.config(text="▶ Reanudar")
+            self.progress_label.config(text="⏸ En pausa")
+    
+    def cancel_analysis(self):
+        """Cancela el análisis en curso"""
+        if not self.is_analyzing or self.cancel_token is None:
+            return
+        self.cancel_token.cancel()
+        self.progress_label.config(text="Cancelando análisis...")
+    
+    def setup_config_bars(self, configs: List[int]):
+        """Crea una barra de progreso chica por configuración"""
+        for child in self.config_bars_frame.winfo_children():
+            child.destroy()
+        self.config_bars = {}
+        for row, config in enumerate(dict.fromkeys(configs)):
+            ttk.Label(
+                self.config_bars_frame,
+                text=ComplexityAnalyzer.describe_config(config),
+                style='Secondary.TLabel'
+            ).grid(row=row, column=0, sticky=tk.E, padx=5)
+            bar = ttk.Progressbar(self.config_bars_frame, mode='determinate', length=200)
+            bar.grid(row=row, column=1, sticky=tk.EW, pady=1)
+            self.config_bars[config] = bar
+        self.config_bars_frame.grid_columnconfigure(1, weight=1)
+    
     def update_progress(self, overall: float, config: int, config_progress: float):
         """Actualiza la barra de progreso"""
         self.progress_bar['value'] = overall
+        if config in self.config_bars:
+            self.config_bars[config]['value'] = config_progress
         self.progress_label.config(
-            text=f"Analizando con {config:,} ejecuciones... {config_progress:.1f}%"
+            text=f"Analizando con {ComplexityAnalyzer.describe_config(config)}... {config_progress:.1f}%"
         )
-        self.root.update_idletasks()
     
     def run_analysis(self, code: str, configs: List[int]):
         """Ejecuta el análisis en thread separado"""
         try:
+            # En paralelo hacen falta procesos aunque no se pida aislamiento
+            schedule = self.schedule_var.get()
+            pool = None
+            if self.isolated_var.get() or schedule == ComplexityAnalyzer.THROUGHPUT:
+                if self.sandbox is None:
+                    self.sandbox = SandboxPool()
+                pool = self.sandbox.start()
+                if schedule == ComplexityAnalyzer.THROUGHPUT:
+                    pool.ensure_workers(SandboxPool.parallel_workers())
+            
             results = ComplexityAnalyzer.analyze_multiple_executions(
                 code,
                 configs,
-                lambda o, c, p: self.root.after(0, lambda: self.update_progress(o, c, p))
+                self.progress_channel,
+                self.cancel_token, # type: ignore
+                ComplexityAnalyzer.BATCHED if self.batched_var.get() else ComplexityAnalyzer.PER_ITERATION,
+                pool,
+                schedule,
+                self.cost_var.get()
             )
             
-            if not results['success']: # type: ignore
+            if results.get('cancelled'): # type: ignore
+                self.root.after(0, lambda: self.log_result("⏹ Análisis cancelado por el usuario"))
+            elif not results['success']: # type: ignore
                 self.root.after(0, lambda: messagebox.showerror(
                     "Error",
-                    f"Error en configuración {results['failed_config']}:\n{results['error']}" # type: ignore
+                    f"Error en configuración {ComplexityAnalyzer.describe_config(results['failed_config'])}:\n{results['error']}" # type: ignore
                 ))
                 self.root.after(0, lambda: self.log_result(f"✗ Error: {results['error']}")) # type: ignore
             else:
                 self.current_results = results['results'] # type: ignore
-                self.root.after(0, lambda: self.display_results(results['results'], configs)) # type: ignore
+                self.root.after(0, lambda: self.display_results(results['results'], configs, results.get('cost'))) # type: ignore
                 self.root.after(0, lambda: messagebox.showinfo("Éxito", "Análisis completado"))
                 
         except Exception as e:
@@ -540,24 +760,168 @@ def suma(a, b):
             ))
         finally:
             self.is_analyzing = False
+            self.root.after(0, self.progress_channel.stop)
             self.root.after(0, self.progress_frame.pack_forget)
     
-    def display_results(self, results: Dict[int, Dict], configs: List[int]):
+    def update_sweep_progress(self, percent: float, size: int):
+        """Actualiza la barra de progreso del barrido de n"""
+        self.progress_bar['value'] = percent
+        self.progress_label.config(text=f"Midiendo con n={size:,}...")
+    
+    def run_sweep(self, code: str, family: str):
+        """Ejecuta el barrido de n en thread separado"""
+        try:
+            if self.isolated_var.get():
+                if self.sandbox is None:
+                    self.sandbox = SandboxPool()
+                result = self.sandbox.start().sweep(
+                    code,
+                    family,
+                    self.progress_channel,
+                    self.cancel_token,
+                    self.cost_var.get()
+                )
+            else:
+                result = SizeSweep.run(
+                    code,
+                    family,
+                    progress_callback=self.progress_channel,
+                    cancel_token=self.cancel_token, # type: ignore
+                    count_cost=self.cost_var.get()
+                )
+            
+            if result.get('cancelled'):
+                self.root.after(0, lambda: self.log_result("⏹ Análisis cancelado por el usuario"))
+            elif not result['success']:
+                self.root.after(0, lambda: messagebox.showerror("Error", result['error']))
+                self.root.after(0, lambda: self.log_result(f"✗ Error: {result['error']}"))
+            else:
+                self.current_results = result
+                self.root.after(0, lambda: self.display_sweep(result))
+                self.root.after(0, lambda: messagebox.showinfo("Éxito", "Barrido completado"))
+        
+        except Exception as e:
+            self.root.after(0, lambda: messagebox.showerror(
+                "Error",
+                f"Error durante el análisis:\n{str(e)}"
+            ))
+        finally:
+            self.is_analyzing = False
+            self.root.after(0, self.progress_channel.stop)
+            self.root.after(0, self.progress_frame.pack_forget)
+    
+    def display_sweep(self, result: Dict[str, Any]):
+        """Muestra el barrido de n en el log y los gráficos"""
+        self.log_result("\n✓ Barrido completado:")
+        self.log_result(f"  • Función: {result['entry']}")
+        self.log_result(f"  • Familia de entradas: {result['family']}")
+        for point in result['points']:
+            line = f"    {point['description']:>22}  {ComplexityAnalyzer.format_time(point['time']):>10}"
+            if 'cost' in point:
+                line += f"  {point['cost']['instructions']:,} instr."
+            self.log_result(line)
+        self.log_result(f"  • Fin: {result['stop_reason']}")
+        if result['error']:
+            self.log_result(f"  • {result['error']}")
+        
+        fit = result['fit']
+        self.log_result(f"  • Complejidad empírica: {ComplexityFitter.describe(fit)}")
+        if 'cost_fit' in result:
+            self.log_result(f"  • Complejidad por instrucciones: {ComplexityFitter.describe(result['cost_fit'])}")
+        if fit['success']:
+            self.notation_label.config(text=f"Empírica: {fit['notation']} (R²={fit['r_squared']:.3f})")
+        
+        self.plot_sweep(result)
+    
+    def plot_sweep(self, result: Dict[str, Any]):
+        """Grafica tiempo contra n (lineal y log-log) y el cociente medido/ajustado"""
+        colors = ModernDarkTheme.get_chart_colors()
+        sizes, times = result['sizes'], result['times']
+        fit = result['fit']
+        
+        for ax in self.axes:
+            ax.clear()
+        
+        for ax, log_scale in ((self.axes[0], False), (self.axes[1], True)):
+            ax.plot(sizes, times, 'o-', linewidth=2.5, markersize=7, color=colors[0],
+                    label=result['entry'], markeredgewidth=0, alpha=0.9)
+            if fit['success']:
+                curve_n, curve_t = ComplexityFitter.curve(fit, sizes)
+                ax.plot(curve_n, curve_t, ':', linewidth=2, color=colors[1], label=f"Ajuste {fit['notation']}")
+            if log_scale:
+                ax.set_xscale('log')
+                ax.set_yscale('log')
+            ax.set_xlabel('Tamaño de entrada (n)', fontsize=10, fontweight='600')
+            ax.set_ylabel('Tiempo (s)', fontsize=10, fontweight='600')
+            ax.set_title('Escala log-log' if log_scale else 'Tiempo vs. n', fontsize=11, fontweight='bold', pad=15)
+            ax.grid(True, alpha=0.2, linestyle='--', linewidth=0.5)
+            ax.legend(fontsize=8)
+            ax.spines['top'].set_visible(False)
+            ax.spines['right'].set_visible(False)
+        
+        ax = self.axes[2]
+        if fit['success']:
+            predicted = ComplexityFitter.evaluate(fit, sizes)
+            ratio = np.asarray(times) / np.where(predicted > 0, predicted, np.nan)
+            ax.plot(sizes, ratio, 'o-', linewidth=2, markersize=6, color=colors[2], markeredgewidth=0)
+            ax.axhline(y=1.0, color=colors[1], linestyle='--', linewidth=1.5, alpha=0.6)
+            ax.set_xscale('log')
+        ax.set_xlabel('Tamaño de entrada (n)', fontsize=10, fontweight='600')
+        ax.set_ylabel('Medido / ajustado', fontsize=10, fontweight='600')
+        ax.set_title('Calidad del ajuste', fontsize=11, fontweight='bold', pad=15)
+        ax.grid(True, alpha=0.2, linestyle='--', linewidth=0.5)
+        ax.spines['top'].set_visible(False)
+        ax.spines['right'].set_visible(False)
+        
+        self.figure.tight_layout()
+        self.canvas.draw()
+    
+    def display_results(self, results: Dict[int, Dict], configs: List[int], cost: Dict[str, Any] = None): # type: ignore
         """Muestra los resultados en el log y gráficos"""
         self.log_result("\n✓ Análisis completado:", clear=False)
         
+        if cost is not None:
+            if cost['success']:
+                self.log_result(
+                    f"\n🧮 Costo por ejecución ({cost['backend']}): {cost['instructions']:,} instrucciones, "
+                    f"{cost['lines']:,} líneas, {cost['calls']:,} llamadas"
+                )
+            else:
+                self.log_result(f"\n🧮 No se pudo contar el costo: {cost['error']}")
+        
         for config in configs:
             data = results[config]
-            self.log_result(f"\n📊 Configuración: {config:,} ejecuciones")
+            self.log_result(f"\n📊 Configuración: {ComplexityAnalyzer.describe_config(config)}")
+            if 'stop_reason' in data:
+                self.log_result(
+                    f"  • Ejecuciones necesarias: {data['num_executions']:,} "
+                    f"(±{data['precision'] * 100:.2f}% de la mediana; fin: {data['stop_reason']})"
+                )
             self.log_result(f"  • Tiempo promedio: {ComplexityAnalyzer.format_time(data['avg_time'])}")
             self.log_result(f"  • Desviación estándar: {ComplexityAnalyzer.format_time(data['std_time'])}")
             self.log_result(f"  • Tiempo mínimo: {ComplexityAnalyzer.format_time(data['min_time'])}")
             self.log_result(f"  • Tiempo máximo: {ComplexityAnalyzer.format_time(data['max_time'])}")
+            if 'percentiles' in data:
+                self.log_result("  • Percentiles: " + ", ".join(
+                    f"{name} {ComplexityAnalyzer.format_time(value)}" for name, value in data['percentiles'].items()
+                ))
+            if data.get('mode') == ComplexityAnalyzer.BATCHED:
+                self.log_result(
+                    f"  • Medición por lotes: {data['batch_size']:,} iteraciones por lote, "
+                    f"bucle vacío descontado {ComplexityAnalyzer.format_time(data['loop_overhead'])}/iter."
+                )
+            if data.get('shards', 1) > 1:
+                self.log_result(f"  • Medida en paralelo en {data['shards']} fragmentos")
+            if 'compile_time' in data:
+                self.log_result(
+                    f"  • Compilación evitada por iteración: {ComplexityAnalyzer.format_time(data['compile_time'])} "
+                    f"({data['compile_overhead_pct']:.1f}% del tiempo que se medía antes)"
+                )
         
         # Graficar resultados
-        self.plot_results(results, configs)
+        self.plot_results(results, configs, cost)
     
-    def plot_results(self, results: Dict[int, Dict], configs: List[int]):
+    def plot_results(self, results: Dict[int, Dict], configs: List[int], cost: Dict[str, Any] = None): # type: ignore
         """Genera los 3 subplots con los resultados"""
         colors = ModernDarkTheme.get_chart_colors()
         
@@ -571,6 +935,17 @@ def suma(a, b):
             
             color = colors[idx]
             
+            # Muestra del reservorio de fondo: deja ver la dispersión y la cola
+            if data.get('reservoir_times'):
+                ax.scatter(
+                    data['reservoir_indices'],
+                    data['reservoir_times'],
+                    s=6,
+                    color=color,
+                    alpha=0.25,
+                    linewidths=0
+                )
+            
             # Graficar línea de tiempos muestreados
             ax.plot(
                 data['sampled_indices'],
@@ -579,7 +954,7 @@ def suma(a, b):
                 linewidth=2.5,
                 markersize=7,
                 color=color,
-                label=f"{config:,} ejecuciones",
+                label=ComplexityAnalyzer.describe_config(config),
                 markeredgewidth=0,
                 alpha=0.9
             )
@@ -596,7 +971,10 @@ def suma(a, b):
             
             ax.set_xlabel('Ejecución #', fontsize=10, fontweight='600')
             ax.set_ylabel('Tiempo (s)', fontsize=10, fontweight='600')
-            ax.set_title(f'{config:,} ejecuciones', fontsize=11, fontweight='bold', pad=15)
+            title = ComplexityAnalyzer.describe_config(config)
+            if 'stop_reason' in data:
+                title += f" · {data['num_executions']:,} ejec."
+            ax.set_title(title, fontsize=11, fontweight='bold', pad=15)
             ax.grid(True, alpha=0.2, linestyle='--', linewidth=0.5)
             ax.set_axisbelow(True)
             ax.ticklabel_format(style='scientific', axis='y', scilimits=(0,0))
@@ -605,10 +983,13 @@ def suma(a, b):
             ax.spines['top'].set_visible(False)
             ax.spines['right'].set_visible(False)
             
-            # Agregar texto con tiempo promedio
+            # Agregar texto con tiempo promedio (y el costo, que no depende de la máquina)
+            summary = f'Promedio:\n{ComplexityAnalyzer.format_time(data["avg_time"])}'
+            if cost is not None and cost['success']:
+                summary += f'\n{cost["instructions"]:,} instr.'
             ax.text(
                 0.95, 0.95,
-                f'Promedio:\n{ComplexityAnalyzer.format_time(data["avg_time"])}',
+                summary,
                 transform=ax.transAxes,
                 fontsize=9,
                 verticalalignment='top',
@@ -696,6 +1077,8 @@ def suma(a, b):
                 "Un análisis está en curso. ¿Seguro que deseas volver?"
             ):
                 return
+            self.cancel_token.cancel() # type: ignore
+        self.close_sandbox()
         # Ejecutar callback para volver al menú
         if self.return_callback:
             self.return_callback()
@@ -0,0 +1,265 @@
+# input_families.py
+import numpy as np
+from typing import List, Dict, Any, Tuple
+
+from string_generator import StringBatch, StringGenerator
+
+
+class InputFamilies:
+    """
+    Familias de entradas estructuradas y escalables para el código del usuario
+    
+    Cada familia se genera como un diccionario de arreglos de NumPy (lo que
+    se guarda en el caché binario) y luego se materializa en los valores de
+    Python que recibe la función: listas, listas de adyacencia, matrices o
+    árboles. El tamaño n es la cantidad de elementos, vértices, nodos, el
+    lado de la matriz o el propio entero n, según la familia.
+    """
+    
+    INTEGER = "entero n"
+    INTS = "lista de enteros"
+    FLOATS = "lista de flotantes"
+    STRINGS = "lista de strings"
+    SORTED_SEARCH = "arreglo ordenado + objetivo"
+    SPARSE_GRAPH = "grafo disperso"
+    DENSE_GRAPH = "grafo denso"
+    MATRIX = "matrices (listas)"
+    MATRIX_NUMPY = "matrices (NumPy)"
+    TREE = "árbol aleatorio"
+    
+    FAMILIES = [
+        INTEGER, INTS, FLOATS, STRINGS, SORTED_SEARCH, SPARSE_GRAPH,
+        DENSE_GRAPH, MATRIX, MATRIX_NUMPY, TREE
+    ]
+    
+    # Nombre de directorio del caché de cada familia
+    KEYS = {
+        INTEGER: 'family_integer',
+        INTS: 'family_ints',
+        FLOATS: 'family_floats',
+        STRINGS: 'family_strings',
+        SORTED_SEARCH: 'family_sorted_search',
+        SPARSE_GRAPH: 'family_sparse_graph',
+        DENSE_GRAPH: 'family_dense_graph',
+        MATRIX: 'family_matrix',
+        MATRIX_NUMPY: 'family_matrix',  # Mismos datos, otra materialización
+        TREE: 'family_tree',
+    }
+    
+    # Nombres de los argumentos posicionales que recibe la función del usuario
+    ARGUMENTS = {
+        INTEGER: ['n'],
+        INTS: ['arr'],
+        FLOATS: ['arr'],
+        STRINGS: ['arr'],
+        SORTED_SEARCH: ['arr', 'target'],
+        SPARSE_GRAPH: ['graph', 'start'],
+        DENSE_GRAPH: ['graph', 'start'],
+        MATRIX: ['A', 'B'],
+        MATRIX_NUMPY: ['A', 'B'],
+        TREE: ['tree', 'root'],
+    }
+    
+    DEFAULT_PARAMS = {
+        SORTED_SEARCH: {'targets': 32, 'hit_fraction': 0.5},
+        SPARSE_GRAPH: {'edges_per_vertex': 4},
+        DENSE_GRAPH: {'density': 0.5},
+        MATRIX: {'max_value': 10},
+        MATRIX_NUMPY: {'max_value': 10},
+    }
+    
+    # Límites para no agotar la memoria (n² elementos)
+    MAX_DENSE_VERTICES = 4000
+    MAX_MATRIX_SIDE = 3000
+    
+    @staticmethod
+    def params_for(family: str, params: Dict[str, Any] = None) -> Dict[str, Any]: # type: ignore
+        """Parámetros efectivos: los indicados completados con los valores por defecto"""
+        return {**InputFamilies.DEFAULT_PARAMS.get(family, {}), **(params or {})}
+    
+    @staticmethod
+    def rng_for(seed: int, size: int) -> np.random.Generator:
+        """Generador reproducible por (semilla, tamaño), independiente del orden de generación"""
+        return np.random.default_rng([seed, size])
+    
+    @staticmethod
+    def _random_tree_parents(size: int, rng: np.random.Generator) -> np.ndarray:
+        """Árbol recursivo aleatorio: cada nodo i > 0 cuelga de un nodo anterior"""
+        parents = np.empty(size, dtype=np.int64)
+        if size:
+            parents[0] = -1
+            # floor(U·i) es uniforme en [0, i)
+            parents[1:] = (rng.random(size - 1) * np.arange(1, size)).astype(np.int64)
+        return parents
+    
+    @staticmethod
+    def _csr(num_vertices: int, sources: np.ndarray, targets: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Grafo no dirigido en formato CSR (indptr, indices) sin aristas repetidas
+        
+        Los vecinos de v son indices[indptr[v]:indptr[v + 1]], ordenados.
+        """
+        both_src = np.concatenate([sources, targets])
+        both_dst = np.concatenate([targets, sources])
+        codes = np.sort(both_src * num_vertices + both_dst)
+        # Sin np.unique: ordenar y comparar vecinos es varias veces más rápido
+        codes = codes[np.concatenate([[True], codes[1:] != codes[:-1]])] if len(codes) else codes
+        src, dst = np.divmod(codes, num_vertices)
+        indptr = np.zeros(num_vertices + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=num_vertices), out=indptr[1:])
+        return {'indptr': indptr, 'indices': dst.astype(np.int64)}
+    
+    @staticmethod
+    def generate(
+        family: str,
+        size: int,
+        seed: int,
+        params: Dict[str, Any] = None # type: ignore
+    ) -> Dict[str, np.ndarray]:
+        """
+        Genera los arreglos de una familia para un tamaño
+        
+        Args:
+            family: Una de FAMILIES
+            size: Tamaño n
+            seed: Semilla
+            params: Parámetros propios de la familia
+        
+        Returns:
+            Diccionario nombre -> arreglo de NumPy
+        """
+        p = InputFamilies.params_for(family, params)
+        rng = InputFamilies.rng_for(seed, size)
+        
+        if family == InputFamilies.INTEGER:
+            return {'n': np.array([size], dtype=np.int64)}
+        
+        if family == InputFamilies.INTS:
+            return {'values': rng.permutation(size).astype(np.int64)}
+        
+        if family == InputFamilies.FLOATS:
+            return {'values': rng.random(size) * size}
+        
+        if family == InputFamilies.STRINGS:
+            batch = StringGenerator.generate(size, seed, size)
+            return {'offsets': batch.offsets, 'bytes': batch.buffer}
+        
+        if family == InputFamilies.SORTED_SEARCH:
+            values = np.sort(rng.integers(0, 4 * max(size, 1), size, dtype=np.int64))
+            count = p['targets']
+            hits = int(count * p['hit_fraction']) if size else 0
+            targets = np.concatenate([
+                values[rng.integers(0, size, hits)] if hits else np.empty(0, dtype=np.int64),
+                rng.integers(0, 4 * max(size, 1), count - hits, dtype=np.int64)
+            ])
+            rng.shuffle(targets)
+            return {'values': values, 'targets': targets}
+        
+        if family == InputFamilies.SPARSE_GRAPH:
+            # Un árbol aleatorio garantiza que el grafo sea conexo; el resto
+            # de las aristas se sortea hasta llegar a edges_per_vertex · V
+            parents = InputFamilies._random_tree_parents(size, rng)
+            extra = max(int(p.get('edges', p['edges_per_vertex'] * size)) - (size - 1), 0)
+            if size < 2:
+                extra = 0
+            src = rng.integers(0, max(size, 1), extra)
+            dst = rng.integers(0, max(size - 1, 1), extra)
+            dst = dst + (dst >= src)  # Sin lazos
+            return InputFamilies._csr(
+                size,
+                np.concatenate([np.arange(1, size), src]).astype(np.int64),
+                np.concatenate([parents[1:], dst]).astype(np.int64)
+            )
+        
+        if family == InputFamilies.DENSE_GRAPH:
+            if size > InputFamilies.MAX_DENSE_VERTICES:
+                raise ValueError(f"El grafo denso admite hasta {InputFamilies.MAX_DENSE_VERTICES:,} vértices")
+            upper = np.triu(rng.random((size, size), dtype=np.float32) < p['density'], 1)
+            src, dst = np.nonzero(upper)
+            return InputFamilies._csr(size, src.astype(np.int64), dst.astype(np.int64))
+        
+        if family in (InputFamilies.MATRIX, InputFamilies.MATRIX_NUMPY):
+            if size > InputFamilies.MAX_MATRIX_SIDE:
+                raise ValueError(f"Las matrices admiten hasta {InputFamilies.MAX_MATRIX_SIDE:,} filas")
+            return {
+                'A': rng.integers(0, p['max_value'], (size, size), dtype=np.int64),
+                'B': rng.integers(0, p['max_value'], (size, size), dtype=np.int64)
+            }
+        
+        if family == InputFamilies.TREE:
+            return {'parents': InputFamilies._random_tree_parents(size, rng)}
+        
+        raise ValueError(f"Familia de entradas no soportada: {family}")
+    
+    @staticmethod
+    def _adjacency(indptr: np.ndarray, indices: np.ndarray) -> List[List[int]]:
+        """Listas de adyacencia a partir de CSR"""
+        bounds = indptr.tolist()
+        neighbors = indices.tolist()
+        return [neighbors[a:b] for a, b in zip(bounds, bounds[1:])]
+    
+    @staticmethod
+    def materialize(family: str, arrays: Dict[str, np.ndarray]) -> Dict[str, Any]:
+        """
+        Convierte los arreglos guardados en los valores que recibe el usuario
+        
+        Returns:
+            Diccionario con los nombres de ARGUMENTS (y datos auxiliares,
+            como todos los objetivos de búsqueda)
+        """
+        if family == InputFamilies.INTEGER:
+            return {'n': int(arrays['n'][0])}
+        
+        if family in (InputFamilies.INTS, InputFamilies.FLOATS):
+            return {'arr': arrays['values'].tolist()}
+        
+        if family == InputFamilies.STRINGS:
+            return {'arr': StringBatch(arrays['bytes'], arrays['offsets']).tolist()}
+        
+        if family == InputFamilies.SORTED_SEARCH:
+            targets = arrays['targets'].tolist()
+            return {'arr': arrays['values'].tolist(), 'target': targets[0] if targets else 0, 'targets': targets}
+        
+        if family in (InputFamilies.SPARSE_GRAPH, InputFamilies.DENSE_GRAPH):
+            indptr, indices = arrays['indptr'], arrays['indices']
+            return {
+                'graph': InputFamilies._adjacency(indptr, indices),
+                'start': 0,
+                'num_vertices': len(indptr) - 1,
+                'num_edges': len(indices) // 2
+            }
+        
+        if family == InputFamilies.MATRIX:
+            return {'A': arrays['A'].tolist(), 'B': arrays['B'].tolist()}
+        
+        if family == InputFamilies.MATRIX_NUMPY:
+            # Copia: los arreglos mapeados del caché son de solo lectura
+            return {'A': np.array(arrays['A']), 'B': np.array(arrays['B'])}
+        
+        if family == InputFamilies.TREE:
+            parents = arrays['parents']
+            children = [[] for _ in range(len(parents))]
+            for child, parent in enumerate(parents.tolist()):
+                if parent >= 0:
+                    children[parent].append(child)
+            return {'tree': children, 'root': 0, 'parents': parents.tolist()}
+        
+        raise ValueError(f"Familia de entradas no soportada: {family}")
+    
+    @staticmethod
+    def arguments(family: str, values: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Argumentos posicionales para llamar a la función del usuario"""
+        return tuple(values[name] for name in InputFamilies.ARGUMENTS[family])
+    
+    @staticmethod
+    def describe(family: str, values: Dict[str, Any]) -> str:
+        """Resumen corto de una entrada (para mostrar el tamaño efectivo)"""
+        if family in (InputFamilies.SPARSE_GRAPH, InputFamilies.DENSE_GRAPH):
+            return f"V={values['num_vertices']:,}, E={values['num_edges']:,}"
+        if family in (InputFamilies.MATRIX, InputFamilies.MATRIX_NUMPY):
+            return f"{len(values['A']):,}×{len(values['A']):,}"
+        if family == InputFamilies.TREE:
+            return f"{len(values['parents']):,} nodos"
+        if family == InputFamilies.INTEGER:
+            return f"n={values['n']:,}"
+        return f"n={len(values['arr']):,}"
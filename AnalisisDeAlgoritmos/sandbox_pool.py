@@ -0,0 +1,555 @@
+# sandbox_pool.py
+import math
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+import time
+import traceback
+from multiprocessing import shared_memory
+from typing import Dict, Any, Tuple, Optional, Callable
+
+import numpy as np
+
+from code_executor import CodeExecutor
+
+try:
+    import resource  # Solo Unix: límites de CPU y memoria
+except ImportError:
+    resource = None
+
+
+class CPULimitExceeded(BaseException):
+    """
+    El proceso trabajador agotó su límite de tiempo de CPU (SIGXCPU)
+    
+    Hereda de BaseException para que ni el código del usuario ni el
+    envoltorio try/except del analizador la atrapen.
+    """
+
+
+# Operaciones del trabajador --------------------------------------------------
+
+PROGRESS_INTERVAL = 0.1  # Segundos mínimos entre mensajes de progreso
+
+
+def _on_sigxcpu(signum, frame):
+    raise CPULimitExceeded()
+
+
+def _address_space() -> int:
+    """Bytes de espacio de direcciones que ya usa el proceso (0 si no se sabe)"""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[0]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+
+def _apply_memory_limit(memory_limit_mb: int):
+    """
+    Limita el espacio de direcciones a lo que ya ocupa el proceso más
+    memory_limit_mb; al pasarse, las asignaciones fallan con MemoryError
+    """
+    if resource is None or not memory_limit_mb or not hasattr(resource, 'RLIMIT_AS'):
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+    limit = _address_space() + memory_limit_mb * 1024 * 1024
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    except (ValueError, OSError):
+        pass  # Algunos sistemas (macOS) no permiten fijarlo
+
+
+class _CPULimit:
+    """
+    Límite de CPU para una sola operación
+    
+    RLIMIT_CPU cuenta el tiempo acumulado del proceso, así que el límite
+    blando se fija en lo ya consumido más cpu_seconds y se restaura al salir.
+    """
+    
+    def __init__(self, cpu_seconds: float):
+        self.cpu_seconds = cpu_seconds
+        self.previous = None
+    
+    def __enter__(self):
+        if resource is None or not self.cpu_seconds:
+            return self
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        soft, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        limit = int(math.ceil(usage.ru_utime + usage.ru_stime + self.cpu_seconds))
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        try:
+            resource.setrlimit(resource.RLIMIT_CPU, (limit, hard))
+            self.previous = (soft, hard)
+        except (ValueError, OSError):
+            pass
+        return self
+    
+    def __exit__(self, exc_type, exc_value, tb):
+        if self.previous is not None:
+            resource.setrlimit(resource.RLIMIT_CPU, self.previous)
+        return False
+
+
+def _unpack_input(payload) -> Any:
+    """Reconstruye la entrada: ('shm', nombre, dtype, largo) o ('value', objeto)"""
+    if payload is None:
+        return None
+    if payload[0] == 'value':
+        return payload[1]
+    _, name, dtype, length = payload
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        view = np.ndarray((length,), dtype=np.dtype(dtype), buffer=shm.buf)
+        value = view.tolist()
+        del view  # Liberar el buffer antes de cerrar
+        return value
+    finally:
+        shm.close()
+
+
+def _op_execute(code: str, payload, conn) -> Dict[str, Any]:
+    """Una ejecución del código, como CodeExecutor.execute_code"""
+    packed_input, capture = payload
+    compiled = CodeExecutor.compile_cached(code)
+    return CodeExecutor.execute_compiled(compiled, _unpack_input(packed_input), None, capture)
+
+
+def _progress_sender(conn) -> Callable:
+    """Callback de progreso que manda ('progress', *argumentos) cada PROGRESS_INTERVAL"""
+    last = [0.0]
+    
+    def progress(*args):
+        now = time.monotonic()
+        if now - last[0] >= PROGRESS_INTERVAL:
+            last[0] = now
+            conn.send(('progress',) + args)
+    
+    return progress
+
+
+def _op_analyze(code: str, payload, conn) -> Dict[str, Any]:
+    """Una configuración completa de ComplexityAnalyzer, reportando progreso"""
+    from complexity_analyzer import ComplexityAnalyzer
+    
+    config, mode = payload
+    return ComplexityAnalyzer.analyze_config(code, config, _progress_sender(conn), None, mode)
+
+
+def _op_sweep(code: str, payload, conn) -> Dict[str, Any]:
+    """Un barrido de n completo de SizeSweep, reportando (porcentaje, tamaño)"""
+    from size_sweep import SizeSweep
+    
+    family, count_cost = payload
+    return SizeSweep.run(code, family, progress_callback=_progress_sender(conn), count_cost=count_cost)
+
+
+def _op_cost(code: str, payload, conn) -> Dict[str, Any]:
+    """Una ejecución contando su costo, como CodeExecutor.count_cost"""
+    return CodeExecutor.count_cost(code)
+
+
+_OPERATIONS = {
+    'execute': _op_execute,
+    'analyze': _op_analyze,
+    'cost': _op_cost,
+    'sweep': _op_sweep,
+}
+
+
+def _worker_main(conn, memory_limit_mb: int):
+    """
+    Bucle del proceso trabajador
+    
+    Mensajes recibidos: (operación, hash, código o None, entrada, límite de
+    CPU), o None para terminar. El código se envía solo la primera vez: si
+    el trabajador no conoce el hash responde ('missing',). Respuestas:
+    ('progress', porcentaje, ...) y ('done', resultado).
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl+C lo maneja el padre
+    if hasattr(signal, 'SIGXCPU'):
+        signal.signal(signal.SIGXCPU, _on_sigxcpu)
+    _apply_memory_limit(memory_limit_mb)
+    
+    sources: Dict[str, str] = {}
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            return
+        if message is None:
+            return
+        
+        operation, key, source, payload, cpu_limit = message
+        if source is not None:
+            if len(sources) >= CodeExecutor.CACHE_SIZE:
+                sources.clear()
+            sources[key] = source
+        elif key not in sources:
+            conn.send(('missing',))
+            continue
+        
+        try:
+            with _CPULimit(cpu_limit):
+                result = _OPERATIONS[operation](sources[key], payload, conn)
+        except CPULimitExceeded:
+            result = {'success': False, 'error': f"Límite de tiempo de CPU excedido ({cpu_limit} s)"}
+        except SystemExit:
+            result = {'success': False, 'error': "El código terminó el proceso con sys.exit()"}
+        except MemoryError:
+            result = {'success': False, 'error': "Error: Memoria insuficiente (límite del proceso aislado)"}
+        except Exception:
+            result = {'success': False, 'error': traceback.format_exc()}
+        conn.send(('done', result))
+
+
+# Lado del proceso principal --------------------------------------------------
+
+class _Worker:
+    """Proceso trabajador con su canal y los hashes de código que ya conoce"""
+    
+    def __init__(self, context, memory_limit_mb: int):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child_conn, memory_limit_mb),
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.known = set()
+    
+    def signal(self, signum: int):
+        try:
+            os.kill(self.process.pid, signum) # type: ignore
+        except (OSError, TypeError):
+            pass
+    
+    def stop(self, timeout: float = 1.0):
+        """Pide al trabajador que termine; si no responde, lo mata"""
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout)
+        self.kill()
+    
+    def kill(self):
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class SandboxPool:
+    """
+    Procesos trabajadores precreados que ejecutan el código del usuario
+    
+    Cada trabajador corre con límites de CPU y de memoria (resource, solo
+    Unix) y cada pedido tiene un tiempo límite de pared: si se pasa, o si
+    el proceso muere, el trabajador se mata y se reemplaza por uno nuevo.
+    Los trabajadores se reutilizan entre pedidos, así que el costo de crear
+    un proceso se paga una sola vez. Se usa como administrador de contexto:
+        
+        with SandboxPool() as pool:
+            pool.execute("x = sum(arr)", [1, 2, 3])
+    """
+    
+    WORKERS = 1
+    TIMEOUT = 30.0  # Segundos de pared sin respuesta del trabajador
+    CPU_LIMIT = 30  # Segundos de CPU por ejecución individual
+    MEMORY_LIMIT_MB = 1024  # Memoria adicional permitida a cada trabajador
+    POLL_INTERVAL = 0.05
+    
+    def __init__(
+        self,
+        workers: int = WORKERS,
+        timeout: float = TIMEOUT,
+        cpu_limit: int = CPU_LIMIT,
+        memory_limit_mb: int = MEMORY_LIMIT_MB
+    ):
+        self.num_workers = max(1, workers)
+        self.timeout = timeout
+        self.cpu_limit = cpu_limit
+        self.memory_limit_mb = memory_limit_mb
+        self._context = SandboxPool._make_context()
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._workers = set()
+        self._lock = threading.Lock()
+        self._closed = True
+    
+    @staticmethod
+    def _make_context():
+        """
+        forkserver donde existe: los trabajadores nacen de un proceso limpio
+        (sin los hilos de Tk) y reemplazarlos es solo un fork; spawn si no
+        """
+        if 'forkserver' in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context('forkserver')
+            context.set_forkserver_preload(['sandbox_pool'])
+            return context
+        return multiprocessing.get_context('spawn')
+    
+    def start(self) -> 'SandboxPool':
+        """Crea los trabajadores (si el grupo no estaba iniciado)"""
+        with self._lock:
+            if not self._closed:
+                return self
+            self._closed = False
+            for _ in range(self.num_workers):
+                self._add_worker()
+        return self
+    
+    @staticmethod
+    def parallel_workers() -> int:
+        """Trabajadores para correr en paralelo: una CPU queda para la interfaz"""
+        return max(1, (os.cpu_count() or 2) - 1)
+    
+    def ensure_workers(self, workers: int) -> 'SandboxPool':
+        """Agrega trabajadores hasta tener al menos `workers` (nunca quita)"""
+        self.start()
+        with self._lock:
+            while self.num_workers < workers:
+                self.num_workers += 1
+                self._add_worker()
+        return self
+    
+    def _add_worker(self):
+        worker = _Worker(self._context, self.memory_limit_mb)
+        self._workers.add(worker)
+        self._idle.put(worker)
+    
+    def _replace(self, worker: _Worker):
+        """Mata un trabajador colgado o muerto y crea otro en su lugar"""
+        worker.kill()
+        with self._lock:
+            self._workers.discard(worker)
+            if not self._closed:
+                self._add_worker()
+    
+    def close(self):
+        """Termina todos los trabajadores"""
+        with self._lock:
+            self._closed = True
+            workers = list(self._workers)
+            self._workers.clear()
+        for worker in workers:
+            worker.stop()
+        while not self._idle.empty():
+            self._idle.get_nowait()
+    
+    def __enter__(self) -> 'SandboxPool':
+        return self.start()
+    
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+    
+    @staticmethod
+    def _pack_input(value: Any) -> Tuple[Any, Optional[shared_memory.SharedMemory]]:
+        """
+        Entrada para el trabajador
+        
+        Las listas numéricas viajan por memoria compartida (solo se envía el
+        nombre del bloque); el resto se serializa por el canal.
+        """
+        if value is None:
+            return None, None
+        dtype = SandboxPool._shared_dtype(value) if isinstance(value, list) and value else None
+        if dtype is not None:
+            array = np.array(value, dtype=dtype)
+            shm = shared_memory.SharedMemory(create=True, size=array.nbytes)
+            np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[:] = array
+            return ('shm', shm.name, array.dtype.str, len(array)), shm
+        return ('value', value), None
+    
+    @staticmethod
+    def _shared_dtype(values: list) -> Optional[np.dtype]:
+        """
+        Tipo de la lista en memoria compartida, o None si debe serializarse
+        
+        Solo se comparten listas de puros int que caben en int64 o de puros
+        float, que vuelven idénticas; una mezcla volvería toda como float y
+        un entero más ancho se perdería.
+        """
+        kind = type(values[0])
+        if kind not in (int, float) or not all(type(v) is kind for v in values):
+            return None
+        if kind is float:
+            return np.dtype(np.float64)
+        limits = np.iinfo(np.int64)
+        if limits.min <= min(values) and max(values) <= limits.max:
+            return np.dtype(np.int64)
+        return None
+    
+    def _request(
+        self,
+        operation: str,
+        code: str,
+        payload: Any,
+        cpu_limit: Optional[int],
+        progress_callback=None,
+        cancel_token=None
+    ) -> Dict[str, Any]:
+        """
+        Envía un pedido a un trabajador libre y espera la respuesta
+        
+        Cada mensaje del trabajador reinicia el plazo de self.timeout. Una
+        pausa del token detiene el proceso (SIGSTOP) y no consume el plazo.
+        """
+        self.start()
+        worker = self._idle.get()
+        key = CodeExecutor.source_hash(code)
+        message = (operation, key, None if key in worker.known else code, payload, cpu_limit)
+        stopped = False
+        
+        try:
+            worker.conn.send(message)
+            deadline = time.monotonic() + self.timeout
+            while True:
+                if cancel_token is not None:
+                    if cancel_token.is_cancelled:
+                        self._replace(worker)
+                        worker = None
+                        return {'success': False, 'cancelled': True, 'error': "Análisis cancelado por el usuario"}
+                    if cancel_token.is_paused != stopped and hasattr(signal, 'SIGSTOP'):
+                        stopped = cancel_token.is_paused
+                        worker.signal(signal.SIGSTOP if stopped else signal.SIGCONT)
+                    if stopped:
+                        time.sleep(SandboxPool.POLL_INTERVAL)
+                        deadline = time.monotonic() + self.timeout
+                        continue
+                
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._replace(worker)
+                    worker = None
+                    return {
+                        'success': False,
+                        'timed_out': True,
+                        'error': f"Tiempo límite excedido ({self.timeout:.0f} s sin responder): "
+                                 f"el proceso aislado se reinició"
+                    }
+                if not worker.conn.poll(min(SandboxPool.POLL_INTERVAL, remaining)):
+                    continue
+                
+                reply = worker.conn.recv()
+                deadline = time.monotonic() + self.timeout
+                if reply[0] == 'missing':
+                    worker.known.discard(key)
+                    worker.conn.send((operation, key, code, payload, cpu_limit))
+                elif reply[0] == 'progress':
+                    if progress_callback:
+                        progress_callback(*reply[1:])
+                else:
+                    worker.known.add(key)
+                    return reply[1]
+        
+        except (EOFError, OSError):
+            exitcode = None
+            if worker is not None:
+                self._replace(worker)
+                exitcode = worker.process.exitcode
+                worker = None
+            return {
+                'success': False,
+                'crashed': True,
+                'error': f"El proceso aislado terminó inesperadamente (código {exitcode}); se reinició"
+            }
+        
+        finally:
+            if worker is not None:
+                if stopped:
+                    worker.signal(signal.SIGCONT)
+                self._idle.put(worker)
+    
+    def execute(
+        self,
+        code: str,
+        dataset_value: Any = None,
+        cancel_token=None,
+        capture: str = CodeExecutor.CAPTURE_BOUNDED
+    ) -> Dict[str, Any]:
+        """
+        Ejecuta el código una vez en un trabajador
+        
+        Por defecto la salida se captura acotada, para no mandar por el
+        canal todo lo que imprima un bucle.
+        
+        Returns:
+            Mismo formato que CodeExecutor.execute_code
+        """
+        packed_input, shm = SandboxPool._pack_input(dataset_value)
+        try:
+            result = self._request(
+                'execute', code, (packed_input, capture), self.cpu_limit, cancel_token=cancel_token
+            )
+        finally:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+        result.setdefault('time', 0)
+        result.setdefault('output', "")
+        return result
+    
+    def count_cost(self, code: str, cancel_token=None) -> Dict[str, Any]:
+        """
+        Ejecuta el código una vez en un trabajador contando su costo
+        
+        Returns:
+            Mismo formato que CodeExecutor.count_cost
+        """
+        return self._request('cost', code, None, self.cpu_limit, cancel_token=cancel_token)
+    
+    def sweep(
+        self,
+        code: str,
+        family: str,
+        progress_callback=None,
+        cancel_token=None,
+        count_cost: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Corre SizeSweep.run en un trabajador
+        
+        Como en analyze, no hay límite de CPU para el barrido completo; una
+        llamada que no termina se detecta porque el trabajador deja de
+        reportar progreso durante self.timeout segundos.
+        
+        Returns:
+            Mismo formato que SizeSweep.run
+        """
+        return self._request(
+            'sweep', code, (family, count_cost), None, progress_callback, cancel_token
+        )
+
+    def analyze(
+        self,
+        code: str,
+        config,
+        mode: str,
+        progress_callback=None,
+        cancel_token=None
+    ) -> Dict[str, Any]:
+        """
+        Corre ComplexityAnalyzer.analyze_config en un trabajador
+        
+        config es un número de ejecuciones o una precisión objetivo.
+        
+        No hay límite de CPU para la configuración completa (puede ser
+        larga); un bucle infinito se detecta porque el trabajador deja de
+        reportar progreso durante self.timeout segundos.
+        
+        Returns:
+            Mismo formato que analyze_code_execution
+        """
+        result = self._request(
+            'analyze', code, (config, mode), None, progress_callback, cancel_token
+        )
+        result.setdefault('iteration', 0)
+        return result
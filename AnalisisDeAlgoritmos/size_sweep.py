@@ -0,0 +1,380 @@
+# size_sweep.py
+import ast
+import contextlib
+import math
+import re
+import sys
+import os
+import time
+import numpy as np
+from typing import List, Dict, Any, Tuple, Callable
+
+from code_executor import CodeExecutor
+from cost_counter import CostCounter
+from dataset_generator import DatasetGenerator
+from input_families import InputFamilies
+
+# Importar utilidades compartidas desde la raíz
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+from cancellation import CancellationToken, AnalysisCancelled
+from complexity_fitter import ComplexityFitter
+
+
+class SizeSweep:
+    """
+    Mide la función del usuario con entradas de tamaño creciente
+    
+    La función de entrada se indica con un comentario '# entry: nombre' o
+    se detecta en el código. La familia de entradas se deduce de los nombres
+    de sus parámetros (o se elige a mano) y los datos salen del caché de
+    DatasetGenerator. El resultado es tiempo contra n, listo para el ajuste
+    empírico de complejidad.
+    """
+    
+    AUTO = "automática"
+    
+    ENTRY_ANNOTATION = re.compile(r'^\s*#\s*entry:\s*([A-Za-z_]\w*)', re.MULTILINE)
+    
+    # Nombres de parámetros que delatan cada familia
+    GRAPH_NAMES = {'graph', 'grafo', 'adj', 'adjacency', 'adyacencia', 'g'}
+    TREE_NAMES = {'tree', 'arbol', 'árbol', 'root', 'raiz', 'raíz', 'nodo'}
+    TARGET_NAMES = {'target', 'objetivo', 'x', 'key', 'clave', 'valor', 'buscado'}
+    MATRIX_NAMES = {'a', 'b', 'matrix', 'matriz', 'm1', 'm2', 'matriz1', 'matriz2'}
+    SCALAR_NAMES = {'n', 'k', 'num', 'numero', 'número', 'm'}
+    STRING_NAMES = {'strings', 'palabras', 'words', 'cadenas', 's', 'texto'}
+    
+    # Rango de tamaños (mínimo, máximo) de cada familia; la escalera es x2,
+    # salvo para el entero n, donde es más fina para seguir a las exponenciales
+    SIZE_RANGES = {
+        InputFamilies.INTEGER: (1, 1 << 20),
+        InputFamilies.INTS: (16, 1 << 20),
+        InputFamilies.FLOATS: (16, 1 << 20),
+        InputFamilies.STRINGS: (16, 1 << 20),
+        InputFamilies.SORTED_SEARCH: (16, 1 << 20),
+        InputFamilies.SPARSE_GRAPH: (16, 1 << 18),
+        InputFamilies.DENSE_GRAPH: (8, 2048),
+        InputFamilies.MATRIX: (2, 512),
+        InputFamilies.MATRIX_NUMPY: (2, 2048),
+        InputFamilies.TREE: (16, 1 << 18),
+    }
+    
+    REPEATS = 3             # Llamadas por tamaño (se toma la mínima)
+    SLOW_CALL = 0.1         # Con llamadas más lentas basta una repetición
+    FAST_CALL = 1e-3        # Llamadas más rápidas se miden en lotes
+    MAX_LOOPS = 1000        # Llamadas como máximo por lote
+    MAX_COPY_ELEMENTS = 1 << 16  # Elementos copiados por lote si la función modifica su entrada
+    MAX_CALL_TIME = 1.0     # No se prueba un tamaño cuya llamada se prevé más larga que esto
+    BUDGET = 30.0           # Tiempo total máximo del barrido (segundos)
+    COST_MAX_TIME = 0.5     # Tiempo máximo previsto de una llamada contada (con CostCounter.OVERHEAD)
+    
+    # Motivos de fin del barrido
+    STOP_DONE = "tamaño máximo alcanzado"
+    STOP_CALL_TIME = "la siguiente llamada superaría el tiempo máximo"
+    STOP_BUDGET = "presupuesto de tiempo agotado"
+    STOP_ERROR = "error en la función"
+    
+    @staticmethod
+    def _functions(tree: ast.Module) -> Dict[str, ast.FunctionDef]:
+        return {node.name: node for node in tree.body if isinstance(node, ast.FunctionDef)}
+    
+    @staticmethod
+    def find_entry(code: str) -> Tuple[str, str]:
+        """
+        Detecta la función de entrada
+        
+        Orden de preferencia: la anotación '# entry: nombre', la primera
+        función definida que se llama desde el nivel superior del código, y
+        la última función que ninguna otra llama.
+        
+        Returns:
+            Tupla (nombre, mensaje_error)
+        """
+        try:
+            tree = ast.parse(code)
+        except SyntaxError as e:
+            return None, f"Error de sintaxis: {e}" # type: ignore
+        
+        functions = SizeSweep._functions(tree)
+        annotation = SizeSweep.ENTRY_ANNOTATION.search(code)
+        if annotation:
+            name = annotation.group(1)
+            if name not in functions:
+                return None, f"La función '{name}' indicada en '# entry:' no está definida" # type: ignore
+            return name, ""
+        
+        if not functions:
+            return None, "No se encontró ninguna función; define una o indícala con '# entry: nombre'" # type: ignore
+        
+        for node in tree.body:
+            if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+                continue
+            for child in ast.walk(node):
+                if isinstance(child, ast.Call) and isinstance(child.func, ast.Name) and child.func.id in functions:
+                    return child.func.id, ""
+        
+        called = set()
+        for name, node in functions.items():
+            for child in ast.walk(node):
+                if isinstance(child, ast.Call) and isinstance(child.func, ast.Name) and child.func.id != name:
+                    called.add(child.func.id)
+        roots = [name for name in functions if name not in called]
+        return (roots or list(functions))[-1], ""
+    
+    @staticmethod
+    def guess_family(code: str, entry: str) -> str:
+        """Deduce la familia de entradas a partir de los parámetros de la función"""
+        node = SizeSweep._functions(ast.parse(code))[entry]
+        params = [arg.arg.lower() for arg in node.args.args]
+        if not params:
+            return InputFamilies.INTS
+        
+        if any(p in SizeSweep.GRAPH_NAMES for p in params):
+            return InputFamilies.SPARSE_GRAPH
+        if any(p in SizeSweep.TREE_NAMES for p in params):
+            return InputFamilies.TREE
+        if len(params) >= 2 and params[0] in SizeSweep.MATRIX_NAMES and params[1] in SizeSweep.MATRIX_NAMES:
+            return InputFamilies.MATRIX
+        if len(params) >= 2 and params[1] in SizeSweep.TARGET_NAMES:
+            return InputFamilies.SORTED_SEARCH
+        if params[0] in SizeSweep.SCALAR_NAMES:
+            return InputFamilies.INTEGER
+        if params[0] in SizeSweep.STRING_NAMES:
+            return InputFamilies.STRINGS
+        return InputFamilies.INTS
+    
+    FINE_RATIO = 1.25
+    
+    @staticmethod
+    def sizes_for(family: str, max_size: int = None) -> List[int]: # type: ignore
+        """Escalera geométrica de tamaños de la familia"""
+        low, high = SizeSweep.SIZE_RANGES[family]
+        ratio = SizeSweep.FINE_RATIO if family == InputFamilies.INTEGER else 2
+        if max_size:
+            high = min(high, max_size)
+        sizes = []
+        size = low
+        while size <= high:
+            if not sizes or int(size) != sizes[-1]:
+                sizes.append(int(size))
+            size = max(size * ratio, int(size) + 1)
+        return sizes
+    
+    @staticmethod
+    def _arity(node: ast.FunctionDef) -> Tuple[int, int]:
+        """Cantidad (mínima, máxima) de argumentos posicionales que acepta la función"""
+        positional = len(node.args.posonlyargs) + len(node.args.args)
+        required = positional - len(node.args.defaults)
+        return required, (math.inf if node.args.vararg else positional) # type: ignore
+    
+    @staticmethod
+    def predict_time(points: List[Dict[str, Any]], size: int) -> float:
+        """
+        Tiempo previsto para un tamaño, extrapolando la ley de potencias de
+        los dos últimos puntos (exponente al menos 1)
+        """
+        if not points:
+            return 0.0
+        last = points[-1]
+        if len(points) < 2:
+            return last['time'] * size / last['size']
+        prev = points[-2]
+        ratio = last['size'] / prev['size']
+        exponent = math.log(max(last['time'], 1e-9) / max(prev['time'], 1e-9)) / math.log(ratio) if ratio > 1 else 1.0
+        return last['time'] * (size / last['size']) ** max(exponent, 1.0)
+    
+    @staticmethod
+    def run(
+        code: str,
+        family: str = AUTO,
+        sizes: List[int] = None, # type: ignore
+        seed: int = DatasetGenerator.SEED,
+        progress_callback: Callable = None, # type: ignore
+        cancel_token: CancellationToken = None, # type: ignore
+        max_call_time: float = MAX_CALL_TIME,
+        budget: float = BUDGET,
+        count_cost: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Ejecuta el barrido de tamaños
+        
+        Cada tamaño se mide REPEATS veces con una copia nueva de la entrada
+        (los algoritmos que ordenan en el lugar no ven datos ya ordenados) y
+        se guarda el tiempo mínimo. El barrido se detiene antes de un tamaño
+        cuya llamada se prevé mayor que max_call_time o cuando se agota el
+        presupuesto.
+        
+        Con count_cost se cuenta además el costo determinista de una llamada
+        y se ajusta la complejidad también sobre las instrucciones. Contar es
+        mucho más lento que ejecutar, así que solo se cuentan los tamaños
+        cuya llamada, multiplicada por CostCounter.OVERHEAD, se prevé menor
+        que COST_MAX_TIME; el conteo entra en el presupuesto del barrido.
+        
+        Args:
+            code: Código del usuario
+            family: Familia de entradas o AUTO para deducirla
+            sizes: Tamaños a medir (por defecto, la escalera de la familia)
+            seed: Semilla de los datos
+            progress_callback: Función (porcentaje, tamaño)
+            cancel_token: Token para pausar o cancelar entre llamadas
+            max_call_time: Tiempo máximo previsto por llamada (segundos)
+            budget: Tiempo total máximo (segundos)
+            count_cost: Contar instrucciones, líneas y llamadas (ver CostCounter)
+        
+        Returns:
+            Diccionario con 'success', 'error', 'entry', 'family', 'points',
+            'sizes', 'times', 'fit' y 'stop_reason'; con count_cost, además
+            'cost_sizes', 'costs' (instrucciones) y 'cost_fit'
+        """
+        entry, error = SizeSweep.find_entry(code)
+        if error:
+            return {'success': False, 'error': error}
+        if family == SizeSweep.AUTO:
+            family = SizeSweep.guess_family(code, entry)
+        sizes = sizes or SizeSweep.sizes_for(family)
+        
+        required, accepted = SizeSweep._arity(SizeSweep._functions(ast.parse(code))[entry])
+        num_args = min(len(InputFamilies.ARGUMENTS[family]), accepted)
+        if num_args < required:
+            return {
+                'success': False,
+                'error': f"'{entry}' requiere {required} argumentos y la familia "
+                         f"'{family}' aporta {len(InputFamilies.ARGUMENTS[family])}"
+            }
+        
+        # Definir las funciones del usuario (el código del nivel superior corre una vez)
+        namespace = {}
+        defined = CodeExecutor.execute_compiled(
+            CodeExecutor.compile_cached(code), None, namespace, CodeExecutor.CAPTURE_DISCARD
+        )
+        if not defined['success']:
+            return {'success': False, 'error': defined['error']}
+        func = namespace[entry]
+        codes = CostCounter.code_objects(CodeExecutor.compile_cached(code))
+        
+        points = []
+        stop_reason = SizeSweep.STOP_DONE
+        error = ""
+        started = time.perf_counter()
+        try:
+            with cancel_token.interruptible() if cancel_token else contextlib.nullcontext(), \
+                    CodeExecutor.capture(CodeExecutor.CAPTURE_DISCARD):
+                for index, size in enumerate(sizes):
+                    if cancel_token and not cancel_token.checkpoint():
+                        raise AnalysisCancelled()
+                    if SizeSweep.predict_time(points, size) > max_call_time:
+                        stop_reason = SizeSweep.STOP_CALL_TIME
+                        break
+                    if time.perf_counter() - started > budget:
+                        stop_reason = SizeSweep.STOP_BUDGET
+                        break
+                    if progress_callback:
+                        progress_callback(index / len(sizes) * 100, size)
+                    
+                    measured, error = SizeSweep._measure(func, family, size, seed, num_args)
+                    if error:
+                        stop_reason = SizeSweep.STOP_ERROR
+                        break
+                    if count_cost and measured['time'] * CostCounter.OVERHEAD <= SizeSweep.COST_MAX_TIME:
+                        _, args = SizeSweep._fresh_args(family, size, seed, num_args)
+                        measured['cost'] = CostCounter.count(lambda: func(*args), codes)
+                    points.append(measured)
+        except AnalysisCancelled:
+            return {'success': False, 'cancelled': True, 'error': "Análisis cancelado por el usuario"}
+        
+        if not points:
+            return {'success': False, 'error': error or "No se pudo medir ningún tamaño", 'entry': entry, 'family': family}
+        
+        point_sizes = [p['size'] for p in points]
+        times = [p['time'] for p in points]
+        result = {
+            'success': True,
+            'error': error,
+            'entry': entry,
+            'family': family,
+            'points': points,
+            'sizes': point_sizes,
+            'times': times,
+            'fit': ComplexityFitter.fit(point_sizes, times),
+            'stop_reason': stop_reason
+        }
+        if count_cost:
+            counted = [p for p in points if 'cost' in p]
+            result['cost_sizes'] = [p['size'] for p in counted]
+            result['costs'] = [p['cost']['instructions'] for p in counted]
+            result['cost_fit'] = ComplexityFitter.fit(result['cost_sizes'], result['costs'])
+        return result
+    
+    @staticmethod
+    def _fresh_args(family: str, size: int, seed: int, num_args: int) -> Tuple[str, Tuple[Any, ...]]:
+        """Copia nueva de la entrada: (descripción, argumentos)"""
+        values = DatasetGenerator.load_family(family, size, seed)
+        return InputFamilies.describe(family, values), InputFamilies.arguments(family, values)[:num_args]
+    
+    @staticmethod
+    def _same(a: Any, b: Any) -> bool:
+        """Igualdad que también compara arreglos de NumPy elemento a elemento"""
+        if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+            return bool(np.array_equal(a, b))
+        if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+            return len(a) == len(b) and all(SizeSweep._same(x, y) for x, y in zip(a, b))
+        return a == b
+    
+    @staticmethod
+    def _call(func: Callable, batch: List[Tuple[Any, ...]]) -> float:
+        """Tiempo promedio por llamada de func sobre cada juego de argumentos"""
+        start = time.perf_counter()
+        for args in batch:
+            func(*args)
+        return (time.perf_counter() - start) / len(batch)
+    
+    @staticmethod
+    def _measure(func: Callable, family: str, size: int, seed: int, num_args: int) -> Tuple[Dict[str, Any], str]:
+        """
+        Mide la función con la entrada de un tamaño
+        
+        Si la primera llamada dura menos que FAST_CALL, las repeticiones
+        siguientes llaman a la función varias veces seguidas y promedian,
+        para que la resolución del reloj no domine los tamaños chicos. Si
+        la función modifica su entrada, cada llamada recibe su propia copia
+        (preparada antes de cronometrar); si no, se reutiliza la misma.
+        
+        Returns:
+            Tupla (punto medido, mensaje_error)
+        """
+        try:
+            description, args = SizeSweep._fresh_args(family, size, seed, num_args)
+            _, pristine = SizeSweep._fresh_args(family, size, seed, num_args)
+        except (ValueError, MemoryError) as e:
+            return None, f"No se pudo generar la entrada de tamaño {size:,}: {e}" # type: ignore
+        
+        try:
+            elapsed = SizeSweep._call(func, [args])
+            mutates = not SizeSweep._same(args, pristine)
+            
+            best = elapsed
+            loops = 1
+            repeats = SizeSweep.REPEATS - 1
+            if elapsed < SizeSweep.FAST_CALL:
+                # Primera llamada muy rápida: no se cuenta y se repite en lotes
+                loops = min(SizeSweep.MAX_LOOPS, math.ceil(SizeSweep.FAST_CALL / max(elapsed, 1e-7)))
+                if mutates:
+                    loops = max(1, min(loops, SizeSweep.MAX_COPY_ELEMENTS // max(size, 1)))
+                best = float('inf')
+                repeats = SizeSweep.REPEATS
+            
+            for _ in range(repeats):
+                if elapsed * loops > SizeSweep.SLOW_CALL:
+                    break
+                if mutates:
+                    batch = [SizeSweep._fresh_args(family, size, seed, num_args)[1] for _ in range(loops)]
+                else:
+                    batch = [pristine] * loops
+                elapsed = SizeSweep._call(func, batch)
+                best = min(best, elapsed)
+                del batch
+        except RecursionError:
+            return None, f"Recursión demasiado profunda con n={size:,}" # type: ignore
+        except Exception as e:
+            return None, f"Error con n={size:,}: {type(e).__name__}: {e}" # type: ignore
+        
+        return {'size': size, 'time': best, 'description': description, 'loops': loops}, ""
@@ -0,0 +1,202 @@
+# streaming_stats.py
+import math
+import random
+import numpy as np
+from typing import Dict, List, Tuple
+
+
+class StreamingStats:
+    """
+    Estadísticas de tiempos en una sola pasada y con memoria constante
+    
+    Acumula media y varianza (Welford), mínimo y máximo, un histograma de
+    cubetas logarítmicas (al estilo HDR) para los percentiles y una muestra
+    por reservorio para graficar. Los tiempos crudos se guardan solo si se
+    pide, en un buffer preasignado. Dos acumuladores se pueden combinar con
+    merge (p. ej. los de procesos distintos).
+    """
+    
+    PRECISION = 0.005  # Error relativo máximo de un percentil (0.5%)
+    MIN_VALUE = 1e-9  # Menor tiempo distinguible (1 ns); lo menor va a la cubeta 0
+    MAX_VALUE = 1e4   # Mayor tiempo representable; lo mayor va a la última cubeta
+    RESERVOIR_SIZE = 1000
+    PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+    CONFIDENCE_Z = 1.96  # Intervalos de confianza del 95%
+    
+    _LOG_BASE = math.log1p(PRECISION)
+    NUM_BUCKETS = int(math.ceil(math.log(MAX_VALUE / MIN_VALUE) / _LOG_BASE)) + 2
+    
+    def __init__(self, raw_capacity: int = 0, reservoir_size: int = RESERVOIR_SIZE, seed: int = 0):
+        """
+        Args:
+            raw_capacity: Tiempos crudos a conservar (0 para ninguno)
+            reservoir_size: Tamaño de la muestra para graficar
+            seed: Semilla del muestreo del reservorio
+        """
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.counts = np.zeros(StreamingStats.NUM_BUCKETS, dtype=np.int64)
+        self.reservoir_size = reservoir_size
+        self.reservoir: List[Tuple[int, float]] = []  # (índice, tiempo)
+        self.last_index = 0
+        self._rng = random.Random(seed)
+        self._raw = np.empty(raw_capacity, dtype=np.float64)
+    
+    @staticmethod
+    def bucket(value: float) -> int:
+        """Cubeta de un tiempo: cada una abarca un factor (1 + PRECISION)"""
+        if value < StreamingStats.MIN_VALUE:
+            return 0
+        index = int(math.log(value / StreamingStats.MIN_VALUE) / StreamingStats._LOG_BASE) + 1
+        return min(index, StreamingStats.NUM_BUCKETS - 1)
+    
+    @staticmethod
+    def bucket_value(index: int) -> float:
+        """Valor representativo de una cubeta (punto medio geométrico)"""
+        if index == 0:
+            return 0.0
+        return StreamingStats.MIN_VALUE * math.exp((index - 0.5) * StreamingStats._LOG_BASE)
+    
+    def add(self, value: float, index: int = None): # type: ignore
+        """
+        Agrega un tiempo
+        
+        Args:
+            value: Tiempo en segundos
+            index: Posición del tiempo para graficar (por defecto, su orden
+                   de llegada; p. ej. la cantidad de ejecuciones hechas)
+        """
+        self.count += 1
+        if index is None:
+            index = self.count
+        self.last_index = max(self.last_index, index)
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        
+        self.counts[StreamingStats.bucket(value)] += 1
+        
+        # Reservorio (algoritmo R): cada tiempo queda con probabilidad k/count
+        if len(self.reservoir) < self.reservoir_size:
+            self.reservoir.append((index, value))
+        else:
+            slot = self._rng.randrange(self.count)
+            if slot < self.reservoir_size:
+                self.reservoir[slot] = (index, value)
+        
+        if self.count <= len(self._raw):
+            self._raw[self.count - 1] = value
+    
+    def merge(self, other: 'StreamingStats') -> 'StreamingStats':
+        """
+        Combina otro acumulador en este (fórmula de Chan para la varianza)
+        
+        Los índices del otro se desplazan como si sus tiempos hubieran
+        llegado después de los de este.
+        """
+        if other.count == 0:
+            return self
+        offset = self.last_index
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self._m2 += other._m2 + delta * delta * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.counts += other.counts
+        
+        # Reservorio: sortear cada lugar de uno u otro según su peso
+        mine = list(self.reservoir)
+        theirs = [(offset + index, value) for index, value in other.reservoir]
+        self._rng.shuffle(mine)
+        self._rng.shuffle(theirs)
+        merged = []
+        weight_mine, weight_theirs = self.count, other.count
+        while len(merged) < self.reservoir_size and (mine or theirs):
+            if theirs and (not mine or self._rng.random() * (weight_mine + weight_theirs) >= weight_mine):
+                merged.append(theirs.pop())
+            else:
+                merged.append(mine.pop())
+        self.reservoir = merged
+        
+        if len(self._raw) or len(other._raw):
+            self._raw = np.concatenate([self.raw(), other.raw()])
+        self.count = total
+        self.last_index = offset + other.last_index
+        return self
+    
+    @property
+    def variance(self) -> float:
+        """Varianza poblacional (como np.var)"""
+        return self._m2 / self.count if self.count else 0.0
+    
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+    
+    def percentile(self, q: float) -> float:
+        """Percentil q (0-100) a partir del histograma, con error relativo <= PRECISION"""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, int(math.ceil(q / 100 * self.count)))
+        index = int(np.searchsorted(np.cumsum(self.counts), rank))
+        return min(max(StreamingStats.bucket_value(index), self.min), self.max)
+    
+    def median_ci(self, z: float = CONFIDENCE_Z) -> Tuple[float, float]:
+        """
+        Intervalo de confianza de la mediana por estadísticos de orden
+        
+        No supone ninguna distribución: los extremos son los tiempos en las
+        posiciones n/2 ± z·√n/2 (los tiempos medidos suelen tener cola larga).
+        """
+        if self.count == 0:
+            return 0.0, 0.0
+        spread = 50 * z / math.sqrt(self.count)
+        return self.percentile(max(0.0, 50 - spread)), self.percentile(min(100.0, 50 + spread))
+    
+    def median_precision(self, z: float = CONFIDENCE_Z) -> float:
+        """
+        Semiancho del intervalo de la mediana relativo a ella (0.02 es ±2%)
+        
+        Nunca es menor que PRECISION / 2: si ambos extremos caen en la misma
+        cubeta, el histograma no puede distinguirlos con más resolución.
+        """
+        if self.count == 0:
+            return math.inf
+        low, high = self.median_ci(z)
+        floor = StreamingStats.PRECISION / 2
+        if high <= low:
+            return floor
+        median = self.percentile(50)
+        return max((high - low) / 2 / median, floor) if median > 0 else math.inf
+    
+    def percentiles(self) -> Dict[str, float]:
+        """Percentiles de PERCENTILES con claves 'p50', 'p90', 'p99', 'p99.9'"""
+        return {f"p{q:g}": self.percentile(q) for q in StreamingStats.PERCENTILES}
+    
+    def sample(self) -> Tuple[List[int], List[float]]:
+        """Muestra del reservorio ordenada por índice: (índices, tiempos)"""
+        ordered = sorted(self.reservoir)
+        return [index for index, _ in ordered], [value for _, value in ordered]
+    
+    def raw(self) -> np.ndarray:
+        """Tiempos crudos guardados (vacío si no se pidieron)"""
+        return self._raw[:min(self.count, len(self._raw))]
+    
+    def summary(self) -> Dict[str, float]:
+        """Resumen con las claves que usa el resto de la aplicación"""
+        return {
+            'count': self.count,
+            'avg_time': self.mean,
+            'std_time': self.std,
+            'min_time': self.min if self.count else 0.0,
+            'max_time': self.max if self.count else 0.0,
+            'percentiles': self.percentiles()
+        }
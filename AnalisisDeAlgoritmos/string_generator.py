@@ -0,0 +1,166 @@
+# string_generator.py
+import string
+import numpy as np
+from collections.abc import Sequence
+from typing import List, Iterable
+
+
+class StringBatch(Sequence):
+    """
+    Lote de strings guardado como un único buffer de bytes y sus desplazamientos
+    
+    El string i ocupa buffer[offsets[i]:offsets[i + 1]]. Los strings se
+    decodifican a str recién cuando se piden, uno por uno o todos juntos con
+    tolist().
+    """
+    
+    def __init__(self, buffer: np.ndarray, offsets: np.ndarray):
+        """
+        Args:
+            buffer: Bytes UTF-8 de todos los strings concatenados (uint8)
+            offsets: Arreglo int64 de len(lote) + 1 posiciones crecientes
+        """
+        self.buffer = buffer
+        self.offsets = offsets
+        self._ascii = None
+    
+    @staticmethod
+    def from_strings(strings: Iterable[str]) -> 'StringBatch':
+        """Construye un lote a partir de strings de Python"""
+        encoded = [str(s).encode('utf-8') for s in strings]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(b) for b in encoded], out=offsets[1:])
+        return StringBatch(np.frombuffer(b''.join(encoded), dtype=np.uint8), offsets)
+    
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+    
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            start, stop, step = i.indices(len(self))
+            if step != 1:
+                return [self[j] for j in range(start, stop, step)]
+            return StringBatch(self.buffer, self.offsets[start:max(start, stop) + 1])
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("Índice fuera de rango")
+        return self.buffer[self.offsets[i]:self.offsets[i + 1]].tobytes().decode('utf-8')
+    
+    @property
+    def lengths(self) -> np.ndarray:
+        """Longitud en bytes de cada string"""
+        return np.diff(self.offsets)
+    
+    @property
+    def is_ascii(self) -> bool:
+        if self._ascii is None:
+            used = self.buffer[self.offsets[0]:self.offsets[-1]]
+            self._ascii = bool(used.size == 0 or used.max() < 128)
+        return self._ascii
+    
+    def tolist(self) -> List[str]:
+        """
+        Decodifica todos los strings
+        
+        Si el texto es ASCII (un byte por carácter) se decodifica el buffer
+        entero de una vez y se corta por desplazamientos; si no, se decodifica
+        cada string por separado.
+        """
+        offsets = (self.offsets - self.offsets[0]).tolist()
+        raw = self.buffer[self.offsets[0]:self.offsets[-1]].tobytes()
+        if self.is_ascii:
+            text = raw.decode('ascii')
+            return [text[a:b] for a, b in zip(offsets, offsets[1:])]
+        return [raw[a:b].decode('utf-8') for a, b in zip(offsets, offsets[1:])]
+
+
+class StringGenerator:
+    """Genera lotes de strings aleatorios en bloque con NumPy"""
+    
+    # Distribuciones de la longitud de cada string
+    FIXED = "fija"
+    UNIFORM = "uniforme"
+    GEOMETRIC = "geométrica"
+    NORMAL = "normal"
+    LENGTH_DISTRIBUTIONS = [FIXED, UNIFORM, GEOMETRIC, NORMAL]
+    
+    DEFAULT_ALPHABET = string.ascii_lowercase
+    
+    @staticmethod
+    def lengths(
+        count: int,
+        rng: np.random.Generator,
+        distribution: str = UNIFORM,
+        min_length: int = 1,
+        max_length: int = 10
+    ) -> np.ndarray:
+        """
+        Longitudes de count strings, recortadas a [min_length, max_length]
+        
+        La fija usa max_length; la geométrica y la normal se centran en el
+        punto medio del intervalo.
+        """
+        if min_length < 0 or max_length < min_length:
+            raise ValueError("Se requiere 0 <= min_length <= max_length")
+        
+        if distribution == StringGenerator.FIXED:
+            return np.full(count, max_length, dtype=np.int64)
+        if distribution == StringGenerator.UNIFORM:
+            return rng.integers(min_length, max_length + 1, count, dtype=np.int64)
+        
+        mean = (min_length + max_length) / 2
+        if distribution == StringGenerator.GEOMETRIC:
+            extra = rng.geometric(1 / max(mean - min_length + 1, 1), count) - 1
+            lengths = min_length + extra
+        elif distribution == StringGenerator.NORMAL:
+            sigma = max((max_length - min_length) / 6, 0.5)
+            lengths = np.rint(rng.normal(mean, sigma, count))
+        else:
+            raise ValueError(f"Distribución de longitud no soportada: {distribution}")
+        return np.clip(lengths, min_length, max_length).astype(np.int64)
+    
+    @staticmethod
+    def generate(
+        count: int,
+        seed: int = None, # type: ignore
+        index: int = 0,
+        distribution: str = UNIFORM,
+        min_length: int = 1,
+        max_length: int = 10,
+        alphabet: str = DEFAULT_ALPHABET
+    ) -> StringBatch:
+        """
+        Genera count strings aleatorios reproducibles
+        
+        Todas las letras se sortean de una sola vez como índices del alfabeto
+        sobre un buffer de bytes; con longitud fija el buffer es directamente
+        una matriz count × max_length.
+        
+        Args:
+            count: Cantidad de strings
+            seed: Semilla (None para una aleatoria)
+            index: Índice del conjunto; con la misma semilla, cada índice da
+                   un lote distinto pero reproducible
+            distribution: Una de LENGTH_DISTRIBUTIONS
+            min_length: Longitud mínima
+            max_length: Longitud máxima
+            alphabet: Caracteres ASCII permitidos
+        
+        Returns:
+            StringBatch sin decodificar
+        """
+        if not alphabet or not alphabet.isascii():
+            raise ValueError("El alfabeto debe contener al menos un carácter ASCII")
+        symbols = np.frombuffer(alphabet.encode('ascii'), dtype=np.uint8)
+        rng = np.random.default_rng(None if seed is None else [seed, index])
+        
+        lengths = StringGenerator.lengths(count, rng, distribution, min_length, max_length)
+        offsets = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        
+        # uint8 alcanza para cualquier alfabeto ASCII (a lo sumo 128 símbolos)
+        choices = rng.integers(0, len(symbols), int(offsets[-1]), dtype=np.uint8)
+        batch = StringBatch(symbols[choices], offsets)
+        batch._ascii = True
+        return batch
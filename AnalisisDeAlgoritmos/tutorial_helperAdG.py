@@ -111,6 +111,9 @@ class TutorialWindow:
             {
                 "title": "🔢 Configuración de Ejecuciones",
                 "content": "Determina cuántas veces se ejecutará tu código:\n\n"
+                          "🎯 Modo Automático (predeterminado):\n"
+                          "Ejecuta hasta que la mediana tenga una precisión de ±5%, ±2% "
+                          "y ±1%, o hasta agotar 10 segundos por configuración.\n\n"
                           "📊 Modo Estándar:\n"
                           "Ejecuta 700, 1500 y 3000 veces. Ideal para la mayoría de casos.\n\n"
                           "✏️ Modo Personalizado:\n"
@@ -215,6 +218,14 @@ class HelpDialog:
         "ejecuciones": {
             "title": "Número de Ejecuciones",
             "content": "Configura cuántas veces se ejecutará tu código.\n\n"
+                      "🎯 Modo Automático:\n"
+                      "No hace falta adivinar cuántas ejecuciones alcanzan. Cada "
+                      "configuración es una precisión objetivo (±5%, ±2% y ±1%): se "
+                      "ejecuta hasta que el intervalo de confianza del 95% de la "
+                      "mediana sea así de angosto, hasta 10 segundos o hasta "
+                      "1,000,000 de ejecuciones. Un código estable termina enseguida "
+                      "y uno ruidoso recibe más ejecuciones. El resultado indica "
+                      "cuántas hicieron falta y por qué se detuvo.\n\n"
                       "📊 Modo Estándar:\n"
                       "• Configuración 1: 700 ejecuciones\n"
                       "• Configuración 2: 1,500 ejecuciones\n"
@@ -228,6 +239,33 @@ class HelpDialog:
                       "📈 Puntos Muestreados:\n"
                       "Se toman 20 puntos distribuidos uniformemente de cada "
                       "configuración para crear gráficos claros y legibles.\n\n"
+                      "⚡ Medición por lotes:\n"
+                      "Como timeit, ejecuta tu código muchas veces dentro de un solo "
+                      "bucle cronometrado y descuenta el costo del bucle vacío. Así el "
+                      "tiempo de operaciones muy rápidas no queda tapado por el costo "
+                      "de medir. Cada punto es el promedio de un lote.\n\n"
+                      "🛡️ Proceso aislado:\n"
+                      "El código corre en un proceso aparte con memoria acotada. Si "
+                      "deja de responder (p. ej. un bucle infinito) el proceso se "
+                      "reinicia y el análisis informa el error sin colgar la ventana.\n\n"
+                      "🚀 Aislamiento o rendimiento:\n"
+                      "En aislamiento las configuraciones corren una tras otra. En "
+                      "rendimiento corren a la vez en varios procesos y las grandes se "
+                      "reparten en fragmentos; termina antes, pero las mediciones "
+                      "compiten por la CPU y los tiempos tienen más ruido.\n\n"
+                      "🧮 Contar instrucciones:\n"
+                      "Además del tiempo, cuenta las instrucciones de bytecode, las "
+                      "líneas y las llamadas que ejecuta tu código en una corrida. Los "
+                      "conteos no dependen de la carga de la máquina: se repiten igual "
+                      "cada vez, y en el barrido de n permiten estimar la complejidad "
+                      "con unos pocos tamaños chicos. Contar es más lento que ejecutar, "
+                      "así que en el barrido solo se cuentan las llamadas rápidas.\n\n"
+                      "📐 Barrido de n:\n"
+                      "En lugar de repetir el mismo código, llama a tu función con "
+                      "entradas cada vez más grandes (listas, grafos, matrices, "
+                      "árboles o el propio entero n) y ajusta la curva tiempo vs. n "
+                      "para estimar la complejidad empírica. La función y la familia "
+                      "se detectan solas; indica otra función con '# entry: nombre'.\n\n"
                       "⏱️ Recomendaciones:\n"
                       "• Código simple (O(1), O(n)): Usar configuraciones altas\n"
                       "• Código complejo (O(n²), O(n³)): Usar configuraciones bajas\n"
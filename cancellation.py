@@ -0,0 +1,92 @@
+# cancellation.py - Cancelación y pausa cooperativa de análisis en curso
+import ctypes
+import threading
+from contextlib import contextmanager
+
+
+class AnalysisCancelled(BaseException):
+    """
+    Señala que el usuario canceló el análisis
+
+    Hereda de BaseException para que los bloques `except Exception` de la
+    medición (y del código del usuario) no la confundan con un error.
+    """
+
+
+class CancellationToken:
+    """Permite cancelar, pausar y reanudar un análisis que corre en otro hilo"""
+
+    def __init__(self):
+        self._cancelled = threading.Event()
+        self._running = threading.Event()
+        self._running.set()
+        self._lock = threading.Lock()
+        self._interruptible_thread = None
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def is_paused(self) -> bool:
+        return not self._running.is_set()
+
+    def pause(self):
+        """Detiene el análisis en el siguiente punto de control"""
+        self._running.clear()
+
+    def resume(self):
+        """Continúa un análisis en pausa"""
+        self._running.set()
+
+    def cancel(self):
+        """
+        Cancela el análisis
+
+        Si el hilo está dentro de un bloque `interruptible`, se le inyecta
+        AnalysisCancelled para que abandone de inmediato la medición en curso
+        en lugar de terminarla (una celda puede tardar minutos).
+        """
+        with self._lock:
+            self._cancelled.set()
+            self._running.set()  # Despertar a un hilo en pausa para que termine
+            if self._interruptible_thread is not None:
+                ctypes.pythonapi.PyThreadState_SetAsyncExc(
+                    ctypes.c_ulong(self._interruptible_thread),
+                    ctypes.py_object(AnalysisCancelled)
+                )
+                self._interruptible_thread = None
+
+    def checkpoint(self) -> bool:
+        """
+        Punto de control entre celdas o iteraciones
+
+        Bloquea sin consumir CPU mientras el análisis está en pausa.
+
+        Returns:
+            False si el análisis fue cancelado y debe detenerse
+        """
+        self._running.wait()
+        return not self._cancelled.is_set()
+
+    @contextmanager
+    def interruptible(self):
+        """
+        Marca un bloque que una cancelación puede interrumpir a la mitad
+
+        AnalysisCancelled solo escapa de este bloque: una interrupción que no
+        alcanzó a entregarse se descarta al salir y se relanza aquí mismo.
+        """
+        thread_id = threading.get_ident()
+        with self._lock:
+            if self._cancelled.is_set():
+                raise AnalysisCancelled()
+            self._interruptible_thread = thread_id
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._interruptible_thread = None
+                ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(thread_id), None)
+        if self._cancelled.is_set():
+            raise AnalysisCancelled()
@@ -0,0 +1,239 @@
+# complexity_fitter.py - Ajuste empírico de complejidad por mínimos cuadrados
+import math
+import numpy as np
+from typing import List, Dict, Any
+
+
+class ComplexityFitter:
+    """
+    Ajusta modelos de complejidad a mediciones (tamaño, tiempo)
+
+    Cada modelo de clase se ajusta como t = c0 + c·f(n); además se ajusta una
+    ley de potencias libre t = a·n^k en escala logarítmica. Los residuos se
+    miden en forma relativa, porque los tiempos abarcan varios órdenes de
+    magnitud y un error absoluto solo vería los tamaños grandes.
+    """
+
+    POWER_LAW = 'O(n^k)'
+
+    # Notación -> función base f(n)
+    MODELS = {
+        'O(1)': None,
+        'O(log n)': lambda n: np.log2(n),
+        'O(n)': lambda n: n,
+        'O(n log n)': lambda n: n * np.log2(n),
+        'O(n²)': lambda n: n ** 2,
+        'O(n³)': lambda n: n ** 3,
+        'O(2^n)': lambda n: np.exp2(n),
+    }
+
+    CRITERIA = ['BIC', 'AIC']
+    MIN_POINTS = 3
+    MIN_POINTS_CV = 5     # Con menos puntos la validación cruzada no es informativa
+    CV_TOLERANCE = 2.0    # Se descartan modelos cuyo error de validación supere este múltiplo del mejor
+    POWER_LAW_MARGIN = 4.0  # La ley libre solo gana si mejora el criterio al menos en esto
+    EXPONENT_TOLERANCE = 0.1  # Una ley libre así de cerca de una clase polinomial se informa como esa clase
+
+    # Exponente de las clases polinomiales puras
+    CLASS_EXPONENTS = {
+        'O(1)': 0,
+        'O(n)': 1,
+        'O(n²)': 2,
+        'O(n³)': 3,
+    }
+
+    @staticmethod
+    def _design(notation: str, n: np.ndarray) -> np.ndarray:
+        """Matriz de diseño [1, f(n)] del modelo (solo [1] para O(1))"""
+        basis = ComplexityFitter.MODELS[notation]
+        if basis is None:
+            return np.ones((len(n), 1))
+        with np.errstate(over='ignore'):
+            column = basis(n)
+        return np.column_stack([np.ones(len(n)), column])
+
+    @staticmethod
+    def _solve(notation: str, n: np.ndarray, t: np.ndarray):
+        """
+        Mínimos cuadrados ponderados por 1/t (error relativo)
+
+        Returns:
+            Coeficientes o None si el modelo no aplica (desborde o pendiente no positiva)
+        """
+        if notation == ComplexityFitter.POWER_LAW:
+            slope, intercept = np.polyfit(np.log(n), np.log(t), 1)
+            return np.array([math.exp(intercept), slope])
+
+        X = ComplexityFitter._design(notation, n)
+        if not np.all(np.isfinite(X)):
+            return None
+        w = 1.0 / t
+        coeffs, *_ = np.linalg.lstsq(X * w[:, None], t * w, rcond=None)
+        if len(coeffs) > 1 and coeffs[1] <= 0:
+            return None
+        return coeffs
+
+    @staticmethod
+    def _predict(notation: str, coeffs: np.ndarray, n: np.ndarray) -> np.ndarray:
+        if notation == ComplexityFitter.POWER_LAW:
+            return coeffs[0] * n ** coeffs[1]
+        return ComplexityFitter._design(notation, n) @ coeffs
+
+    @staticmethod
+    def _num_params(notation: str) -> int:
+        if notation == ComplexityFitter.POWER_LAW:
+            return 2
+        return 1 if ComplexityFitter.MODELS[notation] is None else 2
+
+    @staticmethod
+    def _cv_error(notation: str, n: np.ndarray, t: np.ndarray) -> float:
+        """Error relativo cuadrático medio de validación cruzada dejando uno fuera"""
+        errors = []
+        for i in range(len(n)):
+            mask = np.arange(len(n)) != i
+            coeffs = ComplexityFitter._solve(notation, n[mask], t[mask])
+            if coeffs is None:
+                return float('inf')
+            pred = ComplexityFitter._predict(notation, coeffs, n[i:i + 1])[0]
+            errors.append(((t[i] - pred) / t[i]) ** 2)
+        return float(np.mean(errors))
+
+    @staticmethod
+    def fit(sizes: List[float], times: List[float], criterion: str = 'BIC') -> Dict[str, Any]:
+        """
+        Ajusta todos los modelos candidatos y elige el mejor
+
+        El mejor modelo es el de menor AIC/BIC entre los que superan la
+        validación cruzada. La ley de potencias libre solo reemplaza a una
+        clase conocida si la mejora con claridad, y si su exponente queda a
+        EXPONENT_TOLERANCE de una clase polinomial se informa esa clase (los
+        términos de orden menor, como el lineal junto a n², favorecen a la
+        ley libre aun con datos limpios). La confianza es el peso relativo
+        del modelo elegido frente a sus competidores (pesos de Akaike sobre
+        el criterio).
+
+        Args:
+            sizes: Tamaños de entrada
+            times: Tiempos medidos (segundos)
+            criterion: 'BIC' o 'AIC'
+
+        Returns:
+            Diccionario con 'success', 'error', 'model', 'coefficients',
+            'constant', 'exponent', 'r_squared', 'confidence' y 'candidates'
+        """
+        if criterion not in ComplexityFitter.CRITERIA:
+            return {'success': False, 'error': f"Criterio no soportado: {criterion}"}
+
+        points = [(s, t) for s, t in zip(sizes, times) if s > 0 and t > 0]
+        if len(points) < ComplexityFitter.MIN_POINTS:
+            return {'success': False, 'error': "Datos insuficientes"}
+
+        points.sort()
+        n = np.array([p[0] for p in points], dtype=float)
+        t = np.array([p[1] for p in points], dtype=float)
+        m = len(n)
+
+        candidates = []
+        for notation in list(ComplexityFitter.MODELS) + [ComplexityFitter.POWER_LAW]:
+            if notation == ComplexityFitter.POWER_LAW and len(set(n)) < 2:
+                continue
+            coeffs = ComplexityFitter._solve(notation, n, t)
+            if coeffs is None:
+                continue
+            pred = ComplexityFitter._predict(notation, coeffs, n)
+            rss = float(np.sum(((t - pred) / t) ** 2))
+            log_likelihood_term = m * math.log(max(rss / m, 1e-300))
+            k = ComplexityFitter._num_params(notation)
+            ss_tot = float(np.sum((t - t.mean()) ** 2))
+            r_squared = 1 - float(np.sum((t - pred) ** 2)) / ss_tot if ss_tot > 0 else 1.0
+            cv_error = (
+                ComplexityFitter._cv_error(notation, n, t)
+                if m >= ComplexityFitter.MIN_POINTS_CV else None
+            )
+            candidates.append({
+                'model': notation,
+                'coefficients': [float(c) for c in coeffs],
+                'AIC': log_likelihood_term + 2 * k,
+                'BIC': log_likelihood_term + k * math.log(m),
+                'cv_error': cv_error,
+                'r_squared': r_squared
+            })
+
+        if not candidates:
+            return {'success': False, 'error': "Ningún modelo se ajustó a los datos"}
+
+        # Descartar modelos que predicen mal puntos que no vieron (sobreajuste)
+        eligible = candidates
+        cv_errors = [c['cv_error'] for c in candidates if c['cv_error'] is not None]
+        if cv_errors:
+            best_cv = min(cv_errors)
+            eligible = [
+                c for c in candidates
+                if c['cv_error'] is not None and c['cv_error'] <= best_cv * ComplexityFitter.CV_TOLERANCE
+            ] or candidates
+
+        classes = [c for c in eligible if c['model'] != ComplexityFitter.POWER_LAW]
+        power_law = next((c for c in candidates if c['model'] == ComplexityFitter.POWER_LAW), None)
+        exponent = power_law['coefficients'][1] if power_law else None
+
+        best = min(classes, key=lambda c: c[criterion]) if classes else power_law
+        competitors = classes
+        if (power_law in eligible and best is not power_law
+                and power_law[criterion] < best[criterion] - ComplexityFitter.POWER_LAW_MARGIN): # type: ignore
+            best = power_law
+            competitors = eligible
+        if best is power_law and exponent is not None:
+            # Un exponente casi entero es la clase pura más términos de orden menor
+            named = next((
+                c for c in candidates
+                if c['model'] in ComplexityFitter.CLASS_EXPONENTS
+                and abs(exponent - ComplexityFitter.CLASS_EXPONENTS[c['model']]) <= ComplexityFitter.EXPONENT_TOLERANCE
+            ), None)
+            if named is not None:
+                best = named
+                competitors = [c for c in candidates if c is named or c in classes]
+        weights = [math.exp(-(c[criterion] - best[criterion]) / 2) for c in competitors or [best]] # type: ignore
+        confidence = 1.0 / sum(weights)
+
+        if best['model'] == ComplexityFitter.POWER_LAW:
+            notation = f"O(n^{exponent:.2f})"
+            constant = best['coefficients'][0]
+        else:
+            notation = best['model']
+            constant = best['coefficients'][-1]
+
+        return {
+            'success': True,
+            'error': "",
+            'model': best['model'],
+            'notation': notation,
+            'coefficients': best['coefficients'],
+            'constant': constant,
+            'exponent': exponent,
+            'r_squared': best['r_squared'],
+            'confidence': confidence,
+            'criterion': criterion,
+            'candidates': candidates
+        }
+
+    @staticmethod
+    def evaluate(fit: Dict[str, Any], sizes) -> np.ndarray:
+        """Evalúa el modelo ajustado en los tamaños dados (para graficar la curva)"""
+        n = np.asarray(sizes, dtype=float)
+        return ComplexityFitter._predict(fit['model'], np.asarray(fit['coefficients']), n)
+
+    @staticmethod
+    def curve(fit: Dict[str, Any], sizes: List[float], points: int = 100):
+        """Curva suave del modelo entre el menor y el mayor tamaño medido"""
+        n = np.linspace(min(sizes), max(sizes), points)
+        return n, ComplexityFitter.evaluate(fit, n)
+
+    @staticmethod
+    def describe(fit: Dict[str, Any]) -> str:
+        """Resumen de una línea del ajuste"""
+        if not fit.get('success'):
+            return fit.get('error', "Sin ajuste")
+        text = f"{fit['notation']} (R²={fit['r_squared']:.3f}, confianza {fit['confidence'] * 100:.0f}%)"
+        if fit['exponent'] is not None:
+            text += f", n^{fit['exponent']:.2f}"
+        return text
@@ -1,11 +1,26 @@
 # main.py - Punto de entrada principal de la aplicación
+import argparse
+import multiprocessing
 import tkinter as tk
 from main_menu import MainMenuGUI
 from theme import ModernDarkTheme
 
 
+def parse_args():
+    """Interpreta los argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Sistema de Análisis de Algoritmos")
+    parser.add_argument(
+        "--reanudar", "--resume",
+        dest="resume",
+        metavar="DIARIO",
+        help="Reanuda un análisis de ordenamiento guardado en el diario indicado (.jsonl)"
+    )
+    return parser.parse_args()
+
+
 def main():
     """Función principal de la aplicación"""
+    args = parse_args()
     root = tk.Tk()
     
     # Aplicar tema oscuro moderno
@@ -27,8 +42,14 @@ def main():
     # Iniciar menú principal
     app = MainMenuGUI(root)
     
+    # Reanudar directamente un análisis de ordenamiento si se solicitó
+    if args.resume:
+        root.after(0, lambda: app.launch_sorting_analyzer(resume_path=args.resume))
+    
     root.mainloop()
 
 
 if __name__ == "__main__":
+    # Necesario para los procesos de medición aislada en el ejecutable empaquetado
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -202,7 +202,7 @@ class MainMenuGUI:
                 f"No se pudo iniciar el analizador de complejidad:\n{str(e)}"
             )
 
-    def launch_sorting_analyzer(self):
+    def launch_sorting_analyzer(self, resume_path=None):
         """Lanza el analizador de algoritmos de ordenamiento"""
         try:
             # Agregar directorio al path
@@ -226,7 +226,7 @@ class MainMenuGUI:
             self.root.withdraw()
             
             # Lanzar aplicación y pasar callback para volver
-            app = SortingAnalyzerGUI(sorting_window, on_close)
+            app = SortingAnalyzerGUI(sorting_window, on_close, resume_path)
             
         except Exception as e:
             messagebox.showerror(
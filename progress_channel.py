@@ -0,0 +1,77 @@
+# progress_channel.py - Progreso de un hilo de análisis hacia la interfaz de Tk
+import threading
+
+
+class ProgressChannel:
+    """
+    Canal de progreso que solo conserva el último valor publicado
+
+    El hilo de análisis publica sin tocar Tk: solo reemplaza el valor
+    pendiente bajo un lock. Un temporizador de Tk lo retira unas 15 veces
+    por segundo y llama al callback de la interfaz con el más reciente; los
+    valores intermedios se descartan. Así el costo del progreso en la
+    interfaz no depende de la cantidad de iteraciones.
+
+    Con `key`, el canal guarda un valor por clave (p. ej. uno por cada
+    configuración que corre en paralelo) y en cada entrega llama al
+    callback una vez por clave con novedades.
+
+    El canal se puede pasar directamente como progress_callback:
+
+        channel = ProgressChannel(root, self.update_progress).start()
+        Analyzer.run(..., progress_callback=channel)
+        root.after(0, channel.stop)  # Al terminar, desde el hilo de análisis
+    """
+
+    INTERVAL_MS = 66  # ~15 Hz
+
+    def __init__(self, root, callback, interval_ms: int = INTERVAL_MS, key=None):
+        """
+        Args:
+            root: Widget de Tk cuyo bucle de eventos atiende el temporizador
+            callback: Función de la interfaz; recibe los argumentos publicados
+            interval_ms: Milisegundos entre entregas
+            key: Función (argumentos) -> clave del valor; None para un único valor
+        """
+        self.root = root
+        self.callback = callback
+        self.interval_ms = interval_ms
+        self.key = key
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._after_id = None
+
+    def publish(self, *args):
+        """Reemplaza el valor pendiente (se puede llamar desde cualquier hilo)"""
+        slot = self.key(args) if self.key is not None else None
+        with self._lock:
+            self._pending[slot] = args
+
+    __call__ = publish
+
+    def _take(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        return pending
+
+    def _deliver(self):
+        for args in self._take().values():
+            self.callback(*args)
+
+    def _tick(self):
+        self._after_id = None
+        self._deliver()
+        self._after_id = self.root.after(self.interval_ms, self._tick)
+
+    def start(self) -> 'ProgressChannel':
+        """Inicia el temporizador (desde el hilo de Tk)"""
+        if self._after_id is None:
+            self._after_id = self.root.after(self.interval_ms, self._tick)
+        return self
+
+    def stop(self):
+        """Detiene el temporizador y entrega el último valor pendiente (desde el hilo de Tk)"""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self._deliver()